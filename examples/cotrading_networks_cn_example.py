@@ -62,26 +62,30 @@ def load_universe_data(
     data: dict[str, pl.DataFrame] = {}
     day_start_us, day_end_us = get_day_bounds(trading_date)
 
-    for symbol in universe:
-        ticks = query.load_events(
-            silver_root=silver_root,
-            table="cn_tick_events",
-            exchange=exchange,
-            symbol=symbol,
-            start=day_start_us,
-            end=day_end_us,
-            columns=[
-                "ts_event_us",
-                "ts_local_us",
-                "price",
-                "qty",
-                "aggressor_side",
-                "bid_order_ref",
-                "ask_order_ref",
-            ],
-        )
+    # One scan for the whole universe instead of one Delta scan per symbol.
+    universe_ticks = query.load_events(
+        silver_root=silver_root,
+        table="cn_tick_events",
+        exchange=exchange,
+        symbol=universe,
+        start=day_start_us,
+        end=day_end_us,
+        columns=[
+            "symbol",
+            "ts_event_us",
+            "ts_local_us",
+            "price",
+            "qty",
+            "aggressor_side",
+            "bid_order_ref",
+            "ask_order_ref",
+        ],
+    )
+    ticks_by_symbol = universe_ticks.partition_by("symbol", as_dict=True, include_key=False)
 
-        if ticks.is_empty():
+    for symbol in universe:
+        ticks = ticks_by_symbol.get((symbol,))
+        if ticks is None or ticks.is_empty():
             print(f"  No data for {symbol}")
             continue
 
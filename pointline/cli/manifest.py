@@ -57,18 +57,56 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     diff_p.add_argument("--limit", type=int, default=50, help="Max results (default: 50)")
     diff_p.set_defaults(handler=_handle_diff)
 
+    # manifest migrate-sqlite
+    migrate_p = sub.add_parser(
+        "migrate-sqlite",
+        help="Copy the Delta manifest into a SQLite manifest store",
+    )
+    migrate_p.add_argument("--silver-root", default=None, help="Silver data root directory")
+    migrate_p.add_argument(
+        "--sqlite-path",
+        default=None,
+        help="SQLite database path (default: <silver-root>/ingest_manifest.sqlite)",
+    )
+    migrate_p.set_defaults(handler=_handle_migrate_sqlite)
 
-def _load_manifest(args):
+    # manifest sync-delta
+    sync_p = sub.add_parser(
+        "sync-delta",
+        help="Export a SQLite manifest store to the Delta ingest_manifest table",
+    )
+    sync_p.add_argument("--silver-root", default=None, help="Silver data root directory")
+    sync_p.add_argument(
+        "--sqlite-path",
+        default=None,
+        help="SQLite database path (default: <silver-root>/ingest_manifest.sqlite)",
+    )
+    sync_p.set_defaults(handler=_handle_sync_delta)
+
+
+def _silver_root(args):
     from pointline.cli._config import resolve_root, resolve_silver_root
-    from pointline.schemas.control import INGEST_MANIFEST
-    from pointline.storage.delta._utils import read_delta_or_empty
 
     root = resolve_root(getattr(args, "root", None))
-    silver_root = resolve_silver_root(
+    return resolve_silver_root(
         getattr(args, "silver_root", None),
         root=root,
     )
-    table_path = silver_root / "ingest_manifest"
+
+
+def _sqlite_path(args, silver_root):
+    from pathlib import Path
+
+    if args.sqlite_path is not None:
+        return Path(args.sqlite_path)
+    return silver_root / "ingest_manifest.sqlite"
+
+
+def _load_manifest(args):
+    from pointline.schemas.control import INGEST_MANIFEST
+    from pointline.storage.delta._utils import read_delta_or_empty
+
+    table_path = _silver_root(args) / "ingest_manifest"
     return read_delta_or_empty(table_path, spec=INGEST_MANIFEST)
 
 
@@ -231,3 +269,29 @@ def _handle_diff(args: argparse.Namespace) -> int:
         f"\n{len(missing)} files not in manifest (of {len(disk_rel)} on disk), showing {len(display)}"
     )
     return 0
+
+
+def _handle_migrate_sqlite(args: argparse.Namespace) -> int:
+    from pointline.storage.sqlite import SqliteManifestStore
+
+    silver_root = _silver_root(args)
+    sqlite_path = _sqlite_path(args, silver_root)
+    store = SqliteManifestStore(sqlite_path)
+    rows = store.import_from_delta(silver_root / "ingest_manifest")
+    print(f"Migrated {rows} manifest rows into {sqlite_path}")
+    return 0
+
+
+def _handle_sync_delta(args: argparse.Namespace) -> int:
+    from pointline.storage.sqlite import SqliteManifestStore
+
+    silver_root = _silver_root(args)
+    sqlite_path = _sqlite_path(args, silver_root)
+    if not sqlite_path.exists():
+        print(f"error: SQLite manifest does not exist: {sqlite_path}")
+        return 1
+
+    table_path = silver_root / "ingest_manifest"
+    rows = SqliteManifestStore(sqlite_path).export_to_delta(table_path)
+    print(f"Exported {rows} manifest rows to {table_path}")
+    return 0
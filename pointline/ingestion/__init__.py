@@ -4,11 +4,12 @@ from pointline.ingestion.lineage import assign_lineage
 from pointline.ingestion.manifest import build_manifest_identity, update_manifest_status
 from pointline.ingestion.models import IngestionResult
 from pointline.ingestion.pipeline import ingest_file
-from pointline.ingestion.pit import check_pit_coverage
+from pointline.ingestion.pit import PitIndex, check_pit_coverage
 from pointline.ingestion.timezone import derive_trading_date, derive_trading_date_frame
 
 __all__ = [
     "IngestionResult",
+    "PitIndex",
     "assign_lineage",
     "build_manifest_identity",
     "check_pit_coverage",
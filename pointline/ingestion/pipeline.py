@@ -13,7 +13,7 @@ from pointline.ingestion.lineage import assign_lineage
 from pointline.ingestion.manifest import update_manifest_status
 from pointline.ingestion.models import IngestionResult
 from pointline.ingestion.normalize import normalize_to_table_spec
-from pointline.ingestion.pit import check_pit_coverage
+from pointline.ingestion.pit import PitIndex, check_pit_coverage
 from pointline.ingestion.timezone import derive_trading_date_frame
 from pointline.protocols import BronzeFileMetadata
 from pointline.schemas.registry import get_table_spec
@@ -155,12 +155,16 @@ def ingest_file(
     parser: Parser,
     manifest_repo: ManifestStore,
     writer: Writer,
-    dim_symbol_df: pl.DataFrame,
+    dim_symbol_df: pl.DataFrame | PitIndex,
     quarantine_store: QuarantineStore | None = None,
     force: bool = False,
     dry_run: bool = False,
 ) -> IngestionResult:
-    """Ingest a single Bronze file through the clean v2 core path."""
+    """Ingest a single Bronze file through the clean v2 core path.
+
+    Batch drivers should pass a ``PitIndex`` compiled once for the batch as
+    ``dim_symbol_df`` instead of the raw dim_symbol frame.
+    """
 
     table_name = _resolve_table_name(meta.data_type)
     spec = get_table_spec(table_name)
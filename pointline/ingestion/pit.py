@@ -2,12 +2,240 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
 import polars as pl
 
+_REQUIRED_DIM_COLS = frozenset(
+    {
+        "exchange",
+        "exchange_symbol",
+        "symbol_id",
+        "valid_from_ts_us",
+        "valid_until_ts_us",
+    }
+)
+
+_US_PER_DAY = 86_400_000_000
+
+
+def _require_dim_columns(dim_symbol_df: pl.DataFrame) -> None:
+    missing_dim = _REQUIRED_DIM_COLS - set(dim_symbol_df.columns)
+    if missing_dim:
+        raise ValueError(f"dim_symbol DataFrame missing PIT columns: {sorted(missing_dim)}")
+
+
+def _date_start_us(value: date) -> int:
+    midnight = datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    return int(midnight.timestamp()) * 1_000_000
+
+
+@dataclass(frozen=True)
+class _FileSpan:
+    exchange: str
+    symbol: str
+    ts_min: int
+    ts_max: int
+
+
+def _single_key_span(
+    df: pl.DataFrame,
+    *,
+    exchange_col: str,
+    symbol_col: str,
+    ts_col: str,
+) -> _FileSpan | None:
+    """Return the file's key and ts range when every row shares one ``(exchange, symbol)``."""
+    stats = df.select(
+        pl.col(exchange_col).n_unique().alias("n_exchange"),
+        pl.col(symbol_col).n_unique().alias("n_symbol"),
+        pl.col(exchange_col).first().alias("exchange"),
+        pl.col(symbol_col).first().alias("symbol"),
+        pl.col(ts_col).null_count().alias("ts_nulls"),
+        pl.col(ts_col).min().alias("ts_min"),
+        pl.col(ts_col).max().alias("ts_max"),
+    ).row(0, named=True)
+    if (
+        stats["n_exchange"] != 1
+        or stats["n_symbol"] != 1
+        or stats["exchange"] is None
+        or stats["symbol"] is None
+        or stats["ts_nulls"] > 0
+    ):
+        return None
+    return _FileSpan(
+        exchange=stats["exchange"],
+        symbol=stats["symbol"],
+        ts_min=int(stats["ts_min"]),
+        ts_max=int(stats["ts_max"]),
+    )
+
+
+def _with_literal_symbol_id(df: pl.DataFrame, symbol_id: int) -> pl.DataFrame:
+    return df.with_columns(pl.lit(symbol_id, dtype=pl.Int64).alias("symbol_id"))
+
+
+@dataclass(frozen=True)
+class PitIndex:
+    """dim_symbol compiled once per ingest batch for cheap per-file PIT resolution.
+
+    ``keys`` encodes each ``(exchange, exchange_symbol)`` as a dense ``UInt32`` key and
+    ``windows`` holds the validity windows sorted by ``valid_from_ts_us``, so resolving a
+    file is a join against a handful of keys plus a sorted as-of lookup instead of a
+    row-wise join against every dim_symbol version.
+    """
+
+    keys: pl.DataFrame
+    windows: pl.DataFrame
+
+    @classmethod
+    def build(
+        cls,
+        dim_symbol_df: pl.DataFrame,
+        *,
+        exchanges: Iterable[str] | None = None,
+        start_ts_us: int | None = None,
+        end_ts_us: int | None = None,
+    ) -> PitIndex:
+        """Compile ``dim_symbol_df``, keeping windows that overlap ``[start_ts_us, end_ts_us)``."""
+        _require_dim_columns(dim_symbol_df)
+
+        # Windows without a symbol_id cannot resolve rows, as in the raw-frame join.
+        dim = dim_symbol_df.select(sorted(_REQUIRED_DIM_COLS)).filter(
+            pl.col("symbol_id").is_not_null()
+        )
+        if exchanges is not None:
+            dim = dim.filter(pl.col("exchange").is_in(sorted(set(exchanges))))
+        if start_ts_us is not None:
+            dim = dim.filter(pl.col("valid_until_ts_us") > start_ts_us)
+        if end_ts_us is not None:
+            dim = dim.filter(pl.col("valid_from_ts_us") < end_ts_us)
+
+        dim = dim.sort(["exchange", "exchange_symbol", "valid_from_ts_us"])
+        overlaps = dim.filter(
+            pl.col("valid_until_ts_us")
+            > pl.col("valid_from_ts_us").shift(-1).over(["exchange", "exchange_symbol"])
+        )
+        if not overlaps.is_empty():
+            raise ValueError("dim_symbol has overlapping validity windows; cannot build PitIndex")
+
+        keys = (
+            dim.select(["exchange", "exchange_symbol"])
+            .unique(maintain_order=True)
+            .with_row_index("_pit_key")
+        )
+        windows = (
+            dim.join(keys, on=["exchange", "exchange_symbol"], how="inner")
+            .select(
+                [
+                    "_pit_key",
+                    "valid_from_ts_us",
+                    "valid_until_ts_us",
+                    pl.col("symbol_id").cast(pl.Int64),
+                ]
+            )
+            .sort(["valid_from_ts_us", "_pit_key"])
+        )
+        return cls(keys=keys, windows=windows)
+
+    @classmethod
+    def for_trading_dates(
+        cls,
+        dim_symbol_df: pl.DataFrame,
+        *,
+        exchanges: Iterable[str],
+        start_date: date,
+        end_date: date,
+    ) -> PitIndex:
+        """Compile ``dim_symbol_df`` for a batch covering ``start_date..end_date`` (inclusive).
+
+        The UTC range is padded by one day on each side, which covers the exchange-local
+        trading dates of every supported timezone.
+        """
+        return cls.build(
+            dim_symbol_df,
+            exchanges=exchanges,
+            start_ts_us=_date_start_us(start_date - timedelta(days=1)),
+            end_ts_us=_date_start_us(end_date) + 2 * _US_PER_DAY,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self.windows.is_empty()
+
+    def _single_window_symbol_id(self, span: _FileSpan) -> int | None:
+        key = self.keys.filter(
+            (pl.col("exchange") == span.exchange) & (pl.col("exchange_symbol") == span.symbol)
+        )
+        if key.is_empty():
+            return None
+        # Same window the as-of lookup would pick for ts_min; it covers the whole file
+        # when ts_max also falls before its end.
+        window = self.windows.filter(
+            (pl.col("_pit_key") == key.item(0, "_pit_key"))
+            & (pl.col("valid_from_ts_us") <= span.ts_min)
+        ).tail(1)
+        if window.is_empty() or span.ts_max >= window.item(0, "valid_until_ts_us"):
+            return None
+        return int(window.item(0, "symbol_id"))
+
+    def resolve(
+        self,
+        df: pl.DataFrame,
+        *,
+        exchange_col: str = "exchange",
+        symbol_col: str = "symbol",
+        ts_col: str = "ts_event_us",
+    ) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """Split ``df`` into rows with a covering window (plus ``symbol_id``) and the rest."""
+        span = _single_key_span(df, exchange_col=exchange_col, symbol_col=symbol_col, ts_col=ts_col)
+        if span is not None:
+            symbol_id = self._single_window_symbol_id(span)
+            if symbol_id is not None:
+                return _with_literal_symbol_id(df, symbol_id), df.head(0)
+
+        file_keys = (
+            df.select([exchange_col, symbol_col])
+            .unique()
+            .join(
+                self.keys,
+                left_on=[exchange_col, symbol_col],
+                right_on=["exchange", "exchange_symbol"],
+                how="inner",
+            )
+        )
+        staged = df.with_row_index(name="_row_id").join(
+            file_keys, on=[exchange_col, symbol_col], how="left"
+        )
+        matched = (
+            staged.filter(pl.col("_pit_key").is_not_null())
+            .select(["_row_id", "_pit_key", ts_col])
+            .sort(ts_col)
+            .join_asof(
+                self.windows,
+                left_on=ts_col,
+                right_on="valid_from_ts_us",
+                by="_pit_key",
+                strategy="backward",
+                check_sortedness=False,
+            )
+            .filter(
+                pl.col("symbol_id").is_not_null() & (pl.col(ts_col) < pl.col("valid_until_ts_us"))
+            )
+            .select(["_row_id", "symbol_id"])
+        )
+
+        staged = staged.drop("_pit_key")
+        valid = staged.join(matched, on="_row_id", how="inner").sort("_row_id").drop("_row_id")
+        quarantined = staged.join(matched, on="_row_id", how="anti").sort("_row_id").drop("_row_id")
+        return valid, quarantined
+
 
 def check_pit_coverage(
     df: pl.DataFrame,
-    dim_symbol_df: pl.DataFrame,
+    dim_symbol_df: pl.DataFrame | PitIndex,
     *,
     exchange_col: str = "exchange",
     symbol_col: str = "symbol",
@@ -18,16 +246,16 @@ def check_pit_coverage(
     if missing_event:
         raise ValueError(f"Event DataFrame missing PIT columns: {sorted(missing_event)}")
 
-    required_dim_cols = {
-        "exchange",
-        "exchange_symbol",
-        "symbol_id",
-        "valid_from_ts_us",
-        "valid_until_ts_us",
-    }
-    missing_dim = required_dim_cols - set(dim_symbol_df.columns)
-    if missing_dim:
-        raise ValueError(f"dim_symbol DataFrame missing PIT columns: {sorted(missing_dim)}")
+    if isinstance(dim_symbol_df, PitIndex):
+        return _check_with_index(
+            df,
+            dim_symbol_df,
+            exchange_col=exchange_col,
+            symbol_col=symbol_col,
+            ts_col=ts_col,
+        )
+
+    _require_dim_columns(dim_symbol_df)
 
     if df.is_empty():
         return df, df, None
@@ -36,6 +264,25 @@ def check_pit_coverage(
         empty_valid = df.head(0).with_columns(pl.lit(None, dtype=pl.Int64).alias("symbol_id"))
         return empty_valid, df, "missing_pit_symbol_coverage"
 
+    span = _single_key_span(df, exchange_col=exchange_col, symbol_col=symbol_col, ts_col=ts_col)
+    if span is not None:
+        # The earliest window containing ts_min is what the row-wise join picks for every
+        # row, provided it also contains ts_max.
+        window = (
+            dim_symbol_df.filter(
+                (pl.col("exchange") == span.exchange)
+                & (pl.col("exchange_symbol") == span.symbol)
+                & pl.col("symbol_id").is_not_null()
+                & (pl.col("valid_from_ts_us") <= span.ts_min)
+                & (pl.col("valid_until_ts_us") > span.ts_min)
+            )
+            .sort("valid_from_ts_us")
+            .head(1)
+        )
+        if not window.is_empty() and span.ts_max < window.item(0, "valid_until_ts_us"):
+            symbol_id = int(window.item(0, "symbol_id"))
+            return _with_literal_symbol_id(df, symbol_id), df.head(0), None
+
     staged = df.with_row_index(name="_row_id")
 
     joined = staged.join(
@@ -67,3 +314,28 @@ def check_pit_coverage(
 
     reason = None if quarantined.is_empty() else "missing_pit_symbol_coverage"
     return valid, quarantined, reason
+
+
+def _check_with_index(
+    df: pl.DataFrame,
+    index: PitIndex,
+    *,
+    exchange_col: str,
+    symbol_col: str,
+    ts_col: str,
+) -> tuple[pl.DataFrame, pl.DataFrame, str | None]:
+    if df.is_empty():
+        return df, df, None
+
+    if index.is_empty:
+        empty_valid = df.head(0).with_columns(pl.lit(None, dtype=pl.Int64).alias("symbol_id"))
+        return empty_valid, df, "missing_pit_symbol_coverage"
+
+    valid, quarantined = index.resolve(
+        df,
+        exchange_col=exchange_col,
+        symbol_col=symbol_col,
+        ts_col=ts_col,
+    )
+    reason = None if quarantined.is_empty() else "missing_pit_symbol_coverage"
+    return valid, quarantined, reason
@@ -1,32 +1,59 @@
 """Minimal v2 research API (discovery, querying, metadata, spine)."""
 
+from pointline.research.book import reconstruct_book
+from pointline.research.cache import CacheStats, QueryCache
+from pointline.research.cn_book import reconstruct_cn_book
 from pointline.research.cn_trading_phases import TradingPhase, add_phase_column, filter_by_phase
 from pointline.research.discovery import discover_symbols
 from pointline.research.metadata import load_symbol_meta
 from pointline.research.primitives import decode_scaled_columns, join_symbol_meta
-from pointline.research.query import load_events
+from pointline.research.query import (
+    iter_event_stream,
+    iter_events,
+    load_event_stream,
+    load_events,
+    scan_events,
+)
 from pointline.research.spine import (
     ClockSpineConfig,
     DollarSpineConfig,
+    ThresholdSpineState,
+    TickImbalanceSpineConfig,
     TradesSpineConfig,
+    VolumeImbalanceSpineConfig,
     VolumeSpineConfig,
+    aggregate_to_spine,
     align_to_spine,
     build_spine,
+    extend_threshold_spine,
 )
 
 __all__ = [
+    "CacheStats",
     "ClockSpineConfig",
     "DollarSpineConfig",
+    "QueryCache",
+    "ThresholdSpineState",
+    "TickImbalanceSpineConfig",
     "TradesSpineConfig",
     "TradingPhase",
+    "VolumeImbalanceSpineConfig",
     "VolumeSpineConfig",
     "add_phase_column",
+    "aggregate_to_spine",
     "align_to_spine",
     "build_spine",
     "decode_scaled_columns",
     "discover_symbols",
+    "extend_threshold_spine",
     "filter_by_phase",
+    "iter_event_stream",
+    "iter_events",
     "join_symbol_meta",
-    "load_symbol_meta",
+    "load_event_stream",
     "load_events",
+    "load_symbol_meta",
+    "reconstruct_book",
+    "reconstruct_cn_book",
+    "scan_events",
 ]
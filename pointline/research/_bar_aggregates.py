@@ -0,0 +1,84 @@
+"""Registry of per-bar aggregates for ``aggregate_to_spine``.
+
+Aggregates run on canonical scaled integers and keep their scale: prices stay in
+price scale, volumes in qty scale and notionals follow ``dollar_notional_expr``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import polars as pl
+
+from pointline.research._spine_builders import dollar_notional_expr
+
+
+@dataclass(frozen=True)
+class BarAggregate:
+    """Named group of per-bar output expressions.
+
+    ``columns`` are the event columns the expressions read. ``empty_value`` fills the
+    outputs of bars that received no events (``None`` leaves them null).
+    """
+
+    exprs: tuple[pl.Expr, ...]
+    columns: tuple[str, ...]
+    empty_value: int | None = None
+
+
+_SIDE_SIGN = (
+    pl.when(pl.col("side") == "buy").then(1).when(pl.col("side") == "sell").then(-1).otherwise(0)
+)
+
+BAR_AGGREGATES: dict[str, BarAggregate] = {
+    "ohlc": BarAggregate(
+        exprs=(
+            pl.col("price").first().alias("open"),
+            pl.col("price").max().alias("high"),
+            pl.col("price").min().alias("low"),
+            pl.col("price").last().alias("close"),
+        ),
+        columns=("price",),
+    ),
+    "volume": BarAggregate(
+        exprs=(pl.col("qty").abs().sum().alias("volume"),),
+        columns=("qty",),
+        empty_value=0,
+    ),
+    "notional": BarAggregate(
+        exprs=(dollar_notional_expr().sum().alias("notional"),),
+        columns=("price", "qty"),
+        empty_value=0,
+    ),
+    # Volume-weighted price in price scale, floored; exact via an Int128 notional sum.
+    "vwap": BarAggregate(
+        exprs=(
+            (
+                (pl.col("price").cast(pl.Int128) * pl.col("qty").cast(pl.Int128).abs()).sum()
+                // pl.col("qty").cast(pl.Int128).abs().sum()
+            )
+            .cast(pl.Int64)
+            .alias("vwap"),
+        ),
+        columns=("price", "qty"),
+    ),
+    "trade_count": BarAggregate(
+        exprs=(pl.len().cast(pl.Int64).alias("trade_count"),),
+        columns=(),
+        empty_value=0,
+    ),
+    # Buy minus sell volume; trades with an unknown aggressor side count as zero.
+    "signed_volume": BarAggregate(
+        exprs=((pl.col("qty").abs() * _SIDE_SIGN).sum().alias("signed_volume"),),
+        columns=("qty", "side"),
+        empty_value=0,
+    ),
+}
+
+DEFAULT_BAR_AGGREGATES: tuple[str, ...] = (
+    "ohlc",
+    "volume",
+    "vwap",
+    "trade_count",
+    "signed_volume",
+)
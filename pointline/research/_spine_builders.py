@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
+from typing import TypeAlias
 
 import polars as pl
 
 from pointline.research._spine_types import (
     ClockSpineConfig,
     DollarSpineConfig,
+    TickImbalanceSpineConfig,
     TradesSpineConfig,
+    VolumeImbalanceSpineConfig,
     VolumeSpineConfig,
 )
-from pointline.research._time import derive_trading_date_bounds
+from pointline.research._time import derive_trading_date_bounds, trading_day_windows
 from pointline.schemas.dimensions import DIM_SYMBOL
 from pointline.schemas.events import TRADES
 from pointline.schemas.types import QTY_SCALE
@@ -21,93 +27,114 @@ from pointline.storage.delta.layout import table_path
 
 SPINE_COLUMNS: list[str] = ["exchange", "symbol", "symbol_id", "ts_spine_us"]
 
+# Requested instruments: exchange -> symbols on that exchange.
+Instruments: TypeAlias = Mapping[str, list[str]]
+_TRADE_COLUMNS = (
+    "exchange",
+    "symbol",
+    "symbol_id",
+    "ts_event_us",
+    "price",
+    "qty",
+    "file_id",
+    "file_seq",
+)
+
 
 def build_clock_spine(
     *,
     silver_root: Path,
-    exchange: str,
-    symbols: list[str],
+    instruments: Instruments,
     start_ts_us: int,
     end_ts_us: int,
     config: ClockSpineConfig,
+    dim_symbol_version: int | None = None,
 ) -> pl.DataFrame:
     if config.step_us <= 0:
         raise ValueError(f"step_us must be > 0, got {config.step_us}")
     if config.max_rows <= 0:
         raise ValueError(f"max_rows must be > 0, got {config.max_rows}")
 
-    dim = DeltaDimensionStore(silver_root=silver_root).load_dim_symbol()
+    dim = DeltaDimensionStore(silver_root=silver_root).load_dim_symbol(version=dim_symbol_version)
     if dim.is_empty():
         return empty_spine_frame()
 
     active = (
-        dim.filter(pl.col("exchange") == exchange)
-        .filter(pl.col("exchange_symbol").is_in(symbols))
+        dim.join(
+            _instrument_frame(instruments, symbol_col="exchange_symbol"),
+            on=["exchange", "exchange_symbol"],
+            how="semi",
+        )
         .filter(
             (pl.col("valid_from_ts_us") < end_ts_us) & (pl.col("valid_until_ts_us") > start_ts_us)
         )
-        .sort(["exchange_symbol", "valid_from_ts_us"])
+        .sort(["exchange", "exchange_symbol", "valid_from_ts_us"])
     )
     if active.is_empty():
         return empty_spine_frame()
 
-    rows: list[tuple[str, str, int, int]] = []
-    row_count = 0
-    for row in active.iter_rows(named=True):
-        interval_start = max(start_ts_us, int(row["valid_from_ts_us"]))
-        interval_end = min(end_ts_us, int(row["valid_until_ts_us"]))
-        first = ((interval_start // config.step_us) + 1) * config.step_us
-        if first > interval_end:
-            continue
-
-        count = ((interval_end - first) // config.step_us) + 1
-        row_count += count
-        if row_count > config.max_rows:
-            raise RuntimeError(
-                f"Clock spine would generate too many rows: {row_count} > {config.max_rows}"
-            )
-
-        for ts in range(first, interval_end + 1, config.step_us):
-            rows.append((exchange, str(row["exchange_symbol"]), int(row["symbol_id"]), ts))
-
-    if not rows:
+    step_us = config.step_us
+    intervals = (
+        active.select(
+            "exchange",
+            pl.col("exchange_symbol").alias("symbol"),
+            pl.col("symbol_id").cast(pl.Int64),
+            # First grid point strictly after the interval start, last one at or before its end.
+            (
+                (pl.max_horizontal(pl.col("valid_from_ts_us"), pl.lit(start_ts_us)) // step_us + 1)
+                * step_us
+            ).alias("_first"),
+            pl.min_horizontal(pl.col("valid_until_ts_us"), pl.lit(end_ts_us)).alias("_last"),
+        )
+        .filter(pl.col("_first") <= pl.col("_last"))
+        .sort(["exchange", "symbol", "_first"], maintain_order=True)
+    )
+    if intervals.is_empty():
         return empty_spine_frame()
 
-    out = pl.DataFrame(
-        rows,
-        schema={
-            "exchange": pl.Utf8,
-            "symbol": pl.Utf8,
-            "symbol_id": pl.Int64,
-            "ts_spine_us": pl.Int64,
-        },
-        orient="row",
-    )
-    return (
-        out.unique(subset=["exchange", "symbol", "ts_spine_us"], keep="first")
-        .sort(["exchange", "symbol", "ts_spine_us"])
-        .select(SPINE_COLUMNS)
-    )
+    # Size the spine before materializing it.
+    row_count = intervals.select(((pl.col("_last") - pl.col("_first")) // step_us + 1).sum()).item()
+    if row_count > config.max_rows:
+        raise RuntimeError(
+            f"Clock spine would generate too many rows: {row_count} > {config.max_rows}"
+        )
+
+    out = intervals.select(
+        "exchange",
+        "symbol",
+        "symbol_id",
+        pl.int_ranges("_first", pl.col("_last") + 1, step_us, dtype=pl.Int64).alias("ts_spine_us"),
+    ).explode("ts_spine_us")
+
+    # Disjoint validity intervals (the SCD2 norm) explode straight into spine order.
+    overlapping = intervals.select(
+        (pl.col("_first") <= pl.col("_last").shift(1).over("exchange", "symbol")).any()
+    ).item()
+    if overlapping:
+        out = out.unique(
+            subset=["exchange", "symbol", "ts_spine_us"], keep="first", maintain_order=True
+        ).sort(["exchange", "symbol", "ts_spine_us"])
+    return out.select(SPINE_COLUMNS)
 
 
 def build_trades_spine(
     *,
     silver_root: Path,
-    exchange: str,
-    symbols: list[str],
+    instruments: Instruments,
     start_ts_us: int,
     end_ts_us: int,
     config: TradesSpineConfig,
+    trades_version: int | None = None,
 ) -> pl.DataFrame:
     if config.max_rows <= 0:
         raise ValueError(f"max_rows must be > 0, got {config.max_rows}")
 
     trades = _load_trades(
         silver_root=silver_root,
-        exchange=exchange,
-        symbols=symbols,
+        instruments=instruments,
         start_ts_us=start_ts_us,
         end_ts_us=end_ts_us,
+        version=trades_version,
     )
     if trades.is_empty():
         return empty_spine_frame()
@@ -125,68 +152,294 @@ def build_trades_spine(
 def build_volume_spine(
     *,
     silver_root: Path,
-    exchange: str,
-    symbols: list[str],
+    instruments: Instruments,
     start_ts_us: int,
     end_ts_us: int,
     config: VolumeSpineConfig,
+    trades_version: int | None = None,
 ) -> pl.DataFrame:
-    if config.volume_threshold_scaled <= 0:
-        raise ValueError(
-            f"volume_threshold_scaled must be > 0, got {config.volume_threshold_scaled}"
-        )
-    if config.max_rows <= 0:
-        raise ValueError(f"max_rows must be > 0, got {config.max_rows}")
-
-    trades = _load_trades(
+    measure_expr, threshold = threshold_measure(config)
+    spine, _ = build_threshold_spine(
         silver_root=silver_root,
-        exchange=exchange,
-        symbols=symbols,
+        instruments=instruments,
         start_ts_us=start_ts_us,
         end_ts_us=end_ts_us,
-    )
-    return _threshold_spine_from_trades(
-        trades=trades,
-        measure_expr=pl.col("qty").abs(),
-        threshold=config.volume_threshold_scaled,
+        measure_expr=measure_expr,
+        threshold=threshold,
         max_rows=config.max_rows,
+        trades_version=trades_version,
     )
+    return spine
 
 
 def build_dollar_spine(
     *,
     silver_root: Path,
-    exchange: str,
-    symbols: list[str],
+    instruments: Instruments,
     start_ts_us: int,
     end_ts_us: int,
     config: DollarSpineConfig,
+    trades_version: int | None = None,
 ) -> pl.DataFrame:
-    if config.dollar_threshold_scaled <= 0:
+    measure_expr, threshold = threshold_measure(config)
+    spine, _ = build_threshold_spine(
+        silver_root=silver_root,
+        instruments=instruments,
+        start_ts_us=start_ts_us,
+        end_ts_us=end_ts_us,
+        measure_expr=measure_expr,
+        threshold=threshold,
+        max_rows=config.max_rows,
+        trades_version=trades_version,
+    )
+    return spine
+
+
+def threshold_measure(config: VolumeSpineConfig | DollarSpineConfig) -> tuple[pl.Expr, int]:
+    """Validated (per-trade measure, threshold) pair of a volume or dollar spine config."""
+    if isinstance(config, VolumeSpineConfig):
+        name, threshold = "volume_threshold_scaled", config.volume_threshold_scaled
+        measure_expr = pl.col("qty").abs()
+    else:
+        name, threshold = "dollar_threshold_scaled", config.dollar_threshold_scaled
+        measure_expr = dollar_notional_expr()
+    if threshold <= 0:
+        raise ValueError(f"{name} must be > 0, got {threshold}")
+    if config.max_rows <= 0:
+        raise ValueError(f"max_rows must be > 0, got {config.max_rows}")
+    return measure_expr, threshold
+
+
+def build_threshold_spine(
+    *,
+    silver_root: Path,
+    instruments: Instruments,
+    start_ts_us: int,
+    end_ts_us: int,
+    measure_expr: pl.Expr,
+    threshold: int,
+    max_rows: int,
+    trades_version: int | None = None,
+    residuals: dict[tuple[str, str], int] | None = None,
+) -> tuple[pl.DataFrame, dict[tuple[str, str], int]]:
+    """Emit a bar each time a symbol's cumulative ``measure_expr`` crosses a ``threshold`` multiple.
+
+    Trades are loaded and accumulated one exchange-local trading date at a time.
+    ``residuals`` ((exchange, symbol) -> measure accumulated since its last bar) seeds
+    the first window; the returned residuals cover every requested instrument and
+    continue the spine exactly where this call stopped.
+    """
+    carried = dict.fromkeys(_instrument_keys(instruments), 0)
+    if residuals:
+        carried.update(residuals)
+
+    pieces: list[pl.DataFrame] = []
+    n_rows = 0
+    for window_start, window_end in _chunk_windows(
+        instruments, start_ts_us=start_ts_us, end_ts_us=end_ts_us
+    ):
+        trades = _load_trades(
+            silver_root=silver_root,
+            instruments=instruments,
+            start_ts_us=window_start,
+            end_ts_us=window_end,
+            version=trades_version,
+        )
+        piece = _threshold_spine_from_trades(
+            trades=trades,
+            measure_expr=measure_expr,
+            threshold=threshold,
+            residuals=carried,
+        )
+        n_rows += piece.height
+        if n_rows > max_rows:
+            raise RuntimeError(f"Spine would generate too many rows: {n_rows} > {max_rows}")
+        pieces.append(piece)
+
+    if not pieces:
+        return empty_spine_frame(), carried
+    spine = pl.concat(pieces).sort(["exchange", "symbol", "ts_spine_us"], maintain_order=True)
+    return spine, carried
+
+
+def build_imbalance_spine(
+    *,
+    silver_root: Path,
+    instruments: Instruments,
+    start_ts_us: int,
+    end_ts_us: int,
+    config: TickImbalanceSpineConfig | VolumeImbalanceSpineConfig,
+    trades_version: int | None = None,
+) -> pl.DataFrame:
+    """Tick/volume imbalance bars with EWMA-adapted thresholds (López de Prado).
+
+    Trade signs are the aggressor side, falling back to the tick rule when the side is
+    unknown. Sign preparation is columnar; bar closing runs in a sequential kernel
+    that carries per-symbol state across trading dates, so output does not depend on
+    how the window is chunked.
+    """
+    if config.expected_ticks_init <= 0:
+        raise ValueError(f"expected_ticks_init must be > 0, got {config.expected_ticks_init}")
+    if config.ewma_span < 1:
+        raise ValueError(f"ewma_span must be >= 1, got {config.ewma_span}")
+    if not 0 < config.min_expected_ticks <= config.max_expected_ticks:
         raise ValueError(
-            f"dollar_threshold_scaled must be > 0, got {config.dollar_threshold_scaled}"
+            "expected ticks bounds must satisfy 0 < min_expected_ticks <= max_expected_ticks, "
+            f"got {config.min_expected_ticks}, {config.max_expected_ticks}"
         )
     if config.max_rows <= 0:
         raise ValueError(f"max_rows must be > 0, got {config.max_rows}")
 
-    trades = _load_trades(
-        silver_root=silver_root,
-        exchange=exchange,
-        symbols=symbols,
-        start_ts_us=start_ts_us,
-        end_ts_us=end_ts_us,
+    weighted = isinstance(config, VolumeImbalanceSpineConfig)
+    states: dict[tuple[str, str], _ImbalanceState] = {}
+    pieces: list[pl.DataFrame] = []
+    n_rows = 0
+    for window_start, window_end in _chunk_windows(
+        instruments, start_ts_us=start_ts_us, end_ts_us=end_ts_us
+    ):
+        trades = _load_trades(
+            silver_root=silver_root,
+            instruments=instruments,
+            start_ts_us=window_start,
+            end_ts_us=window_end,
+            version=trades_version,
+            extra_columns=("side",),
+        )
+        for key, group in trades.partition_by(
+            ["exchange", "symbol"], as_dict=True, maintain_order=True
+        ).items():
+            state = states.get(key)
+            if state is None:
+                state = states[key] = _ImbalanceState.initial(config)
+            imbalance = _signed_trades(group, state=state, weighted=weighted)
+            cuts = _imbalance_cuts(imbalance.to_list(), state=state)
+            piece = (
+                group[cuts]
+                .select(["exchange", "symbol", "symbol_id", "ts_event_us"])
+                .rename({"ts_event_us": "ts_spine_us"})
+                .unique(subset=["exchange", "symbol", "ts_spine_us"], keep="first")
+            )
+            n_rows += piece.height
+            if n_rows > config.max_rows:
+                raise RuntimeError(
+                    f"Spine would generate too many rows: {n_rows} > {config.max_rows}"
+                )
+            pieces.append(piece)
+
+    if not pieces:
+        return empty_spine_frame()
+    return (
+        pl.concat(pieces)
+        .sort(["exchange", "symbol", "ts_spine_us"], maintain_order=True)
+        .select(SPINE_COLUMNS)
     )
-    # Use Python big-int per row to avoid int64 overflow on intermediate multiply.
-    notional = pl.struct(["price", "qty"]).map_elements(
-        lambda row: abs(int(row["price"])) * abs(int(row["qty"])) // QTY_SCALE,
-        return_dtype=pl.Int64,
+
+
+@dataclass
+class _ImbalanceState:
+    """Per-symbol imbalance-bar state carried across trade chunks."""
+
+    alpha: float
+    min_ticks: float
+    max_ticks: float
+    warmup_ticks: int
+    warmup_left: int
+    warmup_sum: int = 0
+    expected_ticks: float = 0.0
+    expected_imbalance: float = 0.0
+    theta: int = 0
+    count: int = 0
+    last_price: int | None = None
+    last_tick: int = 0
+
+    @classmethod
+    def initial(cls, config: TickImbalanceSpineConfig | VolumeImbalanceSpineConfig):
+        return cls(
+            alpha=2.0 / (config.ewma_span + 1),
+            min_ticks=float(config.min_expected_ticks),
+            max_ticks=float(config.max_expected_ticks),
+            warmup_ticks=config.expected_ticks_init,
+            warmup_left=config.expected_ticks_init,
+            expected_ticks=float(config.expected_ticks_init),
+        )
+
+
+def _signed_trades(group: pl.DataFrame, *, state: _ImbalanceState, weighted: bool) -> pl.Series:
+    """Per-trade imbalance: aggressor sign (tick rule if unknown), times |qty| if weighted."""
+    prices = group.get_column("price")
+    previous = pl.Series([state.last_price], dtype=prices.dtype)
+    tick = (
+        pl.concat([previous, prices])
+        .diff()
+        .slice(1)
+        .sign()
+        .replace(0, None)
+        .forward_fill()
+        .fill_null(state.last_tick)
     )
-    return _threshold_spine_from_trades(
-        trades=trades,
-        measure_expr=notional,
-        threshold=config.dollar_threshold_scaled,
-        max_rows=config.max_rows,
+    state.last_price = prices[-1]
+    state.last_tick = tick[-1]
+
+    side = group.get_column("side")
+    sign = (
+        pl.select(pl.when(side == "buy").then(1).when(side == "sell").then(-1).otherwise(tick))
+        .to_series()
+        .cast(pl.Int64)
     )
+    if not weighted:
+        return sign
+    return sign * group.get_column("qty").abs()
+
+
+def _imbalance_cuts(imbalance: list[int], *, state: _ImbalanceState) -> list[int]:
+    """Indices of the trades that close a bar; advances ``state`` past ``imbalance``."""
+    n = len(imbalance)
+    start = 0
+    if state.warmup_left:
+        start = min(state.warmup_left, n)
+        state.warmup_sum += sum(imbalance[:start])
+        state.warmup_left -= start
+        if state.warmup_left:
+            return []
+        state.expected_imbalance = state.warmup_sum / state.warmup_ticks
+
+    cuts: list[int] = []
+    cum = list(accumulate(imbalance, initial=0))
+    max_step = max(map(abs, imbalance[start:]), default=0)
+    base = cum[start] - state.theta
+    bar_start = start - state.count
+    threshold = state.expected_ticks * abs(state.expected_imbalance)
+    i = start
+    while i < n:
+        gap = threshold - abs(cum[i] - base)
+        if max_step and gap > max_step:
+            # |theta| grows by at most max_step per trade: the next trades cannot close a bar.
+            i += min(-int(-gap // max_step) - 1, n - i)
+            continue
+        theta = cum[i + 1] - base
+        if abs(theta) >= threshold:
+            count = i + 1 - bar_start
+            cuts.append(i)
+            expected_ticks = state.expected_ticks + state.alpha * (count - state.expected_ticks)
+            state.expected_ticks = min(max(expected_ticks, state.min_ticks), state.max_ticks)
+            state.expected_imbalance += state.alpha * (theta / count - state.expected_imbalance)
+            threshold = state.expected_ticks * abs(state.expected_imbalance)
+            base = cum[i + 1]
+            bar_start = i + 1
+        i += 1
+    state.theta = cum[n] - base
+    state.count = n - bar_start
+    return cuts
+
+
+def dollar_notional_expr(price: str = "price", qty: str = "qty") -> pl.Expr:
+    """Exact scaled notional ``|price| * |qty| // QTY_SCALE`` as Int64.
+
+    The product of two 1e9-scaled Int64 values overflows Int64, so it is formed in Int128;
+    a notional that does not fit Int64 raises instead of wrapping.
+    """
+    product = pl.col(price).cast(pl.Int128).abs() * pl.col(qty).cast(pl.Int128).abs()
+    return (product // QTY_SCALE).cast(pl.Int64, strict=True)
 
 
 def _threshold_spine_from_trades(
@@ -194,70 +447,119 @@ def _threshold_spine_from_trades(
     trades: pl.DataFrame,
     measure_expr: pl.Expr,
     threshold: int,
-    max_rows: int,
+    residuals: dict[tuple[str, str], int],
 ) -> pl.DataFrame:
+    """Threshold bars over one chunk of sorted trades; advances ``residuals`` in place."""
     if trades.is_empty():
         return empty_spine_frame()
 
     group_cols = ["exchange", "symbol"]
+    offsets = pl.DataFrame(
+        [(exchange, symbol, value) for (exchange, symbol), value in residuals.items()],
+        schema={"exchange": pl.Utf8, "symbol": pl.Utf8, "_offset": pl.Int64},
+        orient="row",
+    )
+    # Int128 so a day of scaled notional cannot overflow the running sum.
+    offset = pl.col("_offset").fill_null(0).cast(pl.Int128)
     measured = (
-        trades.with_columns(measure_expr.cast(pl.Int64).alias("_measure"))
-        .with_columns(pl.col("_measure").cum_sum().over(group_cols).alias("_cum_measure"))
-        .with_columns((pl.col("_cum_measure") // threshold).cast(pl.Int64).alias("_bucket"))
+        trades.join(offsets, on=group_cols, how="left", maintain_order="left")
+        .with_columns(measure_expr.cast(pl.Int128).alias("_measure"))
+        .with_columns((offset + pl.col("_measure").cum_sum().over(group_cols)).alias("_cum"))
+        .with_columns((pl.col("_cum") // threshold).cast(pl.Int64).alias("_bucket"))
         .with_columns(
             pl.col("_bucket").shift(1).over(group_cols).fill_null(0).alias("_prev_bucket")
         )
     )
+    residuals.update(
+        ((exchange, symbol), residual)
+        for exchange, symbol, residual in measured.group_by(group_cols)
+        .agg((pl.col("_cum").last() % threshold).cast(pl.Int64))
+        .iter_rows()
+    )
 
-    out = (
+    return (
         measured.filter((pl.col("_bucket") >= 1) & (pl.col("_bucket") > pl.col("_prev_bucket")))
         .select(["exchange", "symbol", "symbol_id", "ts_event_us"])
         .rename({"ts_event_us": "ts_spine_us"})
         .unique(subset=["exchange", "symbol", "ts_spine_us"], keep="first")
         .sort(["exchange", "symbol", "ts_spine_us"])
+        .select(SPINE_COLUMNS)
     )
-    _enforce_max_rows(out, max_rows=max_rows)
-    return out.select(SPINE_COLUMNS)
 
 
 def _load_trades(
     *,
     silver_root: Path,
-    exchange: str,
-    symbols: list[str],
+    instruments: Instruments,
     start_ts_us: int,
     end_ts_us: int,
+    version: int | None = None,
+    extra_columns: tuple[str, ...] = (),
 ) -> pl.DataFrame:
     path = table_path(silver_root=silver_root, table_name="trades")
     if not path.exists():
-        return _empty_trades_frame()
-
-    start_date, end_date = derive_trading_date_bounds(
-        exchange=exchange,
-        start_ts_us=start_ts_us,
-        end_ts_us=end_ts_us,
-    )
-    lf = pl.scan_delta(str(path)).filter(
-        (pl.col("exchange") == exchange)
-        & (pl.col("symbol").is_in(symbols))
-        & (pl.col("trading_date") >= pl.lit(start_date))
-        & (pl.col("trading_date") <= pl.lit(end_date))
-        & (pl.col("ts_event_us") >= start_ts_us)
-        & (pl.col("ts_event_us") < end_ts_us)
+        return _empty_trades_frame(extra_columns)
+
+    # One scan; each exchange is pruned to its own local trading dates and symbols.
+    partitions = pl.lit(False)
+    for exchange, symbols in instruments.items():
+        start_date, end_date = derive_trading_date_bounds(
+            exchange=exchange,
+            start_ts_us=start_ts_us,
+            end_ts_us=end_ts_us,
+        )
+        partitions = partitions | (
+            (pl.col("exchange") == exchange)
+            & (pl.col("symbol").is_in(symbols))
+            & (pl.col("trading_date") >= pl.lit(start_date))
+            & (pl.col("trading_date") <= pl.lit(end_date))
+        )
+    lf = pl.scan_delta(str(path), version=version).filter(
+        partitions & (pl.col("ts_event_us") >= start_ts_us) & (pl.col("ts_event_us") < end_ts_us)
     )
 
-    cols = ["exchange", "symbol", "symbol_id", "ts_event_us", "price", "qty", "file_id", "file_seq"]
+    cols = [*_TRADE_COLUMNS, *extra_columns]
     return (
         lf.select(cols).collect().sort(["exchange", "symbol", "ts_event_us", "file_id", "file_seq"])
     )
 
 
-def _empty_trades_frame() -> pl.DataFrame:
+def _empty_trades_frame(extra_columns: tuple[str, ...] = ()) -> pl.DataFrame:
     schema = TRADES.to_polars()
-    cols = ["exchange", "symbol", "symbol_id", "ts_event_us", "price", "qty", "file_id", "file_seq"]
+    cols = [*_TRADE_COLUMNS, *extra_columns]
     return pl.DataFrame(schema={col: schema[col] for col in cols})
 
 
+def _instrument_keys(instruments: Instruments) -> list[tuple[str, str]]:
+    return [(exchange, symbol) for exchange, symbols in instruments.items() for symbol in symbols]
+
+
+def _instrument_frame(instruments: Instruments, *, symbol_col: str = "symbol") -> pl.DataFrame:
+    return pl.DataFrame(
+        _instrument_keys(instruments),
+        schema={"exchange": pl.Utf8, symbol_col: pl.Utf8},
+        orient="row",
+    )
+
+
+def _chunk_windows(
+    instruments: Instruments,
+    *,
+    start_ts_us: int,
+    end_ts_us: int,
+) -> list[tuple[int, int]]:
+    """Windows split at every requested exchange's local midnights."""
+    cuts = {
+        window_end
+        for exchange in instruments
+        for _, window_end in trading_day_windows(
+            exchange=exchange, start_ts_us=start_ts_us, end_ts_us=end_ts_us
+        )
+    }
+    bounds = [start_ts_us, *sorted(cuts)]
+    return list(zip(bounds[:-1], bounds[1:], strict=True))
+
+
 def empty_spine_frame() -> pl.DataFrame:
     return pl.DataFrame(
         schema={
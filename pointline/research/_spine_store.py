@@ -0,0 +1,103 @@
+"""Materialized spine store: per-day spine partitions in the ``spines`` Delta table.
+
+Each stored ``(builder, config_hash, exchange, trading_date, symbol)`` unit holds its
+spine rows plus one marker row (``ts_spine_us`` null) recording the source fingerprint
+it was built from and, for threshold builders, the partial-bar carry in and out. A unit
+is written in a single append, so it is either complete or absent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+from deltalake import DeltaTable
+
+from pointline.research._spine_types import SpineConfig
+from pointline.schemas.dimensions import DIM_SYMBOL
+from pointline.storage.delta._utils import append_delta
+from pointline.storage.delta.layout import table_path
+
+SPINE_STORE_TABLE = "spines"
+SPINE_STORE_PARTITION_BY: tuple[str, ...] = ("builder", "config_hash", "exchange", "trading_date")
+SPINE_STORE_SCHEMA: dict[str, pl.DataType] = {
+    "builder": pl.Utf8(),
+    "config_hash": pl.Utf8(),
+    "exchange": pl.Utf8(),
+    "trading_date": pl.Date(),
+    "symbol": pl.Utf8(),
+    "symbol_id": DIM_SYMBOL.to_polars()["symbol_id"],
+    "ts_spine_us": pl.Int64(),
+    "source_fingerprint": pl.Utf8(),
+    "carry_in": pl.Int64(),
+    "carry_out": pl.Int64(),
+}
+
+
+def spine_config_hash(config: SpineConfig) -> str:
+    """Stable digest of the fields that shape a spine (``max_rows`` only guards size)."""
+    fields = {name: value for name, value in asdict(config).items() if name != "max_rows"}
+    payload = json.dumps([type(config).__name__, fields], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class SpineStore:
+    """Read and replace per-day spine units of one ``(builder, config_hash, exchange)``."""
+
+    def __init__(self, *, silver_root: Path, builder: str, config_hash: str, exchange: str):
+        self.path = table_path(silver_root=silver_root, table_name=SPINE_STORE_TABLE)
+        self.builder = builder
+        self.config_hash = config_hash
+        self.exchange = exchange
+
+    def load_days(self, *, trading_dates: list[date], symbols: list[str]) -> pl.DataFrame:
+        """Stored rows (spine rows and markers) for the given days and symbols."""
+        if not trading_dates or not self.path.exists():
+            return pl.DataFrame(schema=SPINE_STORE_SCHEMA)
+        return (
+            pl.scan_delta(str(self.path))
+            .filter(
+                (pl.col("builder") == self.builder)
+                & (pl.col("config_hash") == self.config_hash)
+                & (pl.col("exchange") == self.exchange)
+                & pl.col("trading_date").is_in(trading_dates)
+                & pl.col("symbol").is_in(symbols)
+            )
+            .select(list(SPINE_STORE_SCHEMA))
+            .collect()
+        )
+
+    def replace_days(self, units: pl.DataFrame) -> None:
+        """Delete any stored ``(trading_date, symbol)`` units present in ``units``, then append."""
+        if units.is_empty():
+            return
+        if self.path.exists():
+            per_day = (
+                units.group_by("trading_date")
+                .agg(pl.col("symbol").unique().sort())
+                .sort("trading_date")
+            )
+            units_predicate = " OR ".join(
+                f"(trading_date = DATE '{day.isoformat()}'"
+                f" AND symbol IN ({', '.join(_sql_str(symbol) for symbol in symbols)}))"
+                for day, symbols in per_day.iter_rows()
+            )
+            DeltaTable(str(self.path)).delete(
+                f"builder = {_sql_str(self.builder)}"
+                f" AND config_hash = {_sql_str(self.config_hash)}"
+                f" AND exchange = {_sql_str(self.exchange)}"
+                f" AND ({units_predicate})"
+            )
+        append_delta(
+            self.path,
+            df=units.select(pl.col(name).cast(dtype) for name, dtype in SPINE_STORE_SCHEMA.items()),
+            partition_by=SPINE_STORE_PARTITION_BY,
+        )
+
+
+def _sql_str(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
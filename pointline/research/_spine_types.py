@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Literal, TypeAlias
+from uuid import uuid4
 
-BuilderName: TypeAlias = Literal["clock", "trades", "volume", "dollar"]
+import polars as pl
+
+BuilderName: TypeAlias = Literal[
+    "clock", "trades", "volume", "dollar", "tick_imbalance", "volume_imbalance"
+]
 
 
 @dataclass(frozen=True)
@@ -31,6 +38,82 @@ class DollarSpineConfig:
     max_rows: int = 5_000_000
 
 
+@dataclass(frozen=True)
+class TickImbalanceSpineConfig:
+    """Tick imbalance bars: close when |sum of trade signs| >= E[T] * |E[sign]|.
+
+    The first ``expected_ticks_init`` trades of each symbol only seed E[sign]; E[T]
+    starts at ``expected_ticks_init`` and both expectations are EWMAs over closed
+    bars (``ewma_span`` bars), with E[T] clipped to the expected-ticks bounds.
+    """
+
+    expected_ticks_init: int = 1_000
+    ewma_span: int = 20
+    min_expected_ticks: int = 10
+    max_expected_ticks: int = 1_000_000
+    max_rows: int = 5_000_000
+
+
+@dataclass(frozen=True)
+class VolumeImbalanceSpineConfig:
+    """Volume imbalance bars: as tick imbalance, with trade signs weighted by scaled qty."""
+
+    expected_ticks_init: int = 1_000
+    ewma_span: int = 20
+    min_expected_ticks: int = 10
+    max_expected_ticks: int = 1_000_000
+    max_rows: int = 5_000_000
+
+
 SpineConfig: TypeAlias = (
-    ClockSpineConfig | TradesSpineConfig | VolumeSpineConfig | DollarSpineConfig
+    ClockSpineConfig
+    | TradesSpineConfig
+    | VolumeSpineConfig
+    | DollarSpineConfig
+    | TickImbalanceSpineConfig
+    | VolumeImbalanceSpineConfig
 )
+
+
+@dataclass(frozen=True)
+class ThresholdSpineState:
+    """Partial-bar accumulators of a volume/dollar spine built through ``through_ts_us``.
+
+    ``residuals`` has one row per symbol (``symbol``, ``residual``): the measure
+    accumulated since that symbol's last bar. Passing the state back to
+    ``extend_threshold_spine`` continues the spine exactly where it stopped.
+    """
+
+    builder: str
+    threshold: int
+    exchange: str
+    through_ts_us: int
+    residuals: pl.DataFrame
+
+    def save(self, path: Path) -> None:
+        """Persist as one parquet file (written atomically)."""
+        frame = self.residuals.select(
+            pl.lit(self.builder).alias("builder"),
+            pl.lit(self.threshold, dtype=pl.Int64).alias("threshold"),
+            pl.lit(self.exchange).alias("exchange"),
+            pl.lit(self.through_ts_us, dtype=pl.Int64).alias("through_ts_us"),
+            pl.col("symbol"),
+            pl.col("residual"),
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        frame.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> ThresholdSpineState:
+        frame = pl.read_parquet(path)
+        if frame.is_empty():
+            raise ValueError(f"Threshold spine state at {path} is empty")
+        return cls(
+            builder=frame.item(0, "builder"),
+            threshold=frame.item(0, "threshold"),
+            exchange=frame.item(0, "exchange"),
+            through_ts_us=frame.item(0, "through_ts_us"),
+            residuals=frame.select("symbol", "residual"),
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from pointline.ingestion.exchange import get_exchange_timezone
@@ -36,6 +36,19 @@ def normalize_ts_us(value: TimestampInput, *, param_name: str) -> int:
     return int(dt.timestamp() * 1_000_000)
 
 
+def normalize_as_of_time(
+    *,
+    as_of_version: object | None,
+    as_of_time: TimestampInput | None,
+) -> int | None:
+    """Validate lake-state pinning arguments and normalize ``as_of_time`` to UTC microseconds."""
+    if as_of_version is not None and as_of_time is not None:
+        raise ValueError("Pass at most one of as_of_version / as_of_time")
+    if as_of_time is None:
+        return None
+    return normalize_ts_us(as_of_time, param_name="as_of_time")
+
+
 def validate_time_window(start_ts_us: int, end_ts_us: int) -> None:
     """Validate [start, end) time window."""
     if end_ts_us <= start_ts_us:
@@ -55,3 +68,34 @@ def derive_trading_date_bounds(
     start_local = datetime.fromtimestamp(start_ts_us / 1_000_000, tz=timezone.utc).astimezone(tz)
     end_local = datetime.fromtimestamp((end_ts_us - 1) / 1_000_000, tz=timezone.utc).astimezone(tz)
     return start_local.date(), end_local.date()
+
+
+def local_midnight_ts_us(*, exchange: str, day: date) -> int:
+    """UTC microseconds of the exchange-local start of ``day``."""
+    tz = ZoneInfo(get_exchange_timezone(exchange))
+    return int(datetime(day.year, day.month, day.day, tzinfo=tz).timestamp()) * 1_000_000
+
+
+def trading_day_windows(
+    *,
+    exchange: str,
+    start_ts_us: int,
+    end_ts_us: int,
+) -> list[tuple[int, int]]:
+    """Split [start_ts_us, end_ts_us) at exchange-local midnights, one window per local date."""
+    start_date, end_date = derive_trading_date_bounds(
+        exchange=exchange,
+        start_ts_us=start_ts_us,
+        end_ts_us=end_ts_us,
+    )
+
+    windows: list[tuple[int, int]] = []
+    lower = start_ts_us
+    day = start_date
+    while day < end_date:
+        day += timedelta(days=1)
+        upper = local_midnight_ts_us(exchange=exchange, day=day)
+        windows.append((lower, upper))
+        lower = upper
+    windows.append((lower, end_ts_us))
+    return windows
@@ -0,0 +1,236 @@
+"""L2 order book reconstruction from v2 ``orderbook_updates``.
+
+Incremental L2 rows set the resting quantity at one ``(side, price)`` level; ``qty == 0``
+deletes the level and a snapshot run (consecutive ``is_snapshot`` rows at one timestamp)
+replaces the whole book. Resets, emission points and, for spine sampling, the collapse of
+superseded level updates are computed as column expressions; only the remaining level
+writes go through a small sequential kernel over sorted int64 price arrays.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+
+import polars as pl
+import pyarrow as pa
+
+_REQUIRED_COLUMNS = ("ts_event_us", "side", "price", "qty", "is_snapshot")
+_LEVEL_COLUMNS = ("bid_price_levels", "bid_qty_levels", "ask_price_levels", "ask_qty_levels")
+_LEVELS_DTYPE = pl.List(pl.Int64)
+
+
+def reconstruct_book(
+    updates: pl.DataFrame,
+    *,
+    depth: int = 5,
+    spine: pl.DataFrame | None = None,
+    by: tuple[str, ...] = ("exchange", "symbol"),
+) -> pl.DataFrame:
+    """Replay ``orderbook_updates`` into top-``depth`` book states per ``by`` group.
+
+    ``updates`` must be in replay order within each group (as returned by
+    ``load_events``). Levels are emitted as ``*_levels`` list columns (best first,
+    scaled Int64), matching ``cn_l2_snapshots``.
+
+    Without ``spine``, one row is emitted per distinct ``ts_event_us`` after all
+    updates at that timestamp are applied. With ``spine``, every spine row gets the
+    book as of its bar end, built from updates with ``ts_event_us < ts_spine_us`` (the
+    ``align_to_spine`` boundary rule); groups with no updates yet get empty levels.
+    """
+    if depth < 1:
+        raise ValueError(f"depth must be >= 1, got {depth}")
+    missing = [name for name in (*by, *_REQUIRED_COLUMNS) if name not in updates.columns]
+    if missing:
+        raise ValueError(f"updates missing required columns: {missing}")
+    null_columns = [
+        name for name in ("side", "price", "qty") if updates.get_column(name).has_nulls()
+    ]
+    if null_columns:
+        raise ValueError(f"updates have null values in: {null_columns}")
+    sides = set(updates.get_column("side").unique().to_list())
+    if not sides <= {"bid", "ask"}:
+        raise ValueError(f"side must be 'bid' or 'ask', got {sorted(sides - {'bid', 'ask'})}")
+
+    keys = list(by)
+    prepared = updates.select(
+        *keys,
+        "ts_event_us",
+        (pl.col("side") == "bid").alias("_is_bid"),
+        "price",
+        "qty",
+        _snapshot_reset_expr(keys).alias("_reset"),
+    ).with_columns(pl.col("_reset").cum_sum().over(keys).alias("_epoch"))
+
+    if spine is None:
+        return _book_at_updates(prepared, keys=keys, depth=depth)
+
+    for key in (*keys, "ts_spine_us"):
+        if key not in spine.columns:
+            raise ValueError(f"spine missing required column: {key}")
+    return _book_on_spine(prepared, spine, keys=keys, depth=depth)
+
+
+def _snapshot_reset_expr(keys: list[str]) -> pl.Expr:
+    """True on the first row of each snapshot run; the book is cleared before it."""
+    previous_snapshot = pl.col("is_snapshot").shift(1).over(keys).fill_null(False)
+    previous_ts = pl.col("ts_event_us").shift(1).over(keys)
+    new_run = ~previous_snapshot | (pl.col("ts_event_us") != previous_ts).fill_null(True)
+    return pl.col("is_snapshot") & new_run
+
+
+def _book_at_updates(prepared: pl.DataFrame, *, keys: list[str], depth: int) -> pl.DataFrame:
+    frames: list[pl.DataFrame] = []
+    for group in prepared.partition_by(keys, maintain_order=True):
+        ts = group.get_column("ts_event_us")
+        # Emit after the last update of each timestamp so a message is applied whole.
+        emit_rows = (ts != ts.shift(-1)).fill_null(True).arg_true()
+        levels = _replay_levels(group, cuts=(emit_rows + 1).to_list(), depth=depth)
+        frames.append(group.select(*keys, "ts_event_us")[emit_rows].with_columns(levels))
+    if not frames:
+        return pl.DataFrame(
+            schema={
+                **prepared.select(*keys, "ts_event_us").schema,
+                **dict.fromkeys(_LEVEL_COLUMNS, _LEVELS_DTYPE),
+            }
+        )
+    return pl.concat(frames)
+
+
+def _book_on_spine(
+    prepared: pl.DataFrame,
+    spine: pl.DataFrame,
+    *,
+    keys: list[str],
+    depth: int,
+) -> pl.DataFrame:
+    groups = prepared.partition_by(keys, as_dict=True, maintain_order=True)
+    frames: list[pl.DataFrame] = []
+    for key, spine_group in spine.partition_by(keys, as_dict=True, maintain_order=True).items():
+        spine_group = spine_group.sort("ts_spine_us")
+        group = groups.get(key)
+        if group is None:
+            group = prepared.clear()
+
+        # Bucket j holds updates in [spine[j-1], spine[j]); only the last write to each
+        # level within a bucket and snapshot epoch can be observed at a bar end.
+        bucket = spine_group.get_column("ts_spine_us").search_sorted(
+            group.get_column("ts_event_us"), side="right"
+        )
+        collapsed = (
+            group.with_columns(bucket.alias("_bucket"))
+            .filter(pl.struct("_bucket", "_epoch", "_is_bid", "price").is_last_distinct())
+            .with_columns(
+                (pl.col("_epoch") != pl.col("_epoch").shift(1)).fill_null(True).alias("_reset")
+            )
+        )
+        cuts = collapsed.get_column("_bucket").search_sorted(
+            pl.Series(range(spine_group.height), dtype=pl.UInt32), side="right"
+        )
+        levels = _replay_levels(collapsed, cuts=cuts.to_list(), depth=depth)
+        frames.append(spine_group.with_columns(levels))
+    if not frames:
+        return spine.clear().with_columns(
+            pl.lit(None, dtype=_LEVELS_DTYPE).alias(name) for name in _LEVEL_COLUMNS
+        )
+    return pl.concat(frames)
+
+
+def _replay_levels(
+    rows: pl.DataFrame,
+    *,
+    cuts: list[int],
+    depth: int,
+) -> list[pl.Series]:
+    """Apply ``rows`` in order, taking the top ``depth`` levels once ``cuts[i]`` rows are in.
+
+    Each side keeps its live prices in an ascending int64 array plus a price -> qty map.
+    A new top-of-book state is materialized only when an update lands inside the top
+    ``depth`` levels (or resets the book); emissions in between gather the last state.
+    """
+    emits = [0] * (rows.height + 1)
+    for cut in cuts:
+        emits[cut] += 1
+
+    bid_prices: array[int] = array("q")
+    ask_prices: array[int] = array("q")
+    bid_sizes: dict[int, int] = {}
+    ask_sizes: dict[int, int] = {}
+    out_bid_prices: array[int] = array("q")
+    out_bid_qtys: array[int] = array("q")
+    out_ask_prices: array[int] = array("q")
+    out_ask_qtys: array[int] = array("q")
+    bid_offsets: array[int] = array("q", [0])
+    ask_offsets: array[int] = array("q", [0])
+    state_ids: array[int] = array("q")
+
+    def materialize() -> None:
+        top_bids = bid_prices[: -depth - 1 : -1]
+        top_asks = ask_prices[:depth]
+        out_bid_prices.extend(top_bids)
+        out_bid_qtys.extend([bid_sizes[price] for price in top_bids])
+        out_ask_prices.extend(top_asks)
+        out_ask_qtys.extend([ask_sizes[price] for price in top_asks])
+        bid_offsets.append(len(out_bid_prices))
+        ask_offsets.append(len(out_ask_prices))
+
+    materialize()
+    state_ids.extend([0] * emits[0])
+    state = 0
+    dirty = False
+    for is_bid, price, qty, reset, n_emit in zip(
+        rows.get_column("_is_bid").to_list(),
+        rows.get_column("price").to_list(),
+        rows.get_column("qty").to_list(),
+        rows.get_column("_reset").to_list(),
+        emits[1:],
+        strict=True,
+    ):
+        if reset:
+            del bid_prices[:]
+            del ask_prices[:]
+            bid_sizes.clear()
+            ask_sizes.clear()
+            dirty = True
+        if is_bid:
+            levels, sizes = bid_prices, bid_sizes
+            if len(levels) < depth or price >= levels[-depth]:
+                dirty = True
+        else:
+            levels, sizes = ask_prices, ask_sizes
+            if len(levels) < depth or price <= levels[depth - 1]:
+                dirty = True
+        if qty > 0:
+            if price not in sizes:
+                insort(levels, price)
+            sizes[price] = qty
+        elif price in sizes:
+            del sizes[price]
+            del levels[bisect_left(levels, price)]
+
+        if n_emit:
+            if dirty:
+                materialize()
+                state += 1
+                dirty = False
+            if n_emit == 1:
+                state_ids.append(state)
+            else:
+                state_ids.extend([state] * n_emit)
+
+    gather = pl.Series(state_ids, dtype=pl.Int64)
+    return [
+        _list_series(_LEVEL_COLUMNS[0], bid_offsets, out_bid_prices).gather(gather),
+        _list_series(_LEVEL_COLUMNS[1], bid_offsets, out_bid_qtys).gather(gather),
+        _list_series(_LEVEL_COLUMNS[2], ask_offsets, out_ask_prices).gather(gather),
+        _list_series(_LEVEL_COLUMNS[3], ask_offsets, out_ask_qtys).gather(gather),
+    ]
+
+
+def _list_series(name: str, offsets: array[int], values: array[int]) -> pl.Series:
+    """Zero-copy ``List(Int64)`` series over flat int64 ``values`` split at ``offsets``."""
+    list_array = pa.LargeListArray.from_arrays(
+        pa.Array.from_buffers(pa.int64(), len(offsets), [None, pa.py_buffer(offsets)]),
+        pa.Array.from_buffers(pa.int64(), len(values), [None, pa.py_buffer(values)]),
+    )
+    return pl.Series(name, list_array, dtype=_LEVELS_DTYPE)
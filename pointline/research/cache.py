@@ -0,0 +1,165 @@
+"""Opt-in on-disk cache for research query results.
+
+Entries are uncompressed Arrow IPC files named by a digest of the query key, so a hit is
+a memory-mapped read instead of a Delta scan. Keys embed a fingerprint of the Delta data
+files a query touches; any ingest, compaction or rewrite of those partitions produces a
+new key, and the superseded entries age out through LRU eviction by total bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+import polars as pl
+from deltalake import DeltaTable
+
+_ENTRY_SUFFIX = ".arrow"
+_DEFAULT_MAX_BYTES = 8 * 1024**3
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class QueryCache:
+    """LRU cache of query results under ``cache_dir``, bounded by ``max_bytes``.
+
+    Recency is tracked with file modification times, so it survives process restarts.
+    Results larger than ``max_bytes`` are returned but not stored.
+    """
+
+    def __init__(self, cache_dir: Path, *, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got {max_bytes}")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        entries = self._entries()
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(entries),
+            size_bytes=sum(size for _, size, _ in entries),
+        )
+
+    def get(self, key: Mapping[str, object]) -> pl.DataFrame | None:
+        path = self._entry_path(key)
+        try:
+            frame = pl.read_ipc(path, memory_map=True)
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return frame
+
+    def put(self, key: Mapping[str, object], frame: pl.DataFrame) -> None:
+        if frame.estimated_size() > self.max_bytes:
+            return
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        frame.write_ipc(tmp_path, compression="uncompressed")
+        if tmp_path.stat().st_size > self.max_bytes:
+            tmp_path.unlink()
+            return
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+
+    def get_or_compute(
+        self,
+        key: Mapping[str, object],
+        compute: Callable[[], pl.DataFrame],
+    ) -> pl.DataFrame:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        frame = compute()
+        self.put(key, frame)
+        return frame
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: Mapping[str, object]) -> Path:
+        payload = json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+        return self.cache_dir / f"{hashlib.sha256(payload).hexdigest()}{_ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, int, int]]:
+        entries: list[tuple[Path, int, int]] = []
+        for path in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _evict(self, *, keep: Path) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+
+def delta_add_actions(path: Path, *, version: int | None = None) -> pl.DataFrame:
+    """Flattened add actions (one row per live data file) of the Delta table at ``path``."""
+    if not path.exists():
+        return pl.DataFrame(schema={"path": pl.Utf8})
+    return pl.DataFrame(DeltaTable(str(path), version=version).get_add_actions(flatten=True))
+
+
+def delta_fingerprint(
+    add_actions: pl.DataFrame,
+    *,
+    date_bounds: Mapping[str, tuple[date, date]] | None = None,
+) -> str:
+    """Digest of the live data files, optionally limited to touched partitions.
+
+    ``date_bounds`` maps exchange to an inclusive ``trading_date`` range. Appends to other
+    partitions leave the fingerprint unchanged; any add/remove within them changes it.
+    """
+    files = add_actions
+    if date_bounds is not None and not files.is_empty():
+        predicate = pl.lit(False)
+        for exchange, (start_date, end_date) in date_bounds.items():
+            predicate = predicate | (
+                (pl.col("partition.exchange") == exchange)
+                & pl.col("partition.trading_date").is_between(start_date, end_date)
+            )
+        files = files.filter(predicate)
+
+    digest = hashlib.sha256()
+    for file_path in sorted(files.get_column("path").to_list()):
+        digest.update(file_path.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,348 @@
+"""CN (SSE/SZSE) L3 order book reconstruction from order-by-order events.
+
+``cn_order_events`` and ``cn_tick_events`` are merged into one feed per symbol and
+replayed into an order map (order_ref -> side, price, remaining qty) plus per-price
+level aggregates (total qty, order count).
+
+Event semantics:
+
+- SZSE: every order row is an ADD carrying the full order qty. Fills and cancels both
+  arrive as tick rows (``TRADE`` / ``CANCEL``) referencing orders by ``*_order_ref``.
+  Both tables share one per-channel sequence, so the merge key is ``channel_seq``.
+- SSE: order rows are ADD (resting balance after any immediate fills) or CANCEL; ticks
+  are fills only. Orders and ticks have separate sequence spaces, so the merge key is
+  ``channel_biz_seq`` when the group carries it, else ``(ts_event_us, tick first,
+  channel_seq)``.
+- Cancels withdraw the whole remaining order (CN markets have no partial cancel).
+  Fills reduce each referenced order that is in the map; aggressors not yet published
+  (SSE) are ignored. Orders without a positive price (market / best-own orders) are
+  tracked for fills and cancels but never rest on a price level.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+
+import polars as pl
+
+from pointline.research.book import _LEVELS_DTYPE, _list_series
+
+_ADD = 0
+_CANCEL = 1
+_TRADE = 2
+
+_ORDER_COLUMNS = (
+    "exchange",
+    "ts_event_us",
+    "channel_id",
+    "channel_seq",
+    "channel_biz_seq",
+    "order_ref",
+    "event_kind",
+    "side",
+    "price",
+    "qty",
+)
+_TICK_COLUMNS = (
+    "exchange",
+    "ts_event_us",
+    "channel_id",
+    "channel_seq",
+    "channel_biz_seq",
+    "bid_order_ref",
+    "ask_order_ref",
+    "event_kind",
+    "price",
+    "qty",
+)
+_LEVEL_COLUMNS = (
+    "bid_price_levels",
+    "bid_qty_levels",
+    "bid_order_count_levels",
+    "ask_price_levels",
+    "ask_qty_levels",
+    "ask_order_count_levels",
+)
+
+
+def reconstruct_cn_book(
+    order_events: pl.DataFrame,
+    tick_events: pl.DataFrame,
+    *,
+    depth: int = 10,
+    spine: pl.DataFrame | None = None,
+    by: tuple[str, ...] = ("exchange", "symbol"),
+) -> pl.DataFrame:
+    """Replay CN order and tick events into top-``depth`` book states per ``by`` group.
+
+    Levels are emitted with the ``cn_l2_snapshots`` list columns (best first, scaled
+    Int64), including per-level order counts. Without ``spine``, one row is emitted after
+    every merged event. With ``spine``, every spine row gets the book built from events
+    with ``ts_event_us < ts_spine_us`` (the ``align_to_spine`` boundary rule).
+    """
+    if depth < 1:
+        raise ValueError(f"depth must be >= 1, got {depth}")
+    for name, frame, required in (
+        ("order_events", order_events, _ORDER_COLUMNS),
+        ("tick_events", tick_events, _TICK_COLUMNS),
+    ):
+        missing = [col for col in (*by, *required) if col not in frame.columns]
+        if missing:
+            raise ValueError(f"{name} missing required columns: {missing}")
+        exchanges = set(frame.get_column("exchange").unique().drop_nulls().to_list())
+        if not exchanges <= {"sse", "szse"}:
+            raise ValueError(
+                f"{name}: only sse/szse are supported, got {sorted(exchanges - {'sse', 'szse'})}"
+            )
+
+    keys = list(by)
+    events = _merged_events(order_events, tick_events, keys=keys)
+
+    if spine is None:
+        frames = [
+            group.select(*keys, "ts_event_us", "channel_id", "channel_seq").with_columns(
+                _replay_orders(group, cuts=list(range(1, group.height + 1)), depth=depth)
+            )
+            for group in events.partition_by(keys, maintain_order=True)
+        ]
+        if not frames:
+            return pl.DataFrame(
+                schema={
+                    **events.select(*keys, "ts_event_us", "channel_id", "channel_seq").schema,
+                    **dict.fromkeys(_LEVEL_COLUMNS, _LEVELS_DTYPE),
+                }
+            )
+        return pl.concat(frames)
+
+    for key in (*keys, "ts_spine_us"):
+        if key not in spine.columns:
+            raise ValueError(f"spine missing required column: {key}")
+    groups = events.partition_by(keys, as_dict=True, maintain_order=True)
+    frames = []
+    for key, spine_group in spine.partition_by(keys, as_dict=True, maintain_order=True).items():
+        spine_group = spine_group.sort("ts_spine_us")
+        group = groups.get(key)
+        if group is None:
+            group = events.clear()
+        # Feed order is by sequence; a running max keeps the cut points monotone.
+        cuts = (
+            group.get_column("ts_event_us")
+            .cum_max()
+            .search_sorted(spine_group.get_column("ts_spine_us"), side="left")
+        )
+        frames.append(
+            spine_group.with_columns(_replay_orders(group, cuts=cuts.to_list(), depth=depth))
+        )
+    if not frames:
+        return spine.clear().with_columns(
+            pl.lit(None, dtype=_LEVELS_DTYPE).alias(name) for name in _LEVEL_COLUMNS
+        )
+    return pl.concat(frames)
+
+
+def _merged_events(
+    order_events: pl.DataFrame,
+    tick_events: pl.DataFrame,
+    *,
+    keys: list[str],
+) -> pl.DataFrame:
+    """Normalize both tables to one action stream and put it in feed order."""
+    common = [
+        *keys,
+        pl.col("exchange").alias("_exchange"),
+        "ts_event_us",
+        "channel_id",
+        "channel_seq",
+        "channel_biz_seq",
+    ]
+    orders = order_events.filter(
+        (pl.col("event_kind") == "CANCEL")
+        | ((pl.col("event_kind") == "ADD") & pl.col("side").is_in(["BUY", "SELL"]))
+    ).select(
+        *common,
+        pl.lit(1, dtype=pl.Int8).alias("_source"),
+        pl.when(pl.col("event_kind") == "ADD")
+        .then(pl.lit(_ADD, dtype=pl.Int8))
+        .otherwise(pl.lit(_CANCEL, dtype=pl.Int8))
+        .alias("_action"),
+        (pl.col("side") == "BUY").alias("_is_bid"),
+        "price",
+        "qty",
+        pl.col("order_ref").alias("_ref"),
+        pl.lit(None, dtype=pl.Int64).alias("_ref2"),
+    )
+    is_trade = pl.col("event_kind") == "TRADE"
+    ticks = tick_events.filter(pl.col("event_kind").is_in(["TRADE", "CANCEL"])).select(
+        *common,
+        pl.lit(0, dtype=pl.Int8).alias("_source"),
+        pl.when(is_trade)
+        .then(pl.lit(_TRADE, dtype=pl.Int8))
+        .otherwise(pl.lit(_CANCEL, dtype=pl.Int8))
+        .alias("_action"),
+        pl.lit(None, dtype=pl.Boolean).alias("_is_bid"),
+        "price",
+        "qty",
+        pl.when(is_trade | (pl.col("bid_order_ref").fill_null(0) > 0))
+        .then(pl.col("bid_order_ref"))
+        .otherwise(pl.col("ask_order_ref"))
+        .alias("_ref"),
+        pl.when(is_trade).then(pl.col("ask_order_ref")).alias("_ref2"),
+    )
+
+    events = pl.concat([orders, ticks])
+    is_sse = pl.col("_exchange") == "sse"
+    use_biz_seq = is_sse & pl.col("channel_biz_seq").is_not_null().all().over(keys)
+    time_ordered = is_sse & ~use_biz_seq
+    return events.sort(
+        *keys,
+        "channel_id",
+        pl.when(use_biz_seq)
+        .then(pl.col("channel_biz_seq"))
+        .when(time_ordered)
+        .then(pl.col("ts_event_us"))
+        .otherwise(pl.col("channel_seq")),
+        pl.when(time_ordered).then(pl.col("_source")).otherwise(0),
+        pl.when(time_ordered).then(pl.col("channel_seq")).otherwise(0),
+        maintain_order=True,
+    )
+
+
+def _replay_orders(rows: pl.DataFrame, *, cuts: list[int], depth: int) -> list[pl.Series]:
+    """Apply merged events in order, taking the top ``depth`` levels at each cut.
+
+    Levels are keyed by a signed price (``-price`` for bids, ``price`` for asks) so each
+    side is an ascending, best-first int64 array and both share one qty / order-count
+    map. Orders live in parallel int64 arrays (level key, remaining qty) indexed through
+    an ``order_ref -> slot`` map; unpriced orders get key 0 and never touch a level. A
+    side's top levels are materialized only when an event touches its top ``depth``
+    levels; emissions in between gather the last state.
+    """
+    emits = [0] * (rows.height + 1)
+    for cut in cuts:
+        emits[cut] += 1
+
+    order_slots: dict[int, int] = {}
+    order_keys: array[int] = array("q")
+    order_qtys: array[int] = array("q")
+
+    bid_keys: array[int] = array("q")
+    ask_keys: array[int] = array("q")
+    level_qtys: dict[int, int] = {}
+    level_counts: dict[int, int] = {}
+
+    outputs = [array("q") for _ in _LEVEL_COLUMNS]
+    bid_offsets: array[int] = array("q", [0])
+    ask_offsets: array[int] = array("q", [0])
+    bid_state_ids: array[int] = array("q")
+    ask_state_ids: array[int] = array("q")
+    # Sides are materialized independently: most events touch only one of them.
+    bid_dirty = False
+    ask_dirty = False
+
+    def touch(key: int, qty_delta: int, count_delta: int) -> None:
+        nonlocal bid_dirty, ask_dirty
+        levels = bid_keys if key < 0 else ask_keys
+        if len(levels) < depth or key <= levels[depth - 1]:
+            if key < 0:
+                bid_dirty = True
+            else:
+                ask_dirty = True
+        if key in level_counts:
+            count = level_counts[key] + count_delta
+            if count <= 0:
+                del level_qtys[key]
+                del level_counts[key]
+                del levels[bisect_left(levels, key)]
+            else:
+                level_qtys[key] += qty_delta
+                level_counts[key] = count
+        elif count_delta > 0:
+            insort(levels, key)
+            level_qtys[key] = qty_delta
+            level_counts[key] = count_delta
+
+    def fill(ref: int | None, qty: int) -> None:
+        slot = order_slots.get(ref)
+        if slot is None:
+            return
+        remaining = order_qtys[slot]
+        filled = min(qty, remaining)
+        order_qtys[slot] = remaining - filled
+        done = filled == remaining
+        if done:
+            del order_slots[ref]
+        if order_keys[slot]:
+            touch(order_keys[slot], -filled, -1 if done else 0)
+
+    def materialize_bids() -> None:
+        top = bid_keys[:depth]
+        outputs[0].extend([-key for key in top])
+        outputs[1].extend([level_qtys[key] for key in top])
+        outputs[2].extend([level_counts[key] for key in top])
+        bid_offsets.append(len(outputs[0]))
+
+    def materialize_asks() -> None:
+        top = ask_keys[:depth]
+        outputs[3].extend(top)
+        outputs[4].extend([level_qtys[key] for key in top])
+        outputs[5].extend([level_counts[key] for key in top])
+        ask_offsets.append(len(outputs[3]))
+
+    materialize_bids()
+    materialize_asks()
+    bid_state_ids.extend([0] * emits[0])
+    ask_state_ids.extend([0] * emits[0])
+    bid_state = 0
+    ask_state = 0
+    for action, is_bid, price, qty, ref, ref2, n_emit in zip(
+        rows.get_column("_action").to_list(),
+        rows.get_column("_is_bid").to_list(),
+        rows.get_column("price").to_list(),
+        rows.get_column("qty").to_list(),
+        rows.get_column("_ref").to_list(),
+        rows.get_column("_ref2").to_list(),
+        emits[1:],
+        strict=True,
+    ):
+        if action == _ADD:
+            if ref not in order_slots and qty > 0:
+                key = (-price if is_bid else price) if price > 0 else 0
+                order_slots[ref] = len(order_qtys)
+                order_keys.append(key)
+                order_qtys.append(qty)
+                if key:
+                    touch(key, qty, 1)
+        elif action == _CANCEL:
+            slot = order_slots.pop(ref, None)
+            if slot is not None and order_keys[slot]:
+                touch(order_keys[slot], -order_qtys[slot], -1)
+        else:
+            fill(ref, qty)
+            fill(ref2, qty)
+
+        if n_emit:
+            if bid_dirty:
+                materialize_bids()
+                bid_state += 1
+                bid_dirty = False
+            if ask_dirty:
+                materialize_asks()
+                ask_state += 1
+                ask_dirty = False
+            if n_emit == 1:
+                bid_state_ids.append(bid_state)
+                ask_state_ids.append(ask_state)
+            else:
+                bid_state_ids.extend([bid_state] * n_emit)
+                ask_state_ids.extend([ask_state] * n_emit)
+
+    bid_gather = pl.Series(bid_state_ids, dtype=pl.Int64)
+    ask_gather = pl.Series(ask_state_ids, dtype=pl.Int64)
+    return [
+        _list_series(name, bid_offsets, values).gather(bid_gather)
+        for name, values in zip(_LEVEL_COLUMNS[:3], outputs[:3], strict=True)
+    ] + [
+        _list_series(name, ask_offsets, values).gather(ask_gather)
+        for name, values in zip(_LEVEL_COLUMNS[3:], outputs[3:], strict=True)
+    ]
@@ -6,8 +6,9 @@ from pathlib import Path
 
 import polars as pl
 
-from pointline.research._time import TimestampInput, normalize_ts_us
+from pointline.research._time import TimestampInput, normalize_as_of_time, normalize_ts_us
 from pointline.schemas.dimensions import DIM_SYMBOL
+from pointline.storage.delta._utils import resolve_delta_version
 from pointline.storage.delta.dimension_store import DeltaDimensionStore
 
 
@@ -18,6 +19,8 @@ def load_symbol_meta(
     symbols: str | list[str] | None = None,
     as_of: TimestampInput | None = None,
     columns: list[str] | None = None,
+    as_of_version: int | None = None,
+    as_of_time: TimestampInput | None = None,
 ) -> pl.DataFrame:
     """Load canonical symbol metadata explicitly (no event join side effects).
 
@@ -26,6 +29,9 @@ def load_symbol_meta(
     - If ``as_of`` is provided, returns rows valid at that timestamp.
     - ``symbols`` filters by exchange_symbol (single or many).
     - ``columns`` projects output columns; default is full DIM_SYMBOL schema.
+    - ``as_of_version`` / ``as_of_time`` pin the dim_symbol table state (Delta
+      version, or the version current at that time); ``as_of`` still selects
+      validity windows within that state.
     """
     exchange_norm = exchange.strip().lower()
     if not exchange_norm:
@@ -33,7 +39,13 @@ def load_symbol_meta(
 
     selected_cols = _resolve_columns(columns)
 
-    dim = DeltaDimensionStore(silver_root=silver_root).load_dim_symbol()
+    store = DeltaDimensionStore(silver_root=silver_root)
+    version = resolve_delta_version(
+        store.dim_symbol_path,
+        version=as_of_version,
+        as_of_ts_us=normalize_as_of_time(as_of_version=as_of_version, as_of_time=as_of_time),
+    )
+    dim = store.load_dim_symbol(version=version)
     if dim.is_empty():
         return _empty_result(selected_cols)
 
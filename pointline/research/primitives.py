@@ -8,6 +8,7 @@ import polars as pl
 
 from pointline.schemas.dimensions import DIM_SYMBOL
 from pointline.schemas.registry import get_table_spec
+from pointline.schemas.types import TableSpec
 from pointline.storage.delta.dimension_store import DeltaDimensionStore
 
 
@@ -47,8 +48,22 @@ def decode_scaled_columns(
     if not in_place and not suffix:
         raise ValueError("suffix must be non-empty when in_place=False")
 
+    exprs = _decode_exprs(spec, target_cols, in_place=in_place, suffix=suffix)
+    if not exprs:
+        return df
+    return df.with_columns(exprs)
+
+
+def _decode_exprs(
+    spec: TableSpec,
+    columns: list[str],
+    *,
+    in_place: bool,
+    suffix: str = "_decoded",
+) -> list[pl.Expr]:
+    """Build decode expressions; usable on eager frames and inside lazy scan plans."""
     exprs: list[pl.Expr] = []
-    for col in target_cols:
+    for col in columns:
         scale = spec.scale_for(col)
         if scale is None:
             continue
@@ -60,10 +75,7 @@ def decode_scaled_columns(
 
         out_col = col if in_place else f"{col}{suffix}"
         exprs.append(decoded.alias(out_col))
-
-    if not exprs:
-        return df
-    return df.with_columns(exprs)
+    return exprs
 
 
 def join_symbol_meta(
@@ -72,11 +84,16 @@ def join_symbol_meta(
     silver_root: Path,
     columns: list[str],
     ts_col: str = "ts_event_us",
+    validate: bool = True,
 ) -> pl.DataFrame:
     """Attach PIT symbol metadata from dim_symbol to event rows.
 
-    Joins on ``exchange`` + ``symbol_id`` and applies interval semantics:
-    ``valid_from_ts_us <= ts_col < valid_until_ts_us``.
+    ``symbol_id`` identifies one SCD2 version, so metadata is attached with a single
+    hash join on ``symbol_id`` against the deduplicated dim projection. With
+    ``validate`` the interval semantics are asserted instead of joined on: every
+    matched row must have the version's ``exchange`` and
+    ``valid_from_ts_us <= ts_col < valid_until_ts_us``. Rows whose ``symbol_id`` is
+    not in dim_symbol get null metadata.
     """
     meta_cols = _resolve_meta_columns(columns)
     if not meta_cols:
@@ -96,38 +113,40 @@ def join_symbol_meta(
         )
 
     dim = DeltaDimensionStore(silver_root=silver_root).load_dim_symbol()
-    if dim.is_empty():
-        return df.with_columns(
-            [pl.lit(None, dtype=dim_schema[col]).alias(col) for col in meta_cols]
-        )
-
-    pairs = df.select(["exchange", "symbol_id"]).unique()
-    dim = dim.join(pairs, on=["exchange", "symbol_id"], how="inner")
-    if dim.is_empty():
-        return df.with_columns(
-            [pl.lit(None, dtype=dim_schema[col]).alias(col) for col in meta_cols]
-        )
-
-    dim_cols = ["exchange", "symbol_id", "valid_from_ts_us", "valid_until_ts_us", *meta_cols]
-    rows = df.with_row_index("_row_id")
-    matches = rows.join(
-        dim.select(dim_cols),
-        on=["exchange", "symbol_id"],
+    check_cols = ["_dim_exchange", "_dim_valid_from", "_dim_valid_until"] if validate else []
+    versions = dim.select(
+        pl.col("symbol_id").cast(df.schema["symbol_id"]),
+        pl.col("exchange").alias("_dim_exchange"),
+        pl.col("valid_from_ts_us").alias("_dim_valid_from"),
+        pl.col("valid_until_ts_us").alias("_dim_valid_until"),
+        *meta_cols,
+    ).unique(subset="symbol_id", keep="first", maintain_order=True)
+    out = df.join(
+        versions.select("symbol_id", *check_cols, *meta_cols),
+        on="symbol_id",
         how="left",
-    ).filter(
-        (pl.col("valid_from_ts_us") <= pl.col(ts_col))
-        & (pl.col(ts_col) < pl.col("valid_until_ts_us"))
-    )
-
-    if matches.is_empty():
-        return rows.with_columns(
-            [pl.lit(None, dtype=dim_schema[col]).alias(col) for col in meta_cols]
-        ).drop("_row_id")
-
-    per_row_meta = matches.group_by("_row_id").agg(
-        [pl.col(col).first().alias(col) for col in meta_cols]
+        validate="m:1",
+        maintain_order="left",
     )
-    return rows.join(per_row_meta, on="_row_id", how="left").drop("_row_id")
+    if not validate:
+        return out
+
+    outside = out.select(
+        (
+            pl.col("_dim_exchange").is_not_null()
+            & (
+                (pl.col("_dim_exchange") != pl.col("exchange"))
+                | (pl.col(ts_col) < pl.col("_dim_valid_from"))
+                | (pl.col(ts_col) >= pl.col("_dim_valid_until"))
+            )
+        ).sum()
+    ).item()
+    if outside:
+        raise ValueError(
+            f"{outside} event rows fall outside the exchange/validity window of their "
+            "dim_symbol symbol_id; pass validate=False to skip this check"
+        )
+    return out.drop(check_cols)
 
 
 def _resolve_meta_columns(columns: list[str]) -> list[str]:
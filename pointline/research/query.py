@@ -2,81 +2,700 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
 from pathlib import Path
 
 import polars as pl
 
-from pointline.research._time import TimestampInput, derive_trading_date_bounds, normalize_ts_us
+from pointline.research._time import (
+    TimestampInput,
+    derive_trading_date_bounds,
+    normalize_as_of_time,
+    normalize_ts_us,
+)
+from pointline.research.cache import QueryCache, delta_fingerprint
+from pointline.research.primitives import _decode_exprs
 from pointline.schemas.registry import get_table_spec
+from pointline.schemas.types import TableSpec
+from pointline.storage.delta._utils import resolve_delta_version
+from pointline.storage.delta.file_index import FILE_INDEX_SCHEMA, DeltaFileIndex
 from pointline.storage.delta.layout import table_path
 
+# Replay order within a stream; table precedence is inserted after ts_event_us.
+_STREAM_KEYS = ["ts_event_us", "file_id", "file_seq"]
+
 
 def load_events(
     *,
     silver_root: Path,
     table: str,
-    exchange: str,
-    symbol: str,
+    exchange: str | list[str],
+    symbol: str | list[str],
     start: TimestampInput,
     end: TimestampInput,
     columns: list[str] | None = None,
     include_lineage: bool = False,
+    decode: bool | list[str] = False,
+    decode_in_place: bool = False,
+    as_of_version: int | None = None,
+    as_of_time: TimestampInput | None = None,
+    cache: QueryCache | None = None,
 ) -> pl.DataFrame:
     """Load event rows from one canonical v2 event table.
 
+    ``exchange`` and ``symbol`` accept one value or a list; all requested
+    ``(exchange, symbol)`` combinations are read in a single scan with
+    per-exchange trading-date partition pruning.
+
     Notes:
     - No implicit dim_symbol join is performed.
     - Time window is ``[start, end)`` on ``ts_event_us``.
+    - Rows are sorted by the table's tie-break keys.
+    - With ``cache``, results are reused until the touched partitions change.
+    - ``decode`` (``True`` or a list of scaled columns) adds Float64
+      ``<column>_decoded`` columns in the scan pass, like
+      :func:`decode_scaled_columns`; ``decode_in_place`` replaces the scaled
+      ints instead.
+    - ``as_of_version`` / ``as_of_time`` read the table as of a committed Delta
+      version or the version current at a timestamp, for reproducible reruns.
+    """
+    query = _prepare_query(
+        silver_root=silver_root,
+        table=table,
+        exchange=exchange,
+        symbol=symbol,
+        start=start,
+        end=end,
+        columns=columns,
+        include_lineage=include_lineage,
+        decode=decode,
+        decode_in_place=decode_in_place,
+        as_of_version=as_of_version,
+        as_of_time=as_of_time,
+    )
+    return _collect_query(
+        query,
+        files=_candidate_files(query),
+        date_range=None,
+        cache=cache,
+    )
+
+
+def scan_events(
+    *,
+    silver_root: Path,
+    table: str,
+    exchange: str | list[str],
+    symbol: str | list[str],
+    start: TimestampInput,
+    end: TimestampInput,
+    columns: list[str] | None = None,
+    include_lineage: bool = False,
+    decode: bool | list[str] = False,
+    decode_in_place: bool = False,
+    as_of_version: int | None = None,
+    as_of_time: TimestampInput | None = None,
+) -> pl.LazyFrame:
+    """Lazy counterpart of :func:`load_events`.
+
+    The returned plan carries the same partition, symbol and time filters and
+    ends with the tie-break sort, so ordering is still deterministic when it is
+    collected. Callers can chain further filters, projections, aggregations or
+    joins before collecting (e.g. ``collect(engine="streaming")``) and Polars
+    pushes them into the scan.
+    """
+    query = _prepare_query(
+        silver_root=silver_root,
+        table=table,
+        exchange=exchange,
+        symbol=symbol,
+        start=start,
+        end=end,
+        columns=columns,
+        include_lineage=include_lineage,
+        decode=decode,
+        decode_in_place=decode_in_place,
+        as_of_version=as_of_version,
+        as_of_time=as_of_time,
+    )
+    source = _scan_files(query, _candidate_files(query))
+    return _scan_query(query, source=source, date_range=None)
+
+
+def iter_events(
+    *,
+    silver_root: Path,
+    table: str,
+    exchange: str | list[str],
+    symbol: str | list[str],
+    start: TimestampInput,
+    end: TimestampInput,
+    columns: list[str] | None = None,
+    include_lineage: bool = False,
+    decode: bool | list[str] = False,
+    decode_in_place: bool = False,
+    as_of_version: int | None = None,
+    as_of_time: TimestampInput | None = None,
+    chunk: str = "1d",
+    prefetch: bool = False,
+    cache: QueryCache | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Yield events in exchange-local trading-date chunks at bounded memory.
+
+    ``chunk`` is ``"<N>d"``: each yielded frame holds ``N`` consecutive
+    ``trading_date`` partitions and is sorted by tie-break keys. Concatenating
+    the chunks gives the same rows as :func:`load_events`, grouped by trading
+    date first. Empty chunks are skipped. With ``prefetch=True`` the next chunk
+    is read on a background thread while the caller processes the current one.
+    With ``cache``, each chunk is cached separately, keyed by its own data files.
+    """
+    chunk_days = _parse_chunk(chunk)
+    query = _prepare_query(
+        silver_root=silver_root,
+        table=table,
+        exchange=exchange,
+        symbol=symbol,
+        start=start,
+        end=end,
+        columns=columns,
+        include_lineage=include_lineage,
+        decode=decode,
+        decode_in_place=decode_in_place,
+        as_of_version=as_of_version,
+        as_of_time=as_of_time,
+    )
+    files = _candidate_files(query)
+    if files.is_empty():
+        return
+    trading_dates = files.get_column("trading_date").unique().sort().to_list()
+
+    # Each chunk starts at a populated trading date and spans ``chunk_days`` calendar days.
+    date_ranges: list[tuple[date, date]] = []
+    for trading_date in trading_dates:
+        if date_ranges and trading_date <= date_ranges[-1][1]:
+            continue
+        date_ranges.append((trading_date, trading_date + timedelta(days=chunk_days - 1)))
+
+    def load_chunk(date_range: tuple[date, date]) -> pl.DataFrame:
+        return _collect_query(
+            query,
+            files=files.filter(pl.col("trading_date").is_between(*date_range)),
+            date_range=date_range,
+            cache=cache,
+        )
+
+    if not prefetch:
+        for date_range in date_ranges:
+            frame = load_chunk(date_range)
+            if not frame.is_empty():
+                yield frame
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(load_chunk, date_ranges[0])
+        for next_range in [*date_ranges[1:], None]:
+            frame = pending.result()
+            if next_range is not None:
+                pending = pool.submit(load_chunk, next_range)
+            if not frame.is_empty():
+                yield frame
+
+
+def load_event_stream(
+    *,
+    silver_root: Path,
+    tables: list[str],
+    exchange: str | list[str],
+    symbol: str | list[str],
+    start: TimestampInput,
+    end: TimestampInput,
+    columns: Mapping[str, list[str]] | None = None,
+    include_lineage: bool = False,
+) -> pl.DataFrame:
+    """Load several event tables as one replay stream in event-time order.
+
+    Rows carry a ``table`` discriminator and the union of the tables' columns
+    (null where a table has no such column). Order is
+    ``(ts_event_us, table precedence, file_id, file_seq)``, with precedence
+    given by the order of ``tables``. Each table is scanned once and put in
+    stream order on its own; the tables are then k-way merged rather than
+    sorted as one concatenation. ``columns`` optionally projects per table.
+    """
+    queries = _prepare_stream_queries(
+        silver_root=silver_root,
+        tables=tables,
+        exchange=exchange,
+        symbol=symbol,
+        start=start,
+        end=end,
+        columns=columns,
+        include_lineage=include_lineage,
+    )
+    files = [_candidate_files(query) for query in queries]
+    return _merge_stream(queries, files=files, date_range=None, include_lineage=include_lineage)
+
+
+def iter_event_stream(
+    *,
+    silver_root: Path,
+    tables: list[str],
+    exchange: str | list[str],
+    symbol: str | list[str],
+    start: TimestampInput,
+    end: TimestampInput,
+    columns: Mapping[str, list[str]] | None = None,
+    include_lineage: bool = False,
+    chunk: str = "1d",
+) -> Iterator[pl.DataFrame]:
+    """Chunked :func:`load_event_stream`, one merged frame per trading-date block.
+
+    Chunking follows :func:`iter_events`. For a single exchange the chunks
+    concatenate into the same stream as :func:`load_event_stream`.
     """
+    chunk_days = _parse_chunk(chunk)
+    queries = _prepare_stream_queries(
+        silver_root=silver_root,
+        tables=tables,
+        exchange=exchange,
+        symbol=symbol,
+        start=start,
+        end=end,
+        columns=columns,
+        include_lineage=include_lineage,
+    )
+    files = [_candidate_files(query) for query in queries]
+    trading_dates = (
+        pl.concat([frame.select("trading_date") for frame in files])
+        .get_column("trading_date")
+        .unique()
+        .sort()
+        .to_list()
+    )
+
+    date_ranges: list[tuple[date, date]] = []
+    for trading_date in trading_dates:
+        if date_ranges and trading_date <= date_ranges[-1][1]:
+            continue
+        date_ranges.append((trading_date, trading_date + timedelta(days=chunk_days - 1)))
+
+    for date_range in date_ranges:
+        frame = _merge_stream(
+            queries,
+            files=[
+                table_files.filter(pl.col("trading_date").is_between(*date_range))
+                for table_files in files
+            ],
+            date_range=date_range,
+            include_lineage=include_lineage,
+        )
+        if not frame.is_empty():
+            yield frame
+
+
+@dataclass(frozen=True)
+class _EventQuery:
+    spec: TableSpec
+    silver_root: Path
+    path: Path
+    version: int | None
+    symbols: list[str]
+    start_ts_us: int
+    end_ts_us: int
+    date_bounds: dict[str, tuple[date, date]]
+    selected_cols: list[str]
+    scan_cols: list[str]
+    decode_cols: list[str]
+    decode_in_place: bool
+    output_cols: list[str]
+
+
+def _prepare_query(
+    *,
+    silver_root: Path,
+    table: str,
+    exchange: str | list[str],
+    symbol: str | list[str],
+    start: TimestampInput,
+    end: TimestampInput,
+    columns: list[str] | None,
+    include_lineage: bool,
+    decode: bool | list[str],
+    decode_in_place: bool,
+    as_of_version: int | None,
+    as_of_time: TimestampInput | None,
+) -> _EventQuery:
     spec = get_table_spec(table)
     if spec.kind != "event":
-        raise ValueError(f"load_events only supports event tables, got {table!r}")
+        raise ValueError(f"load_events/scan_events only support event tables, got {table!r}")
 
-    exchange_norm = exchange.strip().lower()
-    if not exchange_norm:
-        raise ValueError("exchange must be non-empty")
-    if not symbol.strip():
-        raise ValueError("symbol must be non-empty")
+    exchanges = _normalize_exchanges(exchange)
+    symbols = _normalize_symbols(symbol)
 
     start_ts_us = normalize_ts_us(start, param_name="start")
     end_ts_us = normalize_ts_us(end, param_name="end")
-    start_date, end_date = derive_trading_date_bounds(
-        exchange=exchange_norm,
-        start_ts_us=start_ts_us,
-        end_ts_us=end_ts_us,
-    )
+    as_of_ts_us = normalize_as_of_time(as_of_version=as_of_version, as_of_time=as_of_time)
+    date_bounds = {
+        name: derive_trading_date_bounds(
+            exchange=name,
+            start_ts_us=start_ts_us,
+            end_ts_us=end_ts_us,
+        )
+        for name in exchanges
+    }
 
-    event_schema = spec.to_polars()
     selected_cols = _resolve_selected_columns(
-        event_schema=event_schema,
+        event_schema=spec.to_polars(),
         columns=columns,
         include_lineage=include_lineage,
     )
-
-    path = table_path(silver_root=silver_root, table_name=spec.name)
-    if not path.exists():
-        return _empty_result_frame(event_schema=event_schema, selected_cols=selected_cols)
-
     scan_cols = list(selected_cols)
     for tie_col in spec.tie_break_keys:
         if tie_col not in scan_cols:
             scan_cols.append(tie_col)
 
-    lf = pl.scan_delta(str(path)).filter(
-        (pl.col("exchange") == exchange_norm)
-        & (pl.col("symbol") == symbol)
-        & (pl.col("trading_date") >= pl.lit(start_date))
-        & (pl.col("trading_date") <= pl.lit(end_date))
-        & (pl.col("ts_event_us") >= start_ts_us)
-        & (pl.col("ts_event_us") < end_ts_us)
+    decode_cols = _resolve_decode_columns(spec, selected_cols=selected_cols, decode=decode)
+    output_cols = list(selected_cols)
+    if not decode_in_place:
+        output_cols.extend(f"{name}_decoded" for name in decode_cols)
+
+    path = table_path(silver_root=silver_root, table_name=spec.name)
+    return _EventQuery(
+        spec=spec,
+        silver_root=silver_root,
+        path=path,
+        version=resolve_delta_version(path, version=as_of_version, as_of_ts_us=as_of_ts_us),
+        symbols=symbols,
+        start_ts_us=start_ts_us,
+        end_ts_us=end_ts_us,
+        date_bounds=date_bounds,
+        selected_cols=selected_cols,
+        scan_cols=scan_cols,
+        decode_cols=decode_cols,
+        decode_in_place=decode_in_place,
+        output_cols=output_cols,
     )
-    frame = lf.select(scan_cols).collect()
 
-    sort_cols = [name for name in spec.tie_break_keys if name in frame.columns]
+
+def _scan_query(
+    query: _EventQuery,
+    *,
+    source: pl.LazyFrame,
+    date_range: tuple[date, date] | None,
+) -> pl.LazyFrame:
+    """Build the sorted scan plan, optionally restricted to a trading-date sub-range."""
+    lf = _filtered_scan(query, source=source, date_range=date_range)
+    sort_cols = _sort_columns(query)
     if sort_cols:
-        frame = frame.sort(sort_cols)
+        lf = lf.sort(sort_cols)
+    return lf.select(query.output_cols)
+
+
+def _filtered_scan(
+    query: _EventQuery,
+    *,
+    source: pl.LazyFrame,
+    date_range: tuple[date, date] | None,
+) -> pl.LazyFrame:
+    """Unsorted scan plan projecting ``scan_cols`` plus any decoded columns."""
+    partition_filter = _partition_filter(query.date_bounds, date_range=date_range)
+    if partition_filter is None:
+        lf = _empty_result_frame(
+            event_schema=query.spec.to_polars(),
+            selected_cols=query.scan_cols,
+        ).lazy()
+    else:
+        lf = source.filter(
+            partition_filter
+            & _in_filter("symbol", query.symbols)
+            & (pl.col("ts_event_us") >= query.start_ts_us)
+            & (pl.col("ts_event_us") < query.end_ts_us)
+        ).select(query.scan_cols)
+
+    if query.decode_cols:
+        # Decoding in the scan pass avoids holding scaled and decoded copies side by side.
+        lf = lf.with_columns(
+            _decode_exprs(query.spec, query.decode_cols, in_place=query.decode_in_place)
+        )
+    return lf
+
+
+def _sort_columns(query: _EventQuery) -> list[str]:
+    return [name for name in query.spec.tie_break_keys if name in query.scan_cols]
+
+
+def _is_sorted_by(df: pl.DataFrame, columns: list[str]) -> bool:
+    """O(n) check that rows are in non-decreasing lexicographic order of ``columns``."""
+    if df.height < 2:
+        return True
+    in_order = pl.lit(True)
+    for name in reversed(columns):
+        prev = pl.col(name).shift(1)
+        in_order = (prev < pl.col(name)) | ((prev == pl.col(name)) & in_order)
+    return bool(df.select(in_order.slice(1).fill_null(False).all()).item())
+
+
+def _candidate_files(query: _EventQuery) -> pl.DataFrame:
+    """Data files that may hold the query's symbols, per the file-level skipping index."""
+    files = DeltaFileIndex(
+        silver_root=query.silver_root,
+        table_paths={query.spec.name: query.path},
+    ).candidate_files(
+        query.spec.name,
+        date_bounds=query.date_bounds,
+        symbols=query.symbols,
+        start_ts_us=query.start_ts_us,
+        end_ts_us=query.end_ts_us,
+        version=query.version,
+    )
+    if files is None:
+        return pl.DataFrame(schema=FILE_INDEX_SCHEMA)
+    return files
+
+
+def _scan_files(query: _EventQuery, files: pl.DataFrame) -> pl.LazyFrame:
+    schema = query.spec.to_polars()
+    if files.is_empty():
+        return pl.DataFrame(schema=schema).lazy()
+    return pl.scan_parquet(
+        files.get_column("path").to_list(),
+        hive_partitioning=True,
+        hive_schema={name: schema[name] for name in query.spec.partition_by},
+    )
+
+
+def _collect_query(
+    query: _EventQuery,
+    *,
+    files: pl.DataFrame,
+    date_range: tuple[date, date] | None,
+    cache: QueryCache | None,
+) -> pl.DataFrame:
+    def compute() -> pl.DataFrame:
+        # Event-store files are written in tie-break order and scanned in key-range order,
+        # so the concatenation is usually sorted already; verify in O(n) before sorting.
+        source = _scan_files(query, files)
+        frame = _filtered_scan(query, source=source, date_range=date_range).collect()
+        sort_cols = _sort_columns(query)
+        if sort_cols and not _is_sorted_by(frame, sort_cols):
+            frame = frame.sort(sort_cols)
+        return frame.select(query.output_cols)
+
+    if cache is None:
+        return compute()
+
+    bounds = _clip_bounds(query.date_bounds, date_range=date_range)
+    key = {
+        "kind": "events",
+        "table": query.spec.name,
+        "files": delta_fingerprint(files),
+        "date_bounds": sorted((exchange, lo, hi) for exchange, (lo, hi) in bounds.items()),
+        "symbols": sorted(query.symbols),
+        "start_ts_us": query.start_ts_us,
+        "end_ts_us": query.end_ts_us,
+        "columns": query.selected_cols,
+        "decode": query.decode_cols,
+        "decode_in_place": query.decode_in_place,
+    }
+    return cache.get_or_compute(key, compute)
+
+
+def _prepare_stream_queries(
+    *,
+    silver_root: Path,
+    tables: list[str],
+    exchange: str | list[str],
+    symbol: str | list[str],
+    start: TimestampInput,
+    end: TimestampInput,
+    columns: Mapping[str, list[str]] | None,
+    include_lineage: bool,
+) -> list[_EventQuery]:
+    if not tables:
+        raise ValueError("tables must be non-empty")
+    if len(set(tables)) != len(tables):
+        raise ValueError(f"tables must be unique, got {tables}")
+    unknown = sorted(set(columns or {}) - set(tables))
+    if unknown:
+        raise ValueError(f"columns given for tables not in the stream: {unknown}")
+
+    queries = [
+        _prepare_query(
+            silver_root=silver_root,
+            table=table,
+            exchange=exchange,
+            symbol=symbol,
+            start=start,
+            end=end,
+            columns=(columns or {}).get(table),
+            include_lineage=include_lineage,
+            decode=False,
+            decode_in_place=False,
+            as_of_version=None,
+            as_of_time=None,
+        )
+        for table in tables
+    ]
+    _stream_schema(queries)
+    return queries
+
+
+def _stream_schema(queries: list[_EventQuery]) -> dict[str, pl.DataType]:
+    """Union of the queries' scanned columns; shared names must share a dtype."""
+    schema: dict[str, pl.DataType] = {}
+    for query in queries:
+        table_schema = query.spec.to_polars()
+        for name in query.scan_cols:
+            dtype = table_schema[name]
+            if name in schema and schema[name] != dtype:
+                raise ValueError(
+                    f"Column {name!r} has dtype {dtype} in {query.spec.name} "
+                    f"but {schema[name]} in an earlier table"
+                )
+            schema.setdefault(name, dtype)
+    return schema
+
+
+def _merge_stream(
+    queries: list[_EventQuery],
+    *,
+    files: list[pl.DataFrame],
+    date_range: tuple[date, date] | None,
+    include_lineage: bool,
+) -> pl.DataFrame:
+    schema = _stream_schema(queries)
+    runs: list[pl.DataFrame] = []
+    for precedence, (query, table_files) in enumerate(zip(queries, files, strict=True)):
+        frame = _filtered_scan(
+            query,
+            source=_scan_files(query, table_files),
+            date_range=date_range,
+        ).collect()
+        if not _is_sorted_by(frame, _STREAM_KEYS):
+            frame = frame.sort(_STREAM_KEYS)
+        runs.append(
+            frame.select(
+                pl.lit(query.spec.name).alias("table"),
+                *[
+                    pl.col(name) if name in frame.columns else pl.lit(None, dtype=dtype).alias(name)
+                    for name, dtype in schema.items()
+                ],
+                pl.struct(
+                    pl.col("ts_event_us"),
+                    pl.lit(precedence, dtype=pl.Int64).alias("_precedence"),
+                    pl.col("file_id"),
+                    pl.col("file_seq"),
+                ).alias("_stream_key"),
+            )
+        )
+
+    # Pairwise k-way merge: each round halves the number of sorted runs.
+    while len(runs) > 1:
+        merged = [
+            runs[i].merge_sorted(runs[i + 1], key="_stream_key") for i in range(0, len(runs) - 1, 2)
+        ]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+
+    output_cols = ["table"]
+    for query in queries:
+        output_cols.extend(name for name in query.output_cols if name not in output_cols)
+    if include_lineage:
+        output_cols.extend(name for name in _STREAM_KEYS if name not in output_cols)
+    return runs[0].select(output_cols)
+
+
+def _normalize_exchanges(exchange: str | list[str]) -> list[str]:
+    values = [exchange] if isinstance(exchange, str) else list(exchange)
+    normalized = [value.strip().lower() for value in values if value.strip()]
+    if not normalized:
+        raise ValueError("exchange must be non-empty")
+    return list(dict.fromkeys(normalized))
+
+
+def _normalize_symbols(symbol: str | list[str]) -> list[str]:
+    values = [symbol] if isinstance(symbol, str) else list(symbol)
+    normalized = [value for value in values if value.strip()]
+    if not normalized:
+        raise ValueError("symbol must be non-empty")
+    return list(dict.fromkeys(normalized))
+
+
+def _parse_chunk(chunk: str) -> int:
+    raw = chunk.strip().lower()
+    if raw.endswith("d") and raw[:-1].isdigit() and int(raw[:-1]) > 0:
+        return int(raw[:-1])
+    raise ValueError(f"chunk must look like '1d' (whole trading dates), got {chunk!r}")
+
+
+def _in_filter(column: str, values: list[str]) -> pl.Expr:
+    if len(values) == 1:
+        return pl.col(column) == values[0]
+    return pl.col(column).is_in(values)
+
+
+def _clip_bounds(
+    date_bounds: dict[str, tuple[date, date]],
+    *,
+    date_range: tuple[date, date] | None,
+) -> dict[str, tuple[date, date]]:
+    """Intersect per-exchange trading-date bounds with ``date_range``, dropping empty ones."""
+    if date_range is None:
+        return dict(date_bounds)
+    clipped: dict[str, tuple[date, date]] = {}
+    for exchange, (start_date, end_date) in date_bounds.items():
+        lo = max(start_date, date_range[0])
+        hi = min(end_date, date_range[1])
+        if lo <= hi:
+            clipped[exchange] = (lo, hi)
+    return clipped
+
+
+def _partition_filter(
+    date_bounds: dict[str, tuple[date, date]],
+    *,
+    date_range: tuple[date, date] | None,
+) -> pl.Expr | None:
+    """Build an ``exchange``/``trading_date`` predicate with per-exchange local-date bounds.
+
+    Returns None when ``date_range`` excludes every exchange.
+    """
+    predicate: pl.Expr | None = None
+    for exchange, (start_date, end_date) in _clip_bounds(
+        date_bounds, date_range=date_range
+    ).items():
+        term = (
+            (pl.col("exchange") == exchange)
+            & (pl.col("trading_date") >= pl.lit(start_date))
+            & (pl.col("trading_date") <= pl.lit(end_date))
+        )
+        predicate = term if predicate is None else predicate | term
+    return predicate
+
+
+def _resolve_decode_columns(
+    spec: TableSpec,
+    *,
+    selected_cols: list[str],
+    decode: bool | list[str],
+) -> list[str]:
+    scaled_cols = spec.scaled_columns()
+    if decode is True:
+        return [name for name in scaled_cols if name in selected_cols]
+    if decode is False:
+        return []
 
-    return frame.select(selected_cols)
+    requested = list(dict.fromkeys(decode))
+    unknown = sorted(set(requested) - set(scaled_cols))
+    if unknown:
+        raise ValueError(f"Requested non-scaled columns for decode: {unknown}")
+    missing = [name for name in requested if name not in selected_cols]
+    if missing:
+        raise ValueError(f"Decode columns are not among the selected columns: {missing}")
+    return requested
 
 
 def _resolve_selected_columns(
@@ -2,109 +2,644 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict
+from datetime import date, timedelta
 from pathlib import Path
 
 import polars as pl
 
+from pointline.research._bar_aggregates import BAR_AGGREGATES, DEFAULT_BAR_AGGREGATES
 from pointline.research._spine_builders import (
+    SPINE_COLUMNS,
     build_clock_spine,
     build_dollar_spine,
+    build_imbalance_spine,
+    build_threshold_spine,
     build_trades_spine,
     build_volume_spine,
     empty_spine_frame,
+    threshold_measure,
 )
+from pointline.research._spine_store import SpineStore, spine_config_hash
 from pointline.research._spine_types import (
     BuilderName,
     ClockSpineConfig,
     DollarSpineConfig,
     SpineConfig,
+    ThresholdSpineState,
+    TickImbalanceSpineConfig,
     TradesSpineConfig,
+    VolumeImbalanceSpineConfig,
     VolumeSpineConfig,
 )
-from pointline.research._time import TimestampInput, normalize_ts_us, validate_time_window
+from pointline.research._time import (
+    TimestampInput,
+    derive_trading_date_bounds,
+    local_midnight_ts_us,
+    normalize_as_of_time,
+    normalize_ts_us,
+    trading_day_windows,
+    validate_time_window,
+)
+from pointline.research.cache import QueryCache, delta_add_actions, delta_fingerprint
+from pointline.research.query import _is_sorted_by
+from pointline.storage.delta._utils import resolve_delta_version
+from pointline.storage.delta.dimension_store import DeltaDimensionStore
+from pointline.storage.delta.layout import table_path
+
+# Delta tables a spine may read; ``as_of_version`` is keyed by these names.
+_SOURCE_TABLES = ("dim_symbol", "trades")
+_BUILDER_NAMES = ("clock", "trades", "volume", "dollar", "tick_imbalance", "volume_imbalance")
+_THRESHOLD_BUILDERS = ("volume", "dollar")
 
 
 def build_spine(
     *,
     silver_root: Path,
-    exchange: str,
-    symbol: str | list[str],
+    exchange: str | list[str],
+    symbol: str | list[str] | list[tuple[str, str]],
     start: TimestampInput,
     end: TimestampInput,
     builder: BuilderName | str,
     config: SpineConfig,
+    cache: QueryCache | None = None,
+    as_of_version: Mapping[str, int] | None = None,
+    as_of_time: TimestampInput | None = None,
+    materialize: bool = False,
+    union: bool = False,
+) -> pl.DataFrame:
+    """Build a canonical v2 spine for one or many exchanges and symbols.
+
+    ``symbol`` names symbols requested on every exchange in ``exchange``, or is a
+    list of ``(exchange, symbol)`` pairs whose exchanges must all be listed in
+    ``exchange``. Trade-driven builders read all exchanges in one scan, each pruned
+    to its own local trading dates.
+
+    With ``cache``, the spine is reused until dim_symbol or the touched trades
+    partitions change. ``as_of_version`` pins source tables by name
+    (``{"dim_symbol": 3, "trades": 41}``); ``as_of_time`` pins every source
+    table to its version current at that time.
+
+    With ``materialize``, whole exchange-local days are read from and written to
+    the ``spines`` Delta table (partitioned by builder, config hash, exchange and
+    trading_date); only days that are missing or whose source data changed are
+    rebuilt. Partial first/last days are always built directly.
+
+    With ``union`` (clock builder only), every requested instrument gets a row at
+    every grid time where any instrument is listed, so all instruments share one
+    timeline; ``symbol_id`` is null where the instrument itself is not listed.
+    """
+    instruments = _normalize_instruments(exchange, symbol)
+    start_ts_us = normalize_ts_us(start, param_name="start")
+    end_ts_us = normalize_ts_us(end, param_name="end")
+    validate_time_window(start_ts_us, end_ts_us)
+
+    builder_name = builder.strip().lower()
+    if union and builder_name != "clock":
+        raise ValueError(f"union=True requires the clock builder, got {builder!r}")
+    versions = _resolve_source_versions(
+        silver_root=silver_root,
+        as_of_version=as_of_version,
+        as_of_ts_us=normalize_as_of_time(as_of_version=as_of_version, as_of_time=as_of_time),
+    )
+
+    def build() -> pl.DataFrame:
+        pending: list[tuple[SpineStore, pl.DataFrame]] = []
+        if materialize:
+            built = [
+                _build_materialized(
+                    silver_root=silver_root,
+                    exchange=exchange_name,
+                    symbols=symbols,
+                    start_ts_us=start_ts_us,
+                    end_ts_us=end_ts_us,
+                    builder=builder,
+                    builder_name=builder_name,
+                    config=config,
+                    versions=versions,
+                )
+                for exchange_name, symbols in instruments.items()
+            ]
+            spine = pl.concat([piece for piece, _, _ in built]).sort(
+                ["exchange", "symbol", "ts_spine_us"], maintain_order=True
+            )
+            if spine.height > config.max_rows:
+                raise RuntimeError(
+                    f"Spine would generate too many rows: {spine.height} > {config.max_rows}"
+                )
+            pending = [(store, units) for _, store, units in built]
+        else:
+            spine = _dispatch_builder(
+                silver_root=silver_root,
+                instruments=instruments,
+                start_ts_us=start_ts_us,
+                end_ts_us=end_ts_us,
+                builder=builder,
+                builder_name=builder_name,
+                config=config,
+                versions=versions,
+            )
+        if union:
+            spine = _union_spine(spine, instruments=instruments, max_rows=config.max_rows)
+        # Days are persisted only once every row limit has passed.
+        for store, units in pending:
+            store.replace_days(units)
+        return spine
+
+    if cache is None:
+        return build()
+
+    key = _spine_cache_key(
+        silver_root=silver_root,
+        instruments=instruments,
+        start_ts_us=start_ts_us,
+        end_ts_us=end_ts_us,
+        builder_name=builder_name,
+        config=config,
+        versions=versions,
+    )
+    if union:
+        key["union"] = True
+    return cache.get_or_compute(key, build)
+
+
+def _union_spine(
+    spine: pl.DataFrame,
+    *,
+    instruments: Mapping[str, list[str]],
+    max_rows: int,
 ) -> pl.DataFrame:
-    """Build a canonical v2 spine for one exchange and one/many symbols."""
+    """Every instrument at every spine time, keeping each instrument's own symbol_id."""
+    grid = spine.select("ts_spine_us").unique().sort("ts_spine_us")
+    pairs = pl.DataFrame(
+        [(exchange, symbol) for exchange, symbols in instruments.items() for symbol in symbols],
+        schema={"exchange": pl.Utf8, "symbol": pl.Utf8},
+        orient="row",
+    ).sort("exchange", "symbol")
+    n_rows = pairs.height * grid.height
+    if n_rows > max_rows:
+        raise RuntimeError(f"Union spine would generate too many rows: {n_rows} > {max_rows}")
+    return (
+        pairs.join(grid, how="cross")
+        .join(
+            spine,
+            on=["exchange", "symbol", "ts_spine_us"],
+            how="left",
+            maintain_order="left",
+        )
+        .select(SPINE_COLUMNS)
+    )
+
+
+def extend_threshold_spine(
+    *,
+    silver_root: Path,
+    exchange: str,
+    symbol: str | list[str],
+    end: TimestampInput,
+    builder: BuilderName | str,
+    config: VolumeSpineConfig | DollarSpineConfig,
+    state: ThresholdSpineState | None = None,
+    start: TimestampInput | None = None,
+    as_of_version: Mapping[str, int] | None = None,
+    as_of_time: TimestampInput | None = None,
+) -> tuple[pl.DataFrame, ThresholdSpineState]:
+    """Build a volume/dollar spine over ``[start, end)`` continuing from ``state``.
+
+    Returns the new bars and the state through ``end``. Without ``state`` the spine
+    starts at ``start`` with empty accumulators; with it, the window starts at
+    ``state.through_ts_us`` and each symbol's partial bar carries over, so chained
+    calls yield exactly the bars of one ``build_spine`` call over the whole range.
+    Symbols not in ``state`` start empty; symbols only in ``state`` keep theirs.
+    """
     exchange_norm = exchange.strip().lower()
     if not exchange_norm:
         raise ValueError("exchange must be non-empty")
-
     symbols = _normalize_symbols(symbol)
-    start_ts_us = normalize_ts_us(start, param_name="start")
+
+    builder_name = builder.strip().lower()
+    if builder_name not in _THRESHOLD_BUILDERS:
+        raise ValueError(
+            f"extend_threshold_spine supports the volume and dollar builders, got {builder!r}"
+        )
+    measure_expr, threshold = _threshold_config(builder_name, config)
+
+    residuals: dict[tuple[str, str], int] = {}
+    if state is None:
+        if start is None:
+            raise ValueError("start is required when state is None")
+        start_ts_us = normalize_ts_us(start, param_name="start")
+    else:
+        expected = (builder_name, threshold, exchange_norm)
+        actual = (state.builder, state.threshold, state.exchange)
+        if actual != expected:
+            raise ValueError(
+                f"state was built for (builder, threshold, exchange)={actual}, got {expected}"
+            )
+        start_ts_us = state.through_ts_us
+        if start is not None and normalize_ts_us(start, param_name="start") != start_ts_us:
+            raise ValueError(f"start must equal state.through_ts_us ({start_ts_us})")
+        residuals = {
+            (exchange_norm, symbol): residual for symbol, residual in state.residuals.iter_rows()
+        }
     end_ts_us = normalize_ts_us(end, param_name="end")
     validate_time_window(start_ts_us, end_ts_us)
 
-    builder_name = builder.strip().lower()
+    versions = _resolve_source_versions(
+        silver_root=silver_root,
+        as_of_version=as_of_version,
+        as_of_ts_us=normalize_as_of_time(as_of_version=as_of_version, as_of_time=as_of_time),
+    )
+    spine, carried = build_threshold_spine(
+        silver_root=silver_root,
+        instruments={exchange_norm: symbols},
+        start_ts_us=start_ts_us,
+        end_ts_us=end_ts_us,
+        measure_expr=measure_expr,
+        threshold=threshold,
+        max_rows=config.max_rows,
+        trades_version=versions["trades"],
+        residuals=residuals,
+    )
+    residuals.update(carried)
+    next_state = ThresholdSpineState(
+        builder=builder_name,
+        threshold=threshold,
+        exchange=exchange_norm,
+        through_ts_us=end_ts_us,
+        residuals=pl.DataFrame(
+            sorted((symbol, residual) for (_, symbol), residual in residuals.items()),
+            schema={"symbol": pl.Utf8, "residual": pl.Int64},
+            orient="row",
+        ),
+    )
+    return spine, next_state
+
+
+def _threshold_config(builder_name: str, config: SpineConfig) -> tuple[pl.Expr, int]:
+    expected = VolumeSpineConfig if builder_name == "volume" else DollarSpineConfig
+    if not isinstance(config, expected):
+        raise TypeError(f"{builder_name} builder requires {expected.__name__}")
+    return threshold_measure(config)
+
+
+def _build_materialized(
+    *,
+    silver_root: Path,
+    exchange: str,
+    symbols: list[str],
+    start_ts_us: int,
+    end_ts_us: int,
+    builder: str,
+    builder_name: str,
+    config: SpineConfig,
+    versions: Mapping[str, int | None],
+) -> tuple[pl.DataFrame, SpineStore, pl.DataFrame]:
+    """Assemble the spine day by day, reusing stored days whose sources are unchanged.
+
+    A stored ``(day, symbol)`` unit is reused when its source fingerprint matches and,
+    for threshold builders, its stored carry-in equals the partial bar carried into
+    that day, so stale days also force their successors to be rebuilt. Returns the
+    spine with the store and the rebuilt units; the caller persists them with
+    ``replace_days`` after checking ``max_rows``.
+    """
+    if builder_name in _THRESHOLD_BUILDERS:
+        measure_expr, threshold = _threshold_config(builder_name, config)
+    elif builder_name not in ("clock", "trades"):
+        raise ValueError(
+            "materialize=True supports the clock, trades, volume and dollar builders, "
+            f"got {builder!r}"
+        )
+
+    windows = trading_day_windows(exchange=exchange, start_ts_us=start_ts_us, end_ts_us=end_ts_us)
+    full_days: dict[int, date] = {}
+    for index, (window_start, window_end) in enumerate(windows):
+        day, _ = derive_trading_date_bounds(
+            exchange=exchange, start_ts_us=window_start, end_ts_us=window_end
+        )
+        if window_start == local_midnight_ts_us(
+            exchange=exchange, day=day
+        ) and window_end == local_midnight_ts_us(exchange=exchange, day=day + timedelta(days=1)):
+            full_days[index] = day
+
+    store = SpineStore(
+        silver_root=silver_root,
+        builder=builder_name,
+        config_hash=spine_config_hash(config),
+        exchange=exchange,
+    )
+    fingerprints = _unit_fingerprints(
+        silver_root=silver_root,
+        exchange=exchange,
+        symbols=symbols,
+        builder_name=builder_name,
+        days={day: windows[index] for index, day in full_days.items()},
+        versions=versions,
+    )
+    stored = store.load_days(trading_dates=list(full_days.values()), symbols=symbols)
+    markers = {
+        (day, symbol): (fingerprint, carry_in, carry_out)
+        for day, symbol, fingerprint, carry_in, carry_out in stored.filter(
+            pl.col("ts_spine_us").is_null()
+        )
+        .select("trading_date", "symbol", "source_fingerprint", "carry_in", "carry_out")
+        .iter_rows()
+    }
+    stored_rows = stored.filter(pl.col("ts_spine_us").is_not_null())
+
+    residuals = dict.fromkeys(symbols, 0)
+    pieces: list[pl.DataFrame] = []
+    units: list[pl.DataFrame] = []
+    for index, (window_start, window_end) in enumerate(windows):
+        day = full_days.get(index)
+        stale = symbols
+        if day is not None:
+            reusable = []
+            for symbol in symbols:
+                marker = markers.get((day, symbol))
+                if marker is None or marker[0] != fingerprints[(day, symbol)]:
+                    continue
+                if builder_name in _THRESHOLD_BUILDERS:
+                    if marker[1] != residuals[symbol]:
+                        continue
+                    residuals[symbol] = marker[2]
+                reusable.append(symbol)
+            if reusable:
+                pieces.append(
+                    stored_rows.filter(
+                        (pl.col("trading_date") == day) & pl.col("symbol").is_in(reusable)
+                    ).select(SPINE_COLUMNS)
+                )
+            stale = [symbol for symbol in symbols if symbol not in reusable]
+            if not stale:
+                continue
+
+        carry_in = {symbol: residuals[symbol] for symbol in stale}
+        if builder_name in _THRESHOLD_BUILDERS:
+            piece, carried = build_threshold_spine(
+                silver_root=silver_root,
+                instruments={exchange: stale},
+                start_ts_us=window_start,
+                end_ts_us=window_end,
+                measure_expr=measure_expr,
+                threshold=threshold,
+                max_rows=config.max_rows,
+                trades_version=versions["trades"],
+                residuals={(exchange, symbol): value for symbol, value in carry_in.items()},
+            )
+            residuals.update((symbol, value) for (_, symbol), value in carried.items())
+        else:
+            piece = _dispatch_builder(
+                silver_root=silver_root,
+                instruments={exchange: stale},
+                start_ts_us=window_start,
+                end_ts_us=window_end,
+                builder=builder,
+                builder_name=builder_name,
+                config=config,
+                versions=versions,
+            )
+        pieces.append(piece)
+        if day is None:
+            continue
+
+        markers_frame = pl.DataFrame(
+            {
+                "symbol": stale,
+                "source_fingerprint": [fingerprints[(day, symbol)] for symbol in stale],
+                "carry_in": [carry_in[symbol] for symbol in stale],
+                "carry_out": [residuals[symbol] for symbol in stale],
+            }
+        )
+        if builder_name not in _THRESHOLD_BUILDERS:
+            markers_frame = markers_frame.with_columns(
+                pl.lit(None, dtype=pl.Int64).alias("carry_in"),
+                pl.lit(None, dtype=pl.Int64).alias("carry_out"),
+            )
+        units.append(
+            pl.concat(
+                [piece.select(SPINE_COLUMNS), markers_frame], how="diagonal_relaxed"
+            ).with_columns(
+                pl.lit(builder_name).alias("builder"),
+                pl.lit(store.config_hash).alias("config_hash"),
+                pl.lit(exchange).alias("exchange"),
+                pl.lit(day).alias("trading_date"),
+            )
+        )
+
+    spine = pl.concat(pieces).sort(["exchange", "symbol", "ts_spine_us"], maintain_order=True)
+    rebuilt = pl.concat(units, how="diagonal_relaxed") if units else pl.DataFrame()
+    return spine, store, rebuilt
+
+
+def _unit_fingerprints(
+    *,
+    silver_root: Path,
+    exchange: str,
+    symbols: list[str],
+    builder_name: str,
+    days: Mapping[date, tuple[int, int]],
+    versions: Mapping[str, int | None],
+) -> dict[tuple[date, str], str]:
+    """Digest of the source data each stored ``(day, symbol)`` unit was built from.
+
+    Clock days depend on the symbol's dim_symbol windows overlapping the day; the
+    other builders depend on the day's trades partition.
+    """
+    out: dict[tuple[date, str], str] = {}
+    if not days:
+        return out
+    if builder_name != "clock":
+        trades_actions = delta_add_actions(
+            table_path(silver_root=silver_root, table_name="trades"), version=versions["trades"]
+        )
+        for day in days:
+            fingerprint = delta_fingerprint(trades_actions, date_bounds={exchange: (day, day)})
+            out.update(((day, symbol), fingerprint) for symbol in symbols)
+        return out
+
+    dim = (
+        DeltaDimensionStore(silver_root=silver_root)
+        .load_dim_symbol(version=versions["dim_symbol"])
+        .filter((pl.col("exchange") == exchange) & pl.col("exchange_symbol").is_in(symbols))
+        .sort("exchange_symbol", "valid_from_ts_us", "symbol_id")
+    )
+    for day, (day_start, day_end) in days.items():
+        overlapping = dim.filter(
+            (pl.col("valid_from_ts_us") < day_end) & (pl.col("valid_until_ts_us") > day_start)
+        )
+        windows = {
+            symbol: rows.select("symbol_id", "valid_from_ts_us", "valid_until_ts_us").rows()
+            for (symbol,), rows in overlapping.partition_by("exchange_symbol", as_dict=True).items()
+        }
+        for symbol in symbols:
+            payload = repr(windows.get(symbol, [])).encode("utf-8")
+            out[(day, symbol)] = hashlib.sha256(payload).hexdigest()
+    return out
+
+
+def _resolve_source_versions(
+    *,
+    silver_root: Path,
+    as_of_version: Mapping[str, int] | None,
+    as_of_ts_us: int | None,
+) -> dict[str, int | None]:
+    pinned = dict(as_of_version or {})
+    unknown = sorted(set(pinned) - set(_SOURCE_TABLES))
+    if unknown:
+        raise ValueError(f"as_of_version keys must be among {list(_SOURCE_TABLES)}, got {unknown}")
+    return {
+        name: resolve_delta_version(
+            table_path(silver_root=silver_root, table_name=name),
+            version=pinned.get(name),
+            as_of_ts_us=as_of_ts_us,
+        )
+        for name in _SOURCE_TABLES
+    }
+
+
+def _dispatch_builder(
+    *,
+    silver_root: Path,
+    instruments: Mapping[str, list[str]],
+    start_ts_us: int,
+    end_ts_us: int,
+    builder: str,
+    builder_name: str,
+    config: SpineConfig,
+    versions: Mapping[str, int | None],
+) -> pl.DataFrame:
     if builder_name == "clock":
         if not isinstance(config, ClockSpineConfig):
             raise TypeError("clock builder requires ClockSpineConfig")
         return build_clock_spine(
             silver_root=silver_root,
-            exchange=exchange_norm,
-            symbols=symbols,
+            instruments=instruments,
             start_ts_us=start_ts_us,
             end_ts_us=end_ts_us,
             config=config,
+            dim_symbol_version=versions["dim_symbol"],
         )
     if builder_name == "trades":
         if not isinstance(config, TradesSpineConfig):
             raise TypeError("trades builder requires TradesSpineConfig")
         return build_trades_spine(
             silver_root=silver_root,
-            exchange=exchange_norm,
-            symbols=symbols,
+            instruments=instruments,
             start_ts_us=start_ts_us,
             end_ts_us=end_ts_us,
             config=config,
+            trades_version=versions["trades"],
         )
     if builder_name == "volume":
         if not isinstance(config, VolumeSpineConfig):
             raise TypeError("volume builder requires VolumeSpineConfig")
         return build_volume_spine(
             silver_root=silver_root,
-            exchange=exchange_norm,
-            symbols=symbols,
+            instruments=instruments,
             start_ts_us=start_ts_us,
             end_ts_us=end_ts_us,
             config=config,
+            trades_version=versions["trades"],
         )
     if builder_name == "dollar":
         if not isinstance(config, DollarSpineConfig):
             raise TypeError("dollar builder requires DollarSpineConfig")
         return build_dollar_spine(
             silver_root=silver_root,
-            exchange=exchange_norm,
-            symbols=symbols,
+            instruments=instruments,
+            start_ts_us=start_ts_us,
+            end_ts_us=end_ts_us,
+            config=config,
+            trades_version=versions["trades"],
+        )
+    if builder_name == "tick_imbalance":
+        if not isinstance(config, TickImbalanceSpineConfig):
+            raise TypeError("tick_imbalance builder requires TickImbalanceSpineConfig")
+        return build_imbalance_spine(
+            silver_root=silver_root,
+            instruments=instruments,
+            start_ts_us=start_ts_us,
+            end_ts_us=end_ts_us,
+            config=config,
+            trades_version=versions["trades"],
+        )
+    if builder_name == "volume_imbalance":
+        if not isinstance(config, VolumeImbalanceSpineConfig):
+            raise TypeError("volume_imbalance builder requires VolumeImbalanceSpineConfig")
+        return build_imbalance_spine(
+            silver_root=silver_root,
+            instruments=instruments,
             start_ts_us=start_ts_us,
             end_ts_us=end_ts_us,
             config=config,
+            trades_version=versions["trades"],
         )
     raise ValueError(
-        f"Unknown spine builder {builder!r}. Expected one of: clock, trades, volume, dollar"
+        f"Unknown spine builder {builder!r}. Expected one of: {', '.join(_BUILDER_NAMES)}"
     )
 
 
+def _spine_cache_key(
+    *,
+    silver_root: Path,
+    instruments: Mapping[str, list[str]],
+    start_ts_us: int,
+    end_ts_us: int,
+    builder_name: str,
+    config: SpineConfig,
+    versions: Mapping[str, int | None],
+) -> dict[str, object]:
+    dim_path = table_path(silver_root=silver_root, table_name="dim_symbol")
+    key: dict[str, object] = {
+        "kind": "spine",
+        "builder": builder_name,
+        "config": [type(config).__name__, asdict(config)],
+        "instruments": sorted(
+            [exchange, symbol] for exchange, symbols in instruments.items() for symbol in symbols
+        ),
+        "start_ts_us": start_ts_us,
+        "end_ts_us": end_ts_us,
+        "dim_symbol": delta_fingerprint(
+            delta_add_actions(dim_path, version=versions["dim_symbol"])
+        ),
+    }
+    if builder_name != "clock":
+        trades_path = table_path(silver_root=silver_root, table_name="trades")
+        bounds = {
+            exchange: derive_trading_date_bounds(
+                exchange=exchange,
+                start_ts_us=start_ts_us,
+                end_ts_us=end_ts_us,
+            )
+            for exchange in instruments
+        }
+        key["trades"] = delta_fingerprint(
+            delta_add_actions(trades_path, version=versions["trades"]),
+            date_bounds=bounds,
+        )
+    return key
+
+
 def align_to_spine(
     *,
     events: pl.DataFrame,
     spine: pl.DataFrame,
     ts_col: str = "ts_event_us",
     by: tuple[str, str] = ("exchange", "symbol"),
+    preserve_order: bool = True,
 ) -> pl.DataFrame:
     """Assign each event to the next spine bar-end using PIT-safe semantics.
 
     Boundary behavior is explicit: events exactly at spine boundary are aligned
     to the next bar (`event_ts == ts_spine_us` maps forward).
+
+    Events already ordered by ``(*by, ts_col)`` (as ``load_events`` returns them) are
+    joined without any sort. Otherwise they are sorted for the join and, with
+    ``preserve_order``, restored to input order; ``preserve_order=False`` returns
+    them in spine-grouped ``(*by, ts_col)`` order instead and skips that second sort.
     """
     for key in by:
         if key not in events.columns:
@@ -122,22 +657,170 @@ def align_to_spine(
         return events.with_columns(pl.lit(None, dtype=pl.Int64).alias("ts_spine_us"))
 
     by_cols = list(by)
-    left = (
-        events.with_row_index("_row_id")
-        .with_columns((pl.col(ts_col).cast(pl.Int64) + 1).alias("_ts_join"))
-        .sort([*by_cols, "_ts_join", "_row_id"])
-    )
-    right = spine.sort([*by_cols, "ts_spine_us"]).select([*by_cols, "ts_spine_us"])
+    right = spine.select([*by_cols, "ts_spine_us"])
+    if not _is_sorted_by(right, [*by_cols, "ts_spine_us"]):
+        right = right.sort([*by_cols, "ts_spine_us"])
+
+    event_order = [*by_cols, ts_col]
+    if _is_sorted_by(events, event_order):
+        return _join_next_bar(events, right, ts_col=ts_col, by=by_cols)
+    if not preserve_order:
+        left = events.sort(event_order, maintain_order=True)
+        return _join_next_bar(left, right, ts_col=ts_col, by=by_cols)
+
+    left = events.with_row_index("_row_id").sort(event_order, maintain_order=True)
+    out = _join_next_bar(left, right, ts_col=ts_col, by=by_cols)
+    return out.sort("_row_id").drop("_row_id")
 
-    out = left.join_asof(
-        right,
-        left_on="_ts_join",
+
+def _join_next_bar(
+    events: pl.DataFrame,
+    spine: pl.DataFrame,
+    *,
+    ts_col: str,
+    by: list[str],
+) -> pl.DataFrame:
+    """Forward as-of join of ``(*by, ts_col)``-sorted events onto the first bar end > ts."""
+    join_col = ts_col
+    if events.schema[ts_col] != pl.Int64:
+        join_col = "_ts_join"
+        events = events.with_columns(pl.col(ts_col).cast(pl.Int64).alias(join_col))
+    out = events.join_asof(
+        spine,
+        left_on=join_col,
         right_on="ts_spine_us",
-        by=by_cols,
+        by=by,
         strategy="forward",
+        allow_exact_matches=False,
         check_sortedness=False,
     )
-    return out.sort("_row_id").drop(["_row_id", "_ts_join"])
+    return out if join_col == ts_col else out.drop(join_col)
+
+
+def aggregate_to_spine(
+    *,
+    events: pl.DataFrame | pl.LazyFrame,
+    spine: pl.DataFrame,
+    aggs: Sequence[str | pl.Expr] = DEFAULT_BAR_AGGREGATES,
+    ts_col: str = "ts_event_us",
+    by: tuple[str, str] = ("exchange", "symbol"),
+) -> pl.DataFrame | pl.LazyFrame:
+    """Aggregate events into the spine bars they align to; one output row per spine row.
+
+    Bars follow the ``align_to_spine`` boundary rule: the bar ending at ``ts_spine_us``
+    collects events with ``previous bar end <= ts < ts_spine_us``; events after a
+    group's last bar end are dropped. Named ``aggs`` come from ``BAR_AGGREGATES``
+    (``ohlc``, ``volume``, ``notional``, ``vwap``, ``trade_count``, ``signed_volume``)
+    and keep the scaled-integer encoding; ``pl.Expr`` items are applied per bar as-is.
+    Bars without events get zero counts and volumes and null prices.
+
+    Alignment and aggregation run as one plan over ``(*by, ts)``-sorted events (eager
+    input is sorted only if needed). A ``LazyFrame`` of events returns a ``LazyFrame``,
+    so multi-day ``scan_events`` inputs are aggregated without collecting raw rows.
+    """
+    keys = list(by)
+    event_columns = events.collect_schema().names()
+    for key in keys:
+        if key not in event_columns:
+            raise ValueError(f"events missing join key column: {key}")
+        if key not in spine.columns:
+            raise ValueError(f"spine missing join key column: {key}")
+    if ts_col not in event_columns:
+        raise ValueError(f"events missing timestamp column: {ts_col}")
+    if "ts_spine_us" not in spine.columns:
+        raise ValueError("spine missing required column: ts_spine_us")
+
+    exprs: list[pl.Expr] = []
+    fills: dict[str, int] = {}
+    needed = {*keys, ts_col}
+    for agg in aggs:
+        if isinstance(agg, pl.Expr):
+            exprs.append(agg)
+            needed.update(agg.meta.root_names())
+            continue
+        if agg not in BAR_AGGREGATES:
+            raise ValueError(f"Unknown bar aggregate {agg!r}. Available: {sorted(BAR_AGGREGATES)}")
+        spec = BAR_AGGREGATES[agg]
+        exprs.extend(spec.exprs)
+        needed.update(spec.columns)
+        if spec.empty_value is not None:
+            fills.update(
+                dict.fromkeys((e.meta.output_name() for e in spec.exprs), spec.empty_value)
+            )
+    if not exprs:
+        raise ValueError("aggs must be non-empty")
+    missing = sorted(needed - set(event_columns))
+    if missing:
+        raise ValueError(f"events missing columns required by aggs: {missing}")
+    outputs = [expr.meta.output_name() for expr in exprs]
+    clashes = sorted(
+        set(outputs) & set(spine.columns) | {n for n in outputs if outputs.count(n) > 1}
+    )
+    if clashes:
+        raise ValueError(f"aggregate output names clash with spine or each other: {clashes}")
+
+    order = [*keys, "ts_spine_us"]
+    if not _is_sorted_by(spine, order):
+        spine = spine.sort(order)
+    if isinstance(events, pl.DataFrame) and _is_sorted_by(events, [*keys, ts_col]):
+        sorted_events = events.lazy()
+    else:
+        sorted_events = events.lazy().sort([*keys, ts_col], maintain_order=True)
+
+    # Events carry only the matched spine row index, so grouping is on one integer key.
+    spine_rows = spine.lazy().with_row_index("_bar")
+    bars = (
+        sorted_events.select([name for name in event_columns if name in needed])
+        .with_columns(pl.col(ts_col).cast(pl.Int64))
+        .join_asof(
+            spine_rows.select(*order, "_bar"),
+            left_on=ts_col,
+            right_on="ts_spine_us",
+            by=keys,
+            strategy="forward",
+            allow_exact_matches=False,
+            check_sortedness=False,
+        )
+        .filter(pl.col("_bar").is_not_null())
+        .group_by("_bar")
+        .agg(exprs)
+    )
+    out = (
+        spine_rows.join(bars, on="_bar", how="left", maintain_order="left")
+        .drop("_bar")
+        .with_columns(pl.col(name).fill_null(value) for name, value in fills.items())
+    )
+    return out if isinstance(events, pl.LazyFrame) else out.collect()
+
+
+def _normalize_instruments(
+    exchange: str | list[str],
+    symbol: str | list[str] | list[tuple[str, str]],
+) -> dict[str, list[str]]:
+    """Map each requested exchange to its symbols (order kept, duplicates dropped)."""
+    exchanges = [exchange] if isinstance(exchange, str) else list(exchange)
+    exchanges = list(dict.fromkeys(item.strip().lower() for item in exchanges))
+    if not exchanges or not all(exchanges):
+        raise ValueError("exchange must be non-empty")
+
+    items = [symbol] if isinstance(symbol, str) else list(symbol)
+    if all(isinstance(item, str) for item in items):
+        symbols = _normalize_symbols([item for item in items if isinstance(item, str)])
+        return {name: list(symbols) for name in exchanges}
+
+    pairs = [item for item in items if isinstance(item, tuple) and len(item) == 2]
+    if len(pairs) != len(items):
+        raise ValueError("symbol must be all symbols or all (exchange, symbol) pairs")
+    instruments: dict[str, list[str]] = {name: [] for name in exchanges}
+    for pair_exchange, pair_symbol in pairs:
+        name = pair_exchange.strip().lower()
+        if name not in instruments:
+            raise ValueError(f"pair exchange {pair_exchange!r} is not in exchange={exchanges}")
+        instruments[name].extend(_normalize_symbols(pair_symbol))
+    empty = [name for name, symbols in instruments.items() if not symbols]
+    if empty:
+        raise ValueError(f"no symbols requested for exchanges: {empty}")
+    return {name: list(dict.fromkeys(symbols)) for name, symbols in instruments.items()}
 
 
 def _normalize_symbols(symbol: str | list[str]) -> list[str]:
@@ -152,9 +835,14 @@ def _normalize_symbols(symbol: str | list[str]) -> list[str]:
 __all__ = [
     "ClockSpineConfig",
     "DollarSpineConfig",
+    "ThresholdSpineState",
+    "TickImbalanceSpineConfig",
     "TradesSpineConfig",
+    "VolumeImbalanceSpineConfig",
     "VolumeSpineConfig",
+    "aggregate_to_spine",
     "align_to_spine",
     "build_spine",
     "empty_spine_frame",
+    "extend_threshold_spine",
 ]
@@ -25,7 +25,7 @@ INGEST_MANIFEST = TableSpec(
         ColumnSpec("processed_at_ts_us", pl.Int64, nullable=True),
         ColumnSpec("status_reason", pl.Utf8, nullable=True),
     ),
-    partition_by=(),
+    partition_by=("vendor", "data_type"),
     business_keys=("vendor", "data_type", "bronze_path", "file_hash"),
     tie_break_keys=("file_id",),
     schema_version="v2",
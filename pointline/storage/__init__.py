@@ -11,6 +11,7 @@ from pointline.storage.contracts import (
 from pointline.storage.models import (
     CompactionReport,
     ManifestIdentity,
+    ManifestStatusUpdate,
     PartitionCompactionResult,
     VacuumReport,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "DimensionStore",
     "EventStore",
     "ManifestIdentity",
+    "ManifestStatusUpdate",
     "ManifestStore",
     "PartitionCompactionResult",
     "PartitionOptimizer",
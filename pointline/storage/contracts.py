@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 import polars as pl
 
 from pointline.protocols import BronzeFileMetadata
-from pointline.storage.models import CompactionReport, VacuumReport
+from pointline.storage.models import CompactionReport, ManifestStatusUpdate, VacuumReport
 
 if TYPE_CHECKING:
     from pointline.ingestion.models import IngestionResult
@@ -20,6 +20,9 @@ class ManifestStore(Protocol):
     def resolve_file_id(self, meta: BronzeFileMetadata) -> int:
         """Return stable file_id for a manifest identity, creating pending state if needed."""
 
+    def resolve_file_ids(self, metas: list[BronzeFileMetadata]) -> list[int]:
+        """Return file_ids aligned with ``metas``, creating pending state in one write."""
+
     def filter_pending(self, candidates: list[BronzeFileMetadata]) -> list[BronzeFileMetadata]:
         """Return candidates that are not already successful in manifest state."""
 
@@ -32,6 +35,9 @@ class ManifestStore(Protocol):
     ) -> None:
         """Persist final ingestion status for a file_id."""
 
+    def update_statuses(self, updates: list[ManifestStatusUpdate]) -> None:
+        """Persist many final ingestion statuses in one write."""
+
 
 @runtime_checkable
 class EventStore(Protocol):
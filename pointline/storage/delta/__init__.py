@@ -2,6 +2,7 @@
 
 from pointline.storage.delta.dimension_store import DeltaDimensionStore
 from pointline.storage.delta.event_store import DeltaEventStore
+from pointline.storage.delta.file_index import DeltaFileIndex
 from pointline.storage.delta.manifest_store import DeltaManifestStore
 from pointline.storage.delta.optimizer_store import DeltaPartitionOptimizer
 from pointline.storage.delta.quarantine_store import DeltaQuarantineStore
@@ -9,6 +10,7 @@ from pointline.storage.delta.quarantine_store import DeltaQuarantineStore
 __all__ = [
     "DeltaDimensionStore",
     "DeltaEventStore",
+    "DeltaFileIndex",
     "DeltaManifestStore",
     "DeltaPartitionOptimizer",
     "DeltaQuarantineStore",
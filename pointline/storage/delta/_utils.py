@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from pathlib import Path
 
 import polars as pl
-from deltalake import write_deltalake
+from deltalake import DeltaTable, write_deltalake
 
 from pointline.schemas.types import TableSpec
 
@@ -42,16 +43,59 @@ def normalize_to_spec(df: pl.DataFrame, spec: TableSpec) -> pl.DataFrame:
     return df.with_columns(casts).select(spec.columns())
 
 
-def read_delta_or_empty(path: Path, *, spec: TableSpec) -> pl.DataFrame:
+def read_delta_or_empty(
+    path: Path,
+    *,
+    spec: TableSpec,
+    version: int | None = None,
+) -> pl.DataFrame:
     if not path.exists():
         return empty_frame_for_spec(spec)
     try:
-        df = pl.read_delta(str(path))
+        df = pl.read_delta(str(path), version=version)
     except Exception:
+        if version is not None:
+            raise
         return empty_frame_for_spec(spec)
     return normalize_to_spec(df, spec)
 
 
+def resolve_delta_version(
+    path: Path,
+    *,
+    version: int | None = None,
+    as_of_ts_us: int | None = None,
+) -> int | None:
+    """Pin a table version: ``version`` as given, or the version current at ``as_of_ts_us``.
+
+    Returns None (read the latest state) when neither is given or the table does not exist.
+    """
+    if version is not None and as_of_ts_us is not None:
+        raise ValueError("Pass at most one of version / as_of_ts_us")
+    if not path.exists():
+        return None
+    if version is not None:
+        if version < 0:
+            raise ValueError(f"Delta version must be >= 0, got {version}")
+        return version
+    if as_of_ts_us is None:
+        return None
+
+    table = DeltaTable(str(path))
+    table.load_as_version(datetime.fromtimestamp(as_of_ts_us / 1_000_000, tz=timezone.utc))
+    return int(table.version())
+
+
+def existing_partition_by(path: Path, *, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the partition columns of an existing table, or ``default`` for new tables."""
+    if not path.exists():
+        return default
+    try:
+        return tuple(DeltaTable(str(path)).metadata().partition_columns)
+    except Exception:
+        return default
+
+
 def append_delta(path: Path, *, df: pl.DataFrame, partition_by: tuple[str, ...]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     mode = "append" if path.exists() else "overwrite"
@@ -37,8 +37,9 @@ class DeltaDimensionStore(DimensionStore):
             dim_symbol_path = table_path(silver_root=silver_root, table_name="dim_symbol")
         self.dim_symbol_path = dim_symbol_path
 
-    def load_dim_symbol(self) -> pl.DataFrame:
-        df = read_delta_or_empty(self.dim_symbol_path, spec=DIM_SYMBOL)
+    def load_dim_symbol(self, *, version: int | None = None) -> pl.DataFrame:
+        """Load dim_symbol, optionally as of a committed Delta ``version``."""
+        df = read_delta_or_empty(self.dim_symbol_path, spec=DIM_SYMBOL, version=version)
         validate_against_spec(df, DIM_SYMBOL)
         return df
 
@@ -37,8 +37,9 @@ class DeltaEventStore(EventStore):
             raise ValueError(f"DeltaEventStore only accepts event tables, got '{table_name}'")
 
         validate_against_spec(df, spec)
+        # Files are written in tie-break order so readers can usually skip the sort.
         append_delta(
             self._resolve_path(table_name),
-            df=df,
+            df=df.sort(list(spec.tie_break_keys)),
             partition_by=spec.partition_by,
         )
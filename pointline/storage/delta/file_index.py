@@ -0,0 +1,222 @@
+"""File-level skipping index for v2 event tables.
+
+Delta partitions prune by ``(exchange, trading_date)`` only; within a partition a reader
+still opens every data file to evaluate symbol predicates. This index records, per live
+data file, its partition values and the symbol / symbol_id / ts_event_us ranges taken
+from the add-action statistics, so readers can open just the files that may match.
+
+The index is a parquet sidecar under ``<silver_root>/_indexes/<table>/`` (outside the
+Delta directory so vacuum never touches it). It is tagged with the Delta version it was
+built from (in the parquet footer, so an index of a table with no live files still
+carries it) and rebuilt on read when the table has moved on, so appends, compaction and
+rewrites never leave it stale. Where the index directory is not writable, e.g. a
+read-only research mount, the rebuilt index is used in memory only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from collections.abc import Mapping
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+import polars as pl
+from deltalake import DeltaTable
+
+from pointline.schemas.registry import get_table_spec
+from pointline.storage.delta.layout import table_path
+
+FILE_INDEX_SCHEMA: dict[str, pl.DataType] = {
+    "table_version": pl.Int64(),
+    "path": pl.Utf8(),
+    "exchange": pl.Utf8(),
+    "trading_date": pl.Date(),
+    "num_records": pl.Int64(),
+    "symbol_min": pl.Utf8(),
+    "symbol_max": pl.Utf8(),
+    "symbol_id_min": pl.Int64(),
+    "symbol_id_max": pl.Int64(),
+    "ts_min_us": pl.Int64(),
+    "ts_max_us": pl.Int64(),
+    "file_id_min": pl.Int64(),
+    "file_id_max": pl.Int64(),
+}
+
+# Files sorted this way concatenate into tie-break order whenever their key ranges are
+# disjoint, which is the common one-symbol-per-file layout.
+_ORDERING_COLUMNS = ["exchange", "symbol_id_min", "ts_min_us", "file_id_min", "path"]
+
+_INDEX_FILE = "file_index.parquet"
+_VERSION_METADATA_KEY = "pointline.table_version"
+# delta-rs truncates long string statistics; a max at this length may not be an upper bound.
+_STRING_STAT_TRUNCATE_LEN = 32
+
+
+def latest_delta_version(path: Path) -> int | None:
+    """Latest committed version, from the ``_delta_log`` listing (no log replay)."""
+    log_dir = path / "_delta_log"
+    if not log_dir.exists():
+        return None
+    versions = [
+        int(entry.name[: -len(".json")])
+        for entry in os.scandir(log_dir)
+        if entry.name.endswith(".json") and entry.name[: -len(".json")].isdigit()
+    ]
+    return max(versions) if versions else None
+
+
+class DeltaFileIndex:
+    """Maintain and query per-file skipping indexes for v2 event tables."""
+
+    def __init__(
+        self,
+        *,
+        silver_root: Path,
+        table_paths: Mapping[str, Path] | None = None,
+        index_root: Path | None = None,
+    ) -> None:
+        self.silver_root = silver_root
+        self.table_paths = dict(table_paths or {})
+        self.index_root = index_root or silver_root / "_indexes"
+
+    def _resolve_path(self, table_name: str) -> Path:
+        override = self.table_paths.get(table_name)
+        if override is not None:
+            return override
+        return table_path(silver_root=self.silver_root, table_name=table_name)
+
+    def _index_path(self, table_name: str) -> Path:
+        return self.index_root / table_name / _INDEX_FILE
+
+    def load(self, table_name: str, *, version: int | None = None) -> pl.DataFrame | None:
+        """Return the index for ``table_name``, rebuilding it if the table has new commits.
+
+        With ``version``, the index of that historical table state is built in memory;
+        only the latest state is persisted. Returns None when the table does not exist.
+        """
+        latest = latest_delta_version(self._resolve_path(table_name))
+        if latest is None:
+            return None
+        if version is not None and version != latest:
+            table = DeltaTable(str(self._resolve_path(table_name)), version=version)
+            return _index_from_add_actions(
+                pl.DataFrame(table.get_add_actions(flatten=True)),
+                table_version=version,
+            )
+        version = latest
+
+        index_path = self._index_path(table_name)
+        if index_path.exists():
+            stored = pl.read_parquet_metadata(index_path).get(_VERSION_METADATA_KEY)
+            if stored == str(version):
+                return pl.read_parquet(index_path)
+        return self.refresh(table_name)
+
+    def refresh(self, table_name: str) -> pl.DataFrame | None:
+        """Rebuild the index from the table's add-action statistics and persist it.
+
+        A failed write (read-only or shared lake) is not an error: the rebuilt index is
+        returned without being persisted.
+        """
+        spec = get_table_spec(table_name)
+        if spec.kind != "event":
+            raise ValueError(f"DeltaFileIndex only indexes event tables, got '{table_name}'")
+
+        path = self._resolve_path(table_name)
+        if latest_delta_version(path) is None:
+            return None
+
+        table = DeltaTable(str(path))
+        table_version = table.version()
+        index = _index_from_add_actions(
+            pl.DataFrame(table.get_add_actions(flatten=True)),
+            table_version=table_version,
+        )
+
+        index_path = self._index_path(table_name)
+        tmp_path = index_path.with_name(f".{index_path.name}.{uuid4().hex}.tmp")
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index.write_parquet(tmp_path, metadata={_VERSION_METADATA_KEY: str(table_version)})
+            os.replace(tmp_path, index_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+        return index
+
+    def candidate_files(
+        self,
+        table_name: str,
+        *,
+        date_bounds: Mapping[str, tuple[date, date]],
+        symbols: list[str],
+        start_ts_us: int,
+        end_ts_us: int,
+        version: int | None = None,
+    ) -> pl.DataFrame | None:
+        """Index rows for files that may hold ``symbols`` in ``[start_ts_us, end_ts_us)``.
+
+        ``date_bounds`` maps exchange to an inclusive ``trading_date`` range. ``path`` is
+        absolute in the result, and rows are ordered by their leading tie-break key
+        ranges. Returns None when the table does not exist.
+        """
+        index = self.load(table_name, version=version)
+        if index is None:
+            return None
+
+        partition_predicate = pl.lit(False)
+        for exchange, (start_date, end_date) in date_bounds.items():
+            partition_predicate = partition_predicate | (
+                (pl.col("exchange") == exchange)
+                & pl.col("trading_date").is_between(start_date, end_date)
+            )
+
+        # Missing statistics mean "unknown", which never excludes a file.
+        symbol_predicate = pl.lit(False)
+        for symbol in symbols:
+            symbol_predicate = symbol_predicate | (
+                (pl.col("symbol_min").is_null() | (pl.col("symbol_min") <= symbol))
+                & (
+                    pl.col("symbol_max").is_null()
+                    | (pl.col("symbol_max").str.len_chars() >= _STRING_STAT_TRUNCATE_LEN)
+                    | (pl.col("symbol_max") >= symbol)
+                )
+            )
+        ts_predicate = (pl.col("ts_min_us").is_null() | (pl.col("ts_min_us") < end_ts_us)) & (
+            pl.col("ts_max_us").is_null() | (pl.col("ts_max_us") >= start_ts_us)
+        )
+
+        root = self._resolve_path(table_name)
+        return (
+            index.filter(partition_predicate & symbol_predicate & ts_predicate)
+            .with_columns((pl.lit(f"{root}/") + pl.col("path")).alias("path"))
+            .sort(_ORDERING_COLUMNS, nulls_last=True)
+        )
+
+
+def _index_from_add_actions(actions: pl.DataFrame, *, table_version: int) -> pl.DataFrame:
+    def stat(name: str, dtype: pl.DataType) -> pl.Expr:
+        if name in actions.columns:
+            return pl.col(name).cast(dtype)
+        return pl.lit(None, dtype=dtype)
+
+    if actions.is_empty():
+        return pl.DataFrame(schema=FILE_INDEX_SCHEMA)
+
+    return actions.select(
+        pl.lit(table_version, dtype=pl.Int64).alias("table_version"),
+        pl.col("path"),
+        stat("partition.exchange", pl.Utf8()).alias("exchange"),
+        stat("partition.trading_date", pl.Date()).alias("trading_date"),
+        stat("num_records", pl.Int64()).alias("num_records"),
+        stat("min.symbol", pl.Utf8()).alias("symbol_min"),
+        stat("max.symbol", pl.Utf8()).alias("symbol_max"),
+        stat("min.symbol_id", pl.Int64()).alias("symbol_id_min"),
+        stat("max.symbol_id", pl.Int64()).alias("symbol_id_max"),
+        stat("min.ts_event_us", pl.Int64()).alias("ts_min_us"),
+        stat("max.ts_event_us", pl.Int64()).alias("ts_max_us"),
+        stat("min.file_id", pl.Int64()).alias("file_id_min"),
+        stat("max.file_id", pl.Int64()).alias("file_id_max"),
+    )
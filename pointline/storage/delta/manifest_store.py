@@ -7,6 +7,7 @@ from time import time_ns
 
 import filelock
 import polars as pl
+from deltalake import DeltaTable
 
 from pointline.ingestion.models import IngestionResult
 from pointline.protocols import BronzeFileMetadata
@@ -19,11 +20,16 @@ from pointline.schemas.types import (
 )
 from pointline.storage.contracts import ManifestStore
 from pointline.storage.delta._utils import (
+    append_delta,
+    existing_partition_by,
     normalize_to_spec,
-    overwrite_delta,
-    read_delta_or_empty,
 )
-from pointline.storage.models import ManifestIdentity
+from pointline.storage.models import ManifestIdentity, ManifestStatusUpdate
+
+_IDENTITY_COLUMNS = ["vendor", "data_type", "bronze_path", "file_hash"]
+
+# Partition columns are repeated in the join predicate so MERGE can prune files.
+_MERGE_PREDICATE = "t.vendor = s.vendor AND t.data_type = s.data_type AND t.file_id = s.file_id"
 
 
 def _now_us() -> int:
@@ -39,6 +45,10 @@ class _FileIdCounter:
         self.counter_path.parent.mkdir(parents=True, exist_ok=True)
 
     def next_id(self, *, existing_max: int) -> int:
+        return self.next_ids(1, existing_max=existing_max)[0]
+
+    def next_ids(self, count: int, *, existing_max: int) -> range:
+        """Allocate a contiguous block of ``count`` file_ids."""
         lock = filelock.FileLock(self.lock_path, timeout=30)
         with lock:
             current = 0
@@ -47,13 +57,19 @@ class _FileIdCounter:
                 if raw:
                     current = int(raw)
             base = max(current, existing_max)
-            next_id = base + 1
-            self.counter_path.write_text(str(next_id), encoding="utf-8")
-            return next_id
+            if count > 0:
+                self.counter_path.write_text(str(base + count), encoding="utf-8")
+            return range(base + 1, base + count + 1)
 
 
 class DeltaManifestStore(ManifestStore):
-    """v2-owned manifest persistence on Delta Lake."""
+    """v2-owned manifest persistence on Delta Lake.
+
+    The manifest is partitioned by ``(vendor, data_type)``. Lookups are lazy scans with
+    partition/identity predicates pushed down and a vectorized join against the candidate
+    batch; new identities are appended and status updates are a Delta ``MERGE`` on
+    ``file_id``, so no call rewrites the whole table.
+    """
 
     def __init__(self, table_path: Path) -> None:
         self.table_path = table_path
@@ -64,98 +80,162 @@ class DeltaManifestStore(ManifestStore):
         )
         self._counter = _FileIdCounter(table_path.parent / ".v2_manifest_file_id")
 
-    def _read(self) -> pl.DataFrame:
-        return read_delta_or_empty(self.table_path, spec=self.spec)
+    def _scan(self) -> pl.LazyFrame | None:
+        if not self.table_path.exists():
+            return None
+        try:
+            return pl.scan_delta(str(self.table_path))
+        except Exception:
+            return None
+
+    def _partition_by(self) -> tuple[str, ...]:
+        # Tables created before manifest partitioning keep their original layout.
+        return existing_partition_by(self.table_path, default=self.spec.partition_by)
 
-    def _write(self, df: pl.DataFrame) -> None:
+    def _append(self, df: pl.DataFrame) -> None:
         normalized = normalize_to_spec(df, self.spec)
-        overwrite_delta(self.table_path, df=normalized, partition_by=self.spec.partition_by)
-
-    def _identity_filter(self, meta: BronzeFileMetadata) -> pl.Expr:
-        identity = ManifestIdentity.from_meta(meta)
-        return (
-            (pl.col("vendor") == identity.vendor)
-            & (pl.col("data_type") == identity.data_type)
-            & (pl.col("bronze_path") == identity.bronze_path)
-            & (pl.col("file_hash") == identity.file_hash)
+        append_delta(self.table_path, df=normalized, partition_by=self._partition_by())
+
+    def _candidate_frame(self, metas: list[BronzeFileMetadata]) -> pl.DataFrame:
+        return pl.DataFrame(
+            [ManifestIdentity.from_meta(meta).as_tuple() for meta in metas],
+            schema=dict.fromkeys(_IDENTITY_COLUMNS, pl.Utf8),
+            orient="row",
+        ).with_row_index("_candidate_idx")
+
+    def _identity_matches(self, manifest: pl.LazyFrame, candidates: pl.DataFrame) -> pl.LazyFrame:
+        """Restrict ``manifest`` to rows whose identity appears in ``candidates``."""
+        pushed = (
+            pl.col("vendor").is_in(candidates["vendor"].unique().implode())
+            & pl.col("data_type").is_in(candidates["data_type"].unique().implode())
+            & pl.col("bronze_path").is_in(candidates["bronze_path"].unique().implode())
+        )
+        return manifest.filter(pushed).join(
+            candidates.lazy().select(_IDENTITY_COLUMNS).unique(),
+            on=_IDENTITY_COLUMNS,
+            how="semi",
         )
 
-    def _existing_created_at(self, df: pl.DataFrame, file_id: int) -> int | None:
-        if df.is_empty():
-            return None
-        existing = df.filter(pl.col("file_id") == file_id)
-        if existing.is_empty():
-            return None
-        value = existing.item(0, "created_at_ts_us")
-        return int(value) if value is not None else None
+    def _existing_max_file_id(self, manifest: pl.LazyFrame) -> int:
+        max_val = manifest.select(pl.col("file_id").max()).collect().item()
+        return int(max_val) if max_val is not None else 0
 
-    def resolve_file_id(self, meta: BronzeFileMetadata) -> int:
-        with self._lock:
-            manifest = self._read()
-            existing = manifest.filter(self._identity_filter(meta))
-            if not existing.is_empty():
-                return int(existing.sort("file_id").item(0, "file_id"))
-
-            existing_max = 0
-            if not manifest.is_empty():
-                max_val = manifest.select(pl.col("file_id").max()).item()
-                if max_val is not None:
-                    existing_max = int(max_val)
-
-            file_id = self._counter.next_id(existing_max=existing_max)
-            now_us = _now_us()
-            pending = pl.DataFrame(
+    def _pending_rows(self, assignments: list[tuple[int, BronzeFileMetadata]]) -> pl.DataFrame:
+        now_us = _now_us()
+        return pl.DataFrame(
+            {
+                "file_id": [file_id for file_id, _ in assignments],
+                "vendor": [meta.vendor for _, meta in assignments],
+                "data_type": [meta.data_type for _, meta in assignments],
+                "bronze_path": [meta.bronze_file_path for _, meta in assignments],
+                "file_hash": [meta.sha256 for _, meta in assignments],
+                "status": [INGEST_STATUS_PENDING] * len(assignments),
+                "rows_total": [None] * len(assignments),
+                "rows_written": [None] * len(assignments),
+                "rows_quarantined": [None] * len(assignments),
+                "trading_date_min": [None] * len(assignments),
+                "trading_date_max": [None] * len(assignments),
+                "created_at_ts_us": [now_us] * len(assignments),
+                "processed_at_ts_us": [None] * len(assignments),
+                "status_reason": [None] * len(assignments),
+            },
+            schema=self.spec.to_polars(),
+        )
+
+    def _status_rows(self, updates: list[ManifestStatusUpdate]) -> pl.DataFrame:
+        now_us = _now_us()
+        rows: list[dict[str, object]] = []
+        for update in updates:
+            result = update.result
+            status_reason: str | None = None
+            if result is not None:
+                status_reason = result.failure_reason
+                if status_reason is None and update.status == INGEST_STATUS_FAILED:
+                    status_reason = result.error_message or "unknown_error"
+            if status_reason is None and update.status == INGEST_STATUS_FAILED:
+                status_reason = "unknown_error"
+
+            rows.append(
                 {
-                    "file_id": [file_id],
-                    "vendor": [meta.vendor],
-                    "data_type": [meta.data_type],
-                    "bronze_path": [meta.bronze_file_path],
-                    "file_hash": [meta.sha256],
-                    "status": [INGEST_STATUS_PENDING],
-                    "rows_total": [None],
-                    "rows_written": [None],
-                    "rows_quarantined": [None],
-                    "trading_date_min": [None],
-                    "trading_date_max": [None],
-                    "created_at_ts_us": [now_us],
-                    "processed_at_ts_us": [None],
-                    "status_reason": [None],
-                },
-                schema=self.spec.to_polars(),
+                    "file_id": update.file_id,
+                    "vendor": update.meta.vendor,
+                    "data_type": update.meta.data_type,
+                    "bronze_path": update.meta.bronze_file_path,
+                    "file_hash": update.meta.sha256,
+                    "status": update.status,
+                    "rows_total": result.row_count if result else None,
+                    "rows_written": result.rows_written if result else None,
+                    "rows_quarantined": result.rows_quarantined if result else None,
+                    "trading_date_min": result.trading_date_min if result else None,
+                    "trading_date_max": result.trading_date_max if result else None,
+                    "created_at_ts_us": now_us,
+                    "processed_at_ts_us": now_us,
+                    "status_reason": status_reason,
+                }
             )
-            updated = (
-                pending if manifest.is_empty() else pl.concat([manifest, pending], how="vertical")
-            )
-            self._write(updated.sort("file_id"))
-            return file_id
+        return pl.DataFrame(rows, schema=self.spec.to_polars())
+
+    def resolve_file_id(self, meta: BronzeFileMetadata) -> int:
+        return self.resolve_file_ids([meta])[0]
+
+    def resolve_file_ids(self, metas: list[BronzeFileMetadata]) -> list[int]:
+        if not metas:
+            return []
+
+        with self._lock:
+            manifest = self._scan()
+
+            resolved: dict[tuple[str, str, str, str], int] = {}
+            if manifest is not None:
+                existing = (
+                    self._identity_matches(manifest, self._candidate_frame(metas))
+                    .group_by(_IDENTITY_COLUMNS)
+                    .agg(pl.col("file_id").min())
+                    .collect()
+                )
+                for vendor, data_type, bronze_path, file_hash, file_id in existing.iter_rows():
+                    resolved[(vendor, data_type, bronze_path, file_hash)] = int(file_id)
+
+            missing: list[BronzeFileMetadata] = []
+            seen_missing: set[tuple[str, str, str, str]] = set()
+            for meta in metas:
+                key = ManifestIdentity.from_meta(meta).as_tuple()
+                if key not in resolved and key not in seen_missing:
+                    seen_missing.add(key)
+                    missing.append(meta)
+
+            if missing:
+                existing_max = 0 if manifest is None else self._existing_max_file_id(manifest)
+                file_ids = self._counter.next_ids(len(missing), existing_max=existing_max)
+                assignments = list(zip(file_ids, missing, strict=True))
+                for file_id, meta in assignments:
+                    resolved[ManifestIdentity.from_meta(meta).as_tuple()] = file_id
+                self._append(self._pending_rows(assignments))
+
+            return [resolved[ManifestIdentity.from_meta(meta).as_tuple()] for meta in metas]
 
     def filter_pending(self, candidates: list[BronzeFileMetadata]) -> list[BronzeFileMetadata]:
         if not candidates:
             return []
 
-        manifest = self._read()
-        if manifest.is_empty():
+        manifest = self._scan()
+        if manifest is None:
             return candidates
 
-        success = manifest.filter(pl.col("status") == INGEST_STATUS_SUCCESS)
-        if success.is_empty():
-            return candidates
-
-        success_keys = set(
-            success.select(["vendor", "data_type", "bronze_path", "file_hash"]).iter_rows()
+        candidate_df = self._candidate_frame(candidates)
+        success = self._identity_matches(
+            manifest.filter(pl.col("status") == INGEST_STATUS_SUCCESS),
+            candidate_df,
+        ).select(_IDENTITY_COLUMNS)
+        pending_idx = (
+            candidate_df.lazy()
+            .join(success, on=_IDENTITY_COLUMNS, how="anti")
+            .select("_candidate_idx")
+            .collect()
+            .get_column("_candidate_idx")
+            .sort()
         )
-
-        pending: list[BronzeFileMetadata] = []
-        for candidate in candidates:
-            key = (
-                candidate.vendor,
-                candidate.data_type,
-                candidate.bronze_file_path,
-                candidate.sha256,
-            )
-            if key not in success_keys:
-                pending.append(candidate)
-        return pending
+        return [candidates[idx] for idx in pending_idx]
 
     def update_status(
         self,
@@ -164,49 +244,39 @@ class DeltaManifestStore(ManifestStore):
         meta: BronzeFileMetadata,
         result: IngestionResult | None = None,
     ) -> None:
-        if status not in INGEST_STATUS_VALUES:
-            raise ValueError(f"Unsupported ingest status {status!r}")
+        self.update_statuses([ManifestStatusUpdate(file_id, status, meta, result)])
 
-        with self._lock:
-            manifest = self._read()
-            now_us = _now_us()
-            created_at = self._existing_created_at(manifest, file_id) or now_us
+    def update_statuses(self, updates: list[ManifestStatusUpdate]) -> None:
+        if not updates:
+            return
+        for update in updates:
+            if update.status not in INGEST_STATUS_VALUES:
+                raise ValueError(f"Unsupported ingest status {update.status!r}")
 
-            status_reason: str | None = None
-            if result is not None:
-                status_reason = result.failure_reason
-                if status_reason is None and status == INGEST_STATUS_FAILED:
-                    status_reason = result.error_message or "unknown_error"
-            if status_reason is None and status == INGEST_STATUS_FAILED:
-                status_reason = "unknown_error"
+        # Later updates for the same file_id win, matching sequential update_status calls.
+        latest = list({update.file_id: update for update in updates}.values())
+        source = normalize_to_spec(self._status_rows(latest), self.spec)
 
-            row = pl.DataFrame(
-                {
-                    "file_id": [file_id],
-                    "vendor": [meta.vendor],
-                    "data_type": [meta.data_type],
-                    "bronze_path": [meta.bronze_file_path],
-                    "file_hash": [meta.sha256],
-                    "status": [status],
-                    "rows_total": [result.row_count if result else None],
-                    "rows_written": [result.rows_written if result else None],
-                    "rows_quarantined": [result.rows_quarantined if result else None],
-                    "trading_date_min": [result.trading_date_min if result else None],
-                    "trading_date_max": [result.trading_date_max if result else None],
-                    "created_at_ts_us": [created_at],
-                    "processed_at_ts_us": [now_us],
-                    "status_reason": [status_reason],
-                },
-                schema=self.spec.to_polars(),
-            )
+        with self._lock:
+            if self._scan() is None:
+                self._append(source)
+                return
 
-            if manifest.is_empty():
-                updated = row
-            else:
-                without_current = manifest.filter(pl.col("file_id") != file_id)
-                updated = (
-                    row
-                    if without_current.is_empty()
-                    else pl.concat([without_current, row], how="vertical")
+            updates_by_column = {
+                name: f"s.{name}" for name in self.spec.columns() if name != "created_at_ts_us"
+            }
+            updates_by_column["created_at_ts_us"] = (
+                "coalesce(t.created_at_ts_us, s.created_at_ts_us)"
+            )
+            (
+                DeltaTable(str(self.table_path))
+                .merge(
+                    source.to_arrow(),
+                    predicate=_MERGE_PREDICATE,
+                    source_alias="s",
+                    target_alias="t",
                 )
-            self._write(updated.sort("file_id"))
+                .when_matched_update(updates=updates_by_column)
+                .when_not_matched_insert_all()
+                .execute()
+            )
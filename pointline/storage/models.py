@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from pointline.protocols import BronzeFileMetadata
 
+if TYPE_CHECKING:
+    from pointline.ingestion.models import IngestionResult
+
 
 @dataclass(frozen=True)
 class ManifestIdentity:
@@ -27,6 +31,14 @@ class ManifestIdentity:
         return (self.vendor, self.data_type, self.bronze_path, self.file_hash)
 
 
+@dataclass(frozen=True)
+class ManifestStatusUpdate:
+    file_id: int
+    status: str
+    meta: BronzeFileMetadata
+    result: IngestionResult | None = None
+
+
 @dataclass(frozen=True)
 class PartitionCompactionResult:
     partition: tuple[tuple[str, str], ...]
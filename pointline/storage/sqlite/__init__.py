@@ -0,0 +1,5 @@
+"""SQLite-backed v2 storage adapters."""
+
+from pointline.storage.sqlite.manifest_store import SqliteManifestStore
+
+__all__ = ["SqliteManifestStore"]
@@ -0,0 +1,301 @@
+"""SQLite-backed manifest store for single-node v2 ingestion.
+
+The manifest access pattern (identity point lookups, single-row status updates, file_id
+allocation) maps onto an embedded transactional store far better than onto rewriting a
+Delta table. The Delta ``ingest_manifest`` table remains the research-facing copy and is
+refreshed with :meth:`SqliteManifestStore.export_to_delta`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from datetime import date
+from pathlib import Path
+from time import time_ns
+
+import polars as pl
+
+from pointline.ingestion.models import IngestionResult
+from pointline.protocols import BronzeFileMetadata
+from pointline.schemas.control import INGEST_MANIFEST
+from pointline.schemas.types import (
+    INGEST_STATUS_FAILED,
+    INGEST_STATUS_PENDING,
+    INGEST_STATUS_SUCCESS,
+    INGEST_STATUS_VALUES,
+)
+from pointline.storage.contracts import ManifestStore
+from pointline.storage.delta._utils import (
+    existing_partition_by,
+    normalize_to_spec,
+    overwrite_delta,
+    read_delta_or_empty,
+)
+from pointline.storage.models import ManifestIdentity, ManifestStatusUpdate
+
+_TABLE = "ingest_manifest"
+_DATE_COLUMNS = ("trading_date_min", "trading_date_max")
+
+_SCHEMA_SQL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {_TABLE} (
+        file_id INTEGER PRIMARY KEY,
+        vendor TEXT NOT NULL,
+        data_type TEXT NOT NULL,
+        bronze_path TEXT NOT NULL,
+        file_hash TEXT NOT NULL,
+        status TEXT NOT NULL,
+        rows_total INTEGER,
+        rows_written INTEGER,
+        rows_quarantined INTEGER,
+        trading_date_min TEXT,
+        trading_date_max TEXT,
+        created_at_ts_us INTEGER NOT NULL,
+        processed_at_ts_us INTEGER,
+        status_reason TEXT
+    )
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS {_TABLE}_identity
+    ON {_TABLE} (vendor, data_type, bronze_path, file_hash)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS file_id_counter (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        last_file_id INTEGER NOT NULL
+    )
+    """,
+)
+
+_IDENTITY_WHERE = "vendor = ? AND data_type = ? AND bronze_path = ? AND file_hash = ?"
+
+
+def _now_us() -> int:
+    return time_ns() // 1_000
+
+
+def _date_to_text(value: date | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+class SqliteManifestStore(ManifestStore):
+    """v2 manifest persistence in a local SQLite database (WAL mode)."""
+
+    def __init__(self, db_path: Path, *, timeout_s: float = 30.0) -> None:
+        self.db_path = db_path
+        self.spec = INGEST_MANIFEST
+        self.timeout_s = timeout_s
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA_SQL:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with closing(
+            sqlite3.connect(self.db_path, timeout=self.timeout_s, isolation_level=None)
+        ) as conn:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front so concurrent writers serialize
+        # on file_id allocation instead of failing at commit.
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _allocate(self, conn: sqlite3.Connection, count: int) -> range:
+        row = conn.execute(
+            f"""
+            SELECT MAX(
+                COALESCE((SELECT last_file_id FROM file_id_counter WHERE id = 1), 0),
+                COALESCE((SELECT MAX(file_id) FROM {_TABLE}), 0)
+            )
+            """
+        ).fetchone()
+        base = int(row[0])
+        conn.execute(
+            """
+            INSERT INTO file_id_counter (id, last_file_id) VALUES (1, ?)
+            ON CONFLICT(id) DO UPDATE SET last_file_id = excluded.last_file_id
+            """,
+            (base + count,),
+        )
+        return range(base + 1, base + count + 1)
+
+    def resolve_file_id(self, meta: BronzeFileMetadata) -> int:
+        return self.resolve_file_ids([meta])[0]
+
+    def resolve_file_ids(self, metas: list[BronzeFileMetadata]) -> list[int]:
+        if not metas:
+            return []
+
+        with self._transaction() as conn:
+            resolved: dict[tuple[str, str, str, str], int] = {}
+            missing: dict[tuple[str, str, str, str], None] = {}
+            for meta in metas:
+                key = ManifestIdentity.from_meta(meta).as_tuple()
+                if key in resolved or key in missing:
+                    continue
+                row = conn.execute(
+                    f"SELECT MIN(file_id) FROM {_TABLE} WHERE {_IDENTITY_WHERE}", key
+                ).fetchone()
+                if row[0] is None:
+                    missing[key] = None
+                else:
+                    resolved[key] = int(row[0])
+
+            if missing:
+                now_us = _now_us()
+                file_ids = self._allocate(conn, len(missing))
+                conn.executemany(
+                    f"""
+                    INSERT INTO {_TABLE} (
+                        file_id, vendor, data_type, bronze_path, file_hash,
+                        status, created_at_ts_us
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (file_id, *key, INGEST_STATUS_PENDING, now_us)
+                        for file_id, key in zip(file_ids, missing, strict=True)
+                    ],
+                )
+                resolved.update(zip(missing, file_ids, strict=True))
+
+        return [resolved[ManifestIdentity.from_meta(meta).as_tuple()] for meta in metas]
+
+    def filter_pending(self, candidates: list[BronzeFileMetadata]) -> list[BronzeFileMetadata]:
+        if not candidates:
+            return []
+
+        pending: list[BronzeFileMetadata] = []
+        with self._connect() as conn:
+            for candidate in candidates:
+                key = ManifestIdentity.from_meta(candidate).as_tuple()
+                row = conn.execute(
+                    f"SELECT 1 FROM {_TABLE} WHERE {_IDENTITY_WHERE} AND status = ? LIMIT 1",
+                    (*key, INGEST_STATUS_SUCCESS),
+                ).fetchone()
+                if row is None:
+                    pending.append(candidate)
+        return pending
+
+    def update_status(
+        self,
+        file_id: int,
+        status: str,
+        meta: BronzeFileMetadata,
+        result: IngestionResult | None = None,
+    ) -> None:
+        self.update_statuses([ManifestStatusUpdate(file_id, status, meta, result)])
+
+    def update_statuses(self, updates: list[ManifestStatusUpdate]) -> None:
+        if not updates:
+            return
+        for update in updates:
+            if update.status not in INGEST_STATUS_VALUES:
+                raise ValueError(f"Unsupported ingest status {update.status!r}")
+
+        now_us = _now_us()
+        rows = []
+        for update in updates:
+            result = update.result
+            status_reason: str | None = None
+            if result is not None:
+                status_reason = result.failure_reason
+                if status_reason is None and update.status == INGEST_STATUS_FAILED:
+                    status_reason = result.error_message or "unknown_error"
+            if status_reason is None and update.status == INGEST_STATUS_FAILED:
+                status_reason = "unknown_error"
+            rows.append(
+                (
+                    update.file_id,
+                    update.meta.vendor,
+                    update.meta.data_type,
+                    update.meta.bronze_file_path,
+                    update.meta.sha256,
+                    update.status,
+                    result.row_count if result else None,
+                    result.rows_written if result else None,
+                    result.rows_quarantined if result else None,
+                    _date_to_text(result.trading_date_min) if result else None,
+                    _date_to_text(result.trading_date_max) if result else None,
+                    now_us,
+                    now_us,
+                    status_reason,
+                )
+            )
+
+        with self._transaction() as conn:
+            conn.executemany(
+                f"""
+                INSERT INTO {_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(file_id) DO UPDATE SET
+                    vendor = excluded.vendor,
+                    data_type = excluded.data_type,
+                    bronze_path = excluded.bronze_path,
+                    file_hash = excluded.file_hash,
+                    status = excluded.status,
+                    rows_total = excluded.rows_total,
+                    rows_written = excluded.rows_written,
+                    rows_quarantined = excluded.rows_quarantined,
+                    trading_date_min = excluded.trading_date_min,
+                    trading_date_max = excluded.trading_date_max,
+                    processed_at_ts_us = excluded.processed_at_ts_us,
+                    status_reason = excluded.status_reason
+                """,
+                rows,
+            )
+
+    def read(self) -> pl.DataFrame:
+        """Return the full manifest as a frame conforming to ``INGEST_MANIFEST``."""
+        columns = self.spec.columns()
+        with self._connect() as conn:
+            records = conn.execute(
+                f"SELECT {', '.join(columns)} FROM {_TABLE} ORDER BY file_id"
+            ).fetchall()
+
+        schema = {
+            name: (pl.Utf8 if name in _DATE_COLUMNS else dtype)
+            for name, dtype in self.spec.to_polars().items()
+        }
+        df = pl.DataFrame(records, schema=schema, orient="row")
+        return normalize_to_spec(
+            df.with_columns(pl.col(name).str.to_date() for name in _DATE_COLUMNS),
+            self.spec,
+        )
+
+    def export_to_delta(self, table_path: Path) -> int:
+        """Overwrite the Delta ``ingest_manifest`` at ``table_path``; return rows written."""
+        df = self.read()
+        partition_by = existing_partition_by(table_path, default=self.spec.partition_by)
+        overwrite_delta(table_path, df=df, partition_by=partition_by)
+        return df.height
+
+    def import_from_delta(self, table_path: Path) -> int:
+        """Upsert every row of a Delta ``ingest_manifest`` into this store; return row count."""
+        df = read_delta_or_empty(table_path, spec=self.spec)
+        if df.is_empty():
+            return 0
+
+        rows = df.with_columns(
+            pl.col(name).dt.to_string("%Y-%m-%d") for name in _DATE_COLUMNS
+        ).rows()
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {_TABLE} VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._allocate(conn, 0)
+        return df.height
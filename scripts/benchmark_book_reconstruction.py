@@ -0,0 +1,117 @@
+"""Benchmark L2 book reconstruction throughput (updates/sec).
+
+Usage:
+    python scripts/benchmark_book_reconstruction.py --trading-date 2024-05-01
+    python scripts/benchmark_book_reconstruction.py --synthetic-rows 5000000
+
+Environment:
+    SILVER_ROOT: Optional default silver root path when --silver-root is not set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import polars as pl
+
+from pointline.research.book import reconstruct_book
+from pointline.research.query import load_events
+
+_ENV_SILVER_ROOT = os.environ.get("SILVER_ROOT")
+DEFAULT_SILVER_ROOT = (
+    Path(_ENV_SILVER_ROOT).expanduser() if _ENV_SILVER_ROOT else Path.home() / "data/lake/silver"
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark L2 book reconstruction.")
+    parser.add_argument("--silver-root", type=Path, default=DEFAULT_SILVER_ROOT)
+    parser.add_argument("--exchange", default="binance-futures")
+    parser.add_argument("--symbol", default="BTCUSDT")
+    parser.add_argument("--trading-date", type=date.fromisoformat, default=None)
+    parser.add_argument(
+        "--synthetic-rows",
+        type=int,
+        default=None,
+        help="Benchmark on a generated random-walk update stream instead of silver data.",
+    )
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--spine-every-us", type=int, default=1_000_000)
+    return parser.parse_args()
+
+
+def synthetic_updates(n_rows: int, *, levels: int = 2_000) -> pl.DataFrame:
+    """Random level updates around a drifting mid, with one leading snapshot."""
+    index = pl.int_range(n_rows, eager=True)
+    mid = (index // 50_000).cast(pl.Int64)
+    offset = (pl.Series(index.hash(seed=1) % levels).cast(pl.Int64)) + 1
+    is_bid = index.hash(seed=2) % 2 == 0
+    qty = pl.Series(index.hash(seed=3) % 5).cast(pl.Int64) * 1_000_000
+    return pl.DataFrame(
+        {
+            "exchange": "synthetic",
+            "symbol": "SYN",
+            # Spread over one day so spine sampling sees realistic bar sizes.
+            "ts_event_us": index * (86_400_000_000 // n_rows),
+            "side": pl.Series(is_bid).replace_strict({True: "bid", False: "ask"}),
+            "price": (100_000 + mid + pl.Series(is_bid).cast(pl.Int64) * -2 * offset + offset)
+            * 1_000_000,
+            "qty": qty,
+            "is_snapshot": index < levels,
+        }
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    if args.synthetic_rows is not None:
+        updates = synthetic_updates(args.synthetic_rows)
+    else:
+        if args.trading_date is None:
+            raise SystemExit("--trading-date is required unless --synthetic-rows is set")
+        start = datetime.combine(args.trading_date, datetime.min.time(), tzinfo=timezone.utc)
+        updates = load_events(
+            silver_root=args.silver_root,
+            table="orderbook_updates",
+            exchange=args.exchange,
+            symbol=args.symbol,
+            start=start,
+            end=start + timedelta(days=1),
+        )
+
+    ts = updates.get_column("ts_event_us")
+    spine = (
+        updates.select("exchange", "symbol")
+        .head(1)
+        .join(
+            pl.DataFrame(
+                {
+                    "ts_spine_us": pl.int_range(
+                        ts.min() + args.spine_every_us,
+                        ts.max() + args.spine_every_us + 1,
+                        args.spine_every_us,
+                        eager=True,
+                    )
+                }
+            ),
+            how="cross",
+        )
+    )
+
+    print(f"updates: {updates.height:,}  depth: {args.depth}  spine rows: {spine.height:,}")
+    for label, kwargs in (("every update", {}), ("on spine", {"spine": spine})):
+        started = time.perf_counter()
+        book = reconstruct_book(updates, depth=args.depth, **kwargs)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{label:>12}: {elapsed:7.2f}s  {updates.height / elapsed:12,.0f} updates/s  "
+            f"{book.height:,} rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
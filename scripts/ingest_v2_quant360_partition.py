@@ -21,6 +21,7 @@ import polars as pl
 from pointline.io.protocols import BronzeFileMetadata
 
 from pointline.ingestion.pipeline import ingest_file
+from pointline.ingestion.pit import PitIndex
 from pointline.storage.delta import (
     DeltaDimensionStore,
     DeltaEventStore,
@@ -225,6 +226,12 @@ def main() -> int:
             "(expected for dry-run smoke tests)."
         )
         print()
+    pit_index = PitIndex.for_trading_dates(
+        dim_symbol_df,
+        exchanges={job.exchange for job in jobs},
+        start_date=min(job.trading_date for job in jobs),
+        end_date=max(job.trading_date for job in jobs),
+    )
 
     success = 0
     quarantined = 0
@@ -242,7 +249,7 @@ def main() -> int:
             parser=parser,
             manifest_repo=manifest_store,
             writer=event_store,
-            dim_symbol_df=dim_symbol_df,
+            dim_symbol_df=pit_index,
             quarantine_store=quarantine_store,
             force=args.force,
             dry_run=args.dry_run,
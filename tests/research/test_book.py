@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import random
+
+import polars as pl
+import pytest
+
+from pointline.research.book import reconstruct_book
+
+
+def _updates() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 9,
+            "symbol": ["BTCUSDT"] * 9,
+            "ts_event_us": [1, 1, 1, 2, 3, 3, 4, 5, 5],
+            "side": ["bid", "bid", "ask", "bid", "ask", "bid", "ask", "bid", "ask"],
+            "price": [100, 99, 101, 100, 102, 98, 101, 97, 103],
+            "qty": [5, 3, 4, 0, 2, 1, 0, 9, 6],
+            "is_snapshot": [True, True, True, False, False, False, False, True, True],
+        }
+    )
+
+
+def _random_updates(seed: int, *, n_rows: int) -> pl.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        ts = 0
+        for i in range(n_rows):
+            ts += rng.choice([0, 0, 1, 5])
+            rows.append(
+                {
+                    "exchange": "binance-futures",
+                    "symbol": symbol,
+                    "ts_event_us": ts,
+                    "side": rng.choice(["bid", "ask"]),
+                    "price": rng.randint(1, 30),
+                    "qty": rng.choice([0, 0, 1, 2, 3]),
+                    "is_snapshot": i < 10 or 300 <= i < 305,
+                }
+            )
+    return pl.DataFrame(rows)
+
+
+def test_reconstruct_book_applies_snapshots_updates_and_deletes() -> None:
+    out = reconstruct_book(_updates(), depth=2)
+
+    assert out.columns == [
+        "exchange",
+        "symbol",
+        "ts_event_us",
+        "bid_price_levels",
+        "bid_qty_levels",
+        "ask_price_levels",
+        "ask_qty_levels",
+    ]
+    assert out.select("ts_event_us", pl.exclude("exchange", "symbol", "ts_event_us")).rows() == [
+        (1, [100, 99], [5, 3], [101], [4]),
+        (2, [99], [3], [101], [4]),
+        (3, [99, 98], [3, 1], [101, 102], [4, 2]),
+        (4, [99, 98], [3, 1], [102], [2]),
+        # A new snapshot replaces the whole book.
+        (5, [97], [9], [103], [6]),
+    ]
+
+
+def test_reconstruct_book_on_spine_matches_book_before_each_bar_end() -> None:
+    updates = _random_updates(7, n_rows=600)
+    spine = (
+        updates.select("exchange", "symbol")
+        .unique(maintain_order=True)
+        .join(pl.DataFrame({"ts_spine_us": list(range(0, 1_000, 37))}), how="cross")
+        .with_columns(pl.lit(1).alias("symbol_id"))
+    )
+
+    every_update = reconstruct_book(updates, depth=3)
+    sampled = reconstruct_book(updates, depth=3, spine=spine)
+
+    assert sampled.columns == [*spine.columns, *every_update.columns[3:]]
+    expected = spine.join_asof(
+        every_update,
+        left_on="ts_spine_us",
+        right_on="ts_event_us",
+        by=["exchange", "symbol"],
+        allow_exact_matches=False,
+        check_sortedness=False,
+    ).select(sampled.columns)
+    # Bar ends before the first update see an empty book.
+    expected = expected.with_columns(
+        pl.col(name).fill_null(pl.lit([], dtype=pl.List(pl.Int64)))
+        for name in every_update.columns[3:]
+    )
+    assert sampled.equals(expected)
+
+
+def test_reconstruct_book_validates_inputs() -> None:
+    with pytest.raises(ValueError, match="depth"):
+        reconstruct_book(_updates(), depth=0)
+    with pytest.raises(ValueError, match="missing required columns"):
+        reconstruct_book(_updates().drop("is_snapshot"))
+    with pytest.raises(ValueError, match="side"):
+        reconstruct_book(_updates().with_columns(pl.lit("buy").alias("side")))
+    for name in ("side", "price", "qty"):
+        with_null = _updates().with_columns(
+            pl.when(pl.col("ts_event_us") == 3).then(None).otherwise(pl.col(name)).alias(name)
+        )
+        with pytest.raises(ValueError, match=f"null values in: \\['{name}'\\]"):
+            reconstruct_book(with_null)
+    with pytest.raises(ValueError, match="spine missing"):
+        reconstruct_book(_updates(), spine=pl.DataFrame({"ts_spine_us": [1]}))
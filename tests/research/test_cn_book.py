@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from pointline.research.cn_book import reconstruct_cn_book
+
+_LEVELS = [
+    "bid_price_levels",
+    "bid_qty_levels",
+    "bid_order_count_levels",
+    "ask_price_levels",
+    "ask_qty_levels",
+    "ask_order_count_levels",
+]
+
+
+def _orders(exchange: str, rows: list[tuple]) -> pl.DataFrame:
+    # (ts_event_us, channel_seq, channel_biz_seq, order_ref, event_kind, side, price, qty)
+    return pl.DataFrame(
+        rows,
+        schema={
+            "ts_event_us": pl.Int64,
+            "channel_seq": pl.Int64,
+            "channel_biz_seq": pl.Int64,
+            "order_ref": pl.Int64,
+            "event_kind": pl.Utf8,
+            "side": pl.Utf8,
+            "price": pl.Int64,
+            "qty": pl.Int64,
+        },
+        orient="row",
+    ).with_columns(
+        pl.lit(exchange).alias("exchange"),
+        pl.lit("000001").alias("symbol"),
+        pl.lit(2011, dtype=pl.Int32).alias("channel_id"),
+    )
+
+
+def _ticks(exchange: str, rows: list[tuple]) -> pl.DataFrame:
+    # (ts_event_us, channel_seq, channel_biz_seq, bid_order_ref, ask_order_ref, kind, price, qty)
+    return pl.DataFrame(
+        rows,
+        schema={
+            "ts_event_us": pl.Int64,
+            "channel_seq": pl.Int64,
+            "channel_biz_seq": pl.Int64,
+            "bid_order_ref": pl.Int64,
+            "ask_order_ref": pl.Int64,
+            "event_kind": pl.Utf8,
+            "price": pl.Int64,
+            "qty": pl.Int64,
+        },
+        orient="row",
+    ).with_columns(
+        pl.lit(exchange).alias("exchange"),
+        pl.lit("000001").alias("symbol"),
+        pl.lit(2011, dtype=pl.Int32).alias("channel_id"),
+    )
+
+
+def _szse_events() -> tuple[pl.DataFrame, pl.DataFrame]:
+    orders = _orders(
+        "szse",
+        [
+            (10, 1, None, 1, "ADD", "BUY", 1000, 300),
+            (10, 2, None, 2, "ADD", "BUY", 1000, 200),
+            (20, 3, None, 3, "ADD", "SELL", 1010, 500),
+            (20, 4, None, 4, "ADD", "BUY", 990, 100),
+            # Aggressive sell: fills order 1, rests 100 at 1000.
+            (40, 6, None, 6, "ADD", "SELL", 1000, 400),
+        ],
+    )
+    ticks = _ticks(
+        "szse",
+        [
+            (30, 5, None, 2, 0, "CANCEL", 0, 200),
+            (40, 7, None, 1, 6, "TRADE", 1000, 300),
+        ],
+    )
+    return orders, ticks
+
+
+def test_reconstruct_cn_book_szse_adds_fills_and_tick_cancels() -> None:
+    orders, ticks = _szse_events()
+    # Input order does not matter: the feed is merged on channel_seq.
+    out = reconstruct_cn_book(orders.reverse(), ticks, depth=2)
+
+    assert out["channel_seq"].to_list() == [1, 2, 3, 4, 5, 6, 7]
+    assert out.select(_LEVELS).rows()[3] == ([1000, 990], [500, 100], [2, 1], [1010], [500], [1])
+    assert out.select(_LEVELS).rows()[4] == ([1000, 990], [300, 100], [1, 1], [1010], [500], [1])
+    assert out.select(_LEVELS).rows()[-1] == (
+        [990],
+        [100],
+        [1],
+        [1000, 1010],
+        [100, 500],
+        [1, 1],
+    )
+
+
+def test_reconstruct_cn_book_sse_order_cancels_and_unknown_aggressor() -> None:
+    orders = _orders(
+        "sse",
+        [
+            (10, 100, 1, 100, "ADD", "BUY", 1000, 300),
+            (10, 101, 2, 101, "ADD", "SELL", 1010, 200),
+            # The cancel reuses the order's OrderNo; BizIndex places it after the fill.
+            (30, 100, 4, 100, "CANCEL", "BUY", 1000, 300),
+        ],
+    )
+    ticks = _ticks("sse", [(20, 1, 3, 102, 101, "TRADE", 1010, 50)])
+
+    out = reconstruct_cn_book(orders, ticks, depth=5)
+    assert out.select(_LEVELS).rows()[-2] == ([1000], [300], [1], [1010], [150], [1])
+    assert out.select(_LEVELS).rows()[-1] == ([], [], [], [1010], [150], [1])
+
+    # Without BizIndex, SSE falls back to time order with ticks first.
+    no_biz = reconstruct_cn_book(
+        orders.with_columns(pl.lit(None, dtype=pl.Int64).alias("channel_biz_seq")),
+        ticks.with_columns(pl.lit(None, dtype=pl.Int64).alias("channel_biz_seq")),
+        depth=5,
+    )
+    assert no_biz.select(_LEVELS).equals(out.select(_LEVELS))
+
+
+def test_reconstruct_cn_book_on_spine_matches_book_before_each_bar_end() -> None:
+    orders, ticks = _szse_events()
+    spine = pl.DataFrame(
+        {
+            "exchange": ["szse"] * 5,
+            "symbol": ["000001"] * 5,
+            "ts_spine_us": [5, 10, 25, 40, 100],
+        }
+    )
+
+    every_event = reconstruct_cn_book(orders, ticks, depth=3)
+    sampled = reconstruct_cn_book(orders, ticks, depth=3, spine=spine)
+
+    expected = (
+        spine.join_asof(
+            every_event,
+            left_on="ts_spine_us",
+            right_on="ts_event_us",
+            by=["exchange", "symbol"],
+            allow_exact_matches=False,
+            check_sortedness=False,
+        )
+        .select(sampled.columns)
+        .with_columns(pl.col(_LEVELS).fill_null(pl.lit([], dtype=pl.List(pl.Int64))))
+    )
+    assert sampled.equals(expected)
+
+
+def test_reconstruct_cn_book_validates_inputs() -> None:
+    orders, ticks = _szse_events()
+    with pytest.raises(ValueError, match="depth"):
+        reconstruct_cn_book(orders, ticks, depth=0)
+    with pytest.raises(ValueError, match="tick_events missing"):
+        reconstruct_cn_book(orders, ticks.drop("ask_order_ref"))
+    with pytest.raises(ValueError, match="sse/szse"):
+        reconstruct_cn_book(orders.with_columns(pl.lit("nyse").alias("exchange")), ticks)
@@ -9,10 +9,17 @@ from deltalake import write_deltalake
 
 from pointline.research.discovery import discover_symbols
 from pointline.research.metadata import load_symbol_meta
-from pointline.research.primitives import join_symbol_meta
-from pointline.research.query import load_events
+from pointline.research.primitives import decode_scaled_columns, join_symbol_meta
+from pointline.research.query import (
+    _is_sorted_by,
+    iter_event_stream,
+    iter_events,
+    load_event_stream,
+    load_events,
+    scan_events,
+)
 from pointline.schemas.dimensions import DIM_SYMBOL
-from pointline.schemas.events import TRADES
+from pointline.schemas.events import QUOTES, TRADES
 from pointline.storage.delta.dimension_store import DeltaDimensionStore
 from pointline.storage.delta.layout import table_path
 
@@ -94,6 +101,19 @@ def _seed_sse_trades_timezone_boundary(silver_root: Path) -> tuple[int, int]:
     return ts_start, ts_end
 
 
+def _seed_sse_trades_timezone_boundary_append(silver_root: Path) -> tuple[int, int]:
+    path = table_path(silver_root=silver_root, table_name="trades")
+    existing = pl.read_delta(str(path))
+    ts_start, ts_end = _seed_sse_trades_timezone_boundary(silver_root)
+    write_deltalake(
+        str(path),
+        existing.select(list(TRADES.to_polars())).to_arrow(),
+        mode="append",
+        partition_by=["exchange", "trading_date"],
+    )
+    return ts_start, ts_end
+
+
 def test_discover_symbols_contract_default_columns(tmp_path: Path) -> None:
     silver_root = tmp_path / "silver"
     _seed_dim_symbol(silver_root)
@@ -237,6 +257,38 @@ def test_join_symbol_meta_explicit_primitive(tmp_path: Path) -> None:
     assert out["lot_size"].to_list() == [2_000, 2_000]
 
 
+def test_join_symbol_meta_joins_on_symbol_id_and_asserts_validity(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_dim_symbol(silver_root)
+    events = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 4,
+            "symbol_id": [33, 11, 99, 22],
+            "ts_event_us": [2_500_000, 1_500_000, 2_500_000, 2_000_000],
+        }
+    )
+
+    out = join_symbol_meta(events, silver_root=silver_root, columns=["tick_size"])
+    assert out.columns == [*events.columns, "tick_size"]
+    # Row order is preserved; unknown symbol_ids get null metadata.
+    assert out["tick_size"].to_list() == [300, 100, None, 200]
+
+    # symbol_id 11 is valid until 2_000_000 (exclusive).
+    stale = events.with_columns(pl.lit(2_000_000).alias("ts_event_us"))
+    with pytest.raises(ValueError, match="outside the exchange/validity window"):
+        join_symbol_meta(stale, silver_root=silver_root, columns=["tick_size"])
+    with pytest.raises(ValueError, match="outside the exchange/validity window"):
+        join_symbol_meta(
+            events.with_columns(pl.lit("okx").alias("exchange")),
+            silver_root=silver_root,
+            columns=["tick_size"],
+        )
+    unchecked = join_symbol_meta(
+        stale, silver_root=silver_root, columns=["tick_size"], validate=False
+    )
+    assert unchecked["tick_size"].to_list() == [300, 100, None, 200]
+
+
 def test_join_symbol_meta_rejects_unknown_columns(tmp_path: Path) -> None:
     silver_root = tmp_path / "silver"
     _seed_dim_symbol(silver_root)
@@ -271,6 +323,235 @@ def test_load_events_uses_exchange_timezone_for_date_bounds(tmp_path: Path) -> N
     assert out.item(0, "trading_date") == date(2024, 1, 2)
 
 
+def test_load_events_many_symbols_and_exchanges_in_one_call(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_trades_table(silver_root)
+    ts_start, ts_end = _seed_sse_trades_timezone_boundary_append(silver_root)
+
+    out = load_events(
+        silver_root=silver_root,
+        table="trades",
+        exchange=["sse", "binance-futures"],
+        symbol=["ETHUSDT", "BTCUSDT", "600000"],
+        start=2_000_000,
+        end=ts_end,
+        include_lineage=True,
+    )
+
+    assert out.select(["exchange", "symbol_id", "file_seq"]).rows() == [
+        ("binance-futures", 22, 1),
+        ("binance-futures", 22, 2),
+        ("binance-futures", 33, 3),
+        ("sse", 999, 1),
+    ]
+
+    only_sse_window = load_events(
+        silver_root=silver_root,
+        table="trades",
+        exchange=["binance-futures", "SSE"],
+        symbol=["BTCUSDT", "600000"],
+        start=ts_start,
+        end=ts_end,
+    )
+    assert only_sse_window["symbol"].to_list() == ["600000"]
+
+
+def test_scan_events_is_lazy_and_matches_load_events(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_trades_table(silver_root)
+    kwargs = {
+        "silver_root": silver_root,
+        "table": "trades",
+        "exchange": "binance-futures",
+        "symbol": ["BTCUSDT", "ETHUSDT"],
+        "start": 2_000_000,
+        "end": 2_200_000,
+        "include_lineage": True,
+    }
+
+    lf = scan_events(**kwargs)
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect().equals(load_events(**kwargs))
+
+    summary = (
+        lf.filter(pl.col("side") == "buy")
+        .group_by("symbol")
+        .agg(pl.col("qty").sum())
+        .collect(engine="streaming")
+    )
+    assert summary.rows() == [("BTCUSDT", 30_000_000_000)]
+
+    missing = scan_events(**{**kwargs, "table": "quotes"})
+    assert isinstance(missing, pl.LazyFrame)
+    assert missing.collect().is_empty()
+
+
+def test_iter_events_yields_trading_date_chunks(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_trades_table(silver_root)
+    _, ts_end = _seed_sse_trades_timezone_boundary_append(silver_root)
+    kwargs = {
+        "silver_root": silver_root,
+        "table": "trades",
+        "exchange": ["binance-futures", "sse"],
+        "symbol": ["BTCUSDT", "ETHUSDT", "600000"],
+        "start": 2_000_000,
+        "end": ts_end,
+        "include_lineage": True,
+    }
+
+    chunks = list(iter_events(**kwargs))
+    assert [chunk["trading_date"].unique().to_list() for chunk in chunks] == [
+        [date(1970, 1, 1)],
+        [date(2024, 1, 2)],
+    ]
+    assert chunks[0]["file_seq"].to_list() == [1, 2, 3]
+    assert pl.concat(chunks).equals(load_events(**kwargs))
+
+    prefetched = list(iter_events(**kwargs, prefetch=True))
+    assert len(prefetched) == len(chunks)
+    assert all(a.equals(b) for a, b in zip(prefetched, chunks, strict=True))
+
+    assert list(iter_events(**{**kwargs, "table": "quotes"})) == []
+    with pytest.raises(ValueError, match="chunk"):
+        next(iter_events(**kwargs, chunk="1h"))
+
+
+def _seed_quotes_table(silver_root: Path) -> None:
+    ts_event_us = [2_050_000, 2_100_000, 2_150_000]
+    quotes = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 3,
+            "trading_date": [date(1970, 1, 1)] * 3,
+            "symbol": ["BTCUSDT"] * 3,
+            "symbol_id": [22] * 3,
+            "ts_event_us": ts_event_us,
+            "ts_local_us": ts_event_us,
+            "file_id": [2, 2, 2],
+            "file_seq": [1, 2, 3],
+            "bid_price": [99_000_000_000] * 3,
+            "bid_qty": [1_000_000_000] * 3,
+            "ask_price": [101_000_000_000] * 3,
+            "ask_qty": [1_000_000_000] * 3,
+            "seq_num": [None] * 3,
+        },
+        schema=QUOTES.to_polars(),
+    )
+    path = table_path(silver_root=silver_root, table_name="quotes")
+    write_deltalake(
+        str(path), quotes.to_arrow(), mode="overwrite", partition_by=["exchange", "trading_date"]
+    )
+
+
+def test_load_event_stream_merges_tables_by_time_and_precedence(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_trades_table(silver_root)
+    _seed_quotes_table(silver_root)
+    kwargs = {
+        "silver_root": silver_root,
+        "tables": ["quotes", "trades"],
+        "exchange": "binance-futures",
+        "symbol": ["BTCUSDT", "ETHUSDT"],
+        "start": 2_000_000,
+        "end": 2_200_000,
+        "include_lineage": True,
+    }
+
+    stream = load_event_stream(**kwargs)
+    assert stream.select("table", "ts_event_us", "file_seq").rows() == [
+        ("quotes", 2_050_000, 1),
+        ("quotes", 2_100_000, 2),
+        ("trades", 2_100_000, 1),
+        ("trades", 2_100_000, 2),
+        ("trades", 2_100_000, 3),
+        ("quotes", 2_150_000, 3),
+    ]
+    assert stream.filter(pl.col("table") == "trades")["bid_price"].is_null().all()
+    assert stream.filter(pl.col("table") == "quotes")["side"].is_null().all()
+
+    event_kwargs = {key: value for key, value in kwargs.items() if key != "tables"}
+    expected = (
+        pl.concat(
+            [
+                load_events(**event_kwargs, table=name).with_columns(
+                    pl.lit(name).alias("table"), pl.lit(rank).alias("_rank")
+                )
+                for rank, name in enumerate(kwargs["tables"])
+            ],
+            how="diagonal",
+        )
+        .sort("ts_event_us", "_rank", "file_id", "file_seq")
+        .select(stream.columns)
+    )
+    assert stream.equals(expected)
+
+    trades_first = load_event_stream(**{**kwargs, "tables": ["trades", "quotes"]})
+    assert trades_first.filter(pl.col("ts_event_us") == 2_100_000)["table"].to_list() == [
+        "trades",
+        "trades",
+        "trades",
+        "quotes",
+    ]
+
+    projected = load_event_stream(
+        **{**kwargs, "include_lineage": False},
+        columns={"trades": ["ts_event_us", "qty"], "quotes": ["ts_event_us", "bid_price"]},
+    )
+    assert projected.columns == ["table", "ts_event_us", "bid_price", "qty"]
+    assert pl.concat(list(iter_event_stream(**kwargs))).equals(stream)
+
+    with pytest.raises(ValueError, match="unique"):
+        load_event_stream(**{**kwargs, "tables": ["trades", "trades"]})
+    with pytest.raises(ValueError, match="not in the stream"):
+        load_event_stream(**kwargs, columns={"orderbook_updates": ["price"]})
+
+
+def test_load_events_decode_matches_decode_scaled_columns(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_trades_table(silver_root)
+    kwargs = {
+        "silver_root": silver_root,
+        "table": "trades",
+        "exchange": "binance-futures",
+        "symbol": ["BTCUSDT", "ETHUSDT"],
+        "start": 2_000_000,
+        "end": 2_200_000,
+    }
+    raw = load_events(**kwargs)
+
+    decoded = load_events(**kwargs, decode=True)
+    assert decoded.equals(decode_scaled_columns(raw, "trades"))
+    assert scan_events(**kwargs, decode=True).collect().equals(decoded)
+    assert pl.concat(list(iter_events(**kwargs, decode=True))).equals(decoded)
+
+    in_place = load_events(**kwargs, decode=["price"], decode_in_place=True)
+    assert in_place.columns == raw.columns
+    assert in_place.schema["price"] == pl.Float64
+    assert in_place.schema["qty"] == pl.Int64
+    assert in_place["price"].to_list() == [100.0, 100.0, 50.0]
+
+    with pytest.raises(ValueError, match="non-scaled"):
+        load_events(**kwargs, decode=["side"])
+    with pytest.raises(ValueError, match="selected"):
+        load_events(**kwargs, columns=["ts_event_us", "qty"], decode=["price"])
+
+
+def test_is_sorted_by_matches_lexicographic_sort() -> None:
+    df = pl.DataFrame(
+        {
+            "a": [1, 1, 1, 2, 2, 3],
+            "b": [5, 5, 7, 0, 0, 1],
+            "c": [1, 2, 0, 9, 9, 0],
+        }
+    )
+    cols = ["a", "b", "c"]
+    assert _is_sorted_by(df, cols)
+    assert _is_sorted_by(df.head(1), cols)
+    assert not _is_sorted_by(df.reverse(), cols)
+    assert not _is_sorted_by(df.with_columns(pl.Series("c", [1, 0, 0, 9, 9, 0])), cols)
+    assert not _is_sorted_by(df.with_columns(pl.Series("b", [5, None, 7, 0, 0, 1])), cols)
+
+
 def test_load_events_rejects_non_event_table(tmp_path: Path) -> None:
     silver_root = tmp_path / "silver"
     _seed_dim_symbol(silver_root)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import time
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+from deltalake import write_deltalake
+
+from pointline.research.cache import QueryCache
+from pointline.research.metadata import load_symbol_meta
+from pointline.research.query import iter_events, load_events
+from pointline.research.spine import TradesSpineConfig, build_spine
+from pointline.schemas.dimensions import DIM_SYMBOL
+from pointline.schemas.events import TRADES
+from pointline.storage.delta.dimension_store import DeltaDimensionStore
+from pointline.storage.delta.layout import table_path
+
+_DAY_US = 86_400_000_000
+
+
+def _seed_dim(silver_root: Path) -> None:
+    dim = pl.DataFrame(
+        {
+            "symbol_id": [2001],
+            "exchange": ["binance-futures"],
+            "exchange_symbol": ["BTCUSDT"],
+            "canonical_symbol": ["BTCUSDT"],
+            "market_type": ["perpetual"],
+            "base_asset": ["BTC"],
+            "quote_asset": ["USDT"],
+            "valid_from_ts_us": [0],
+            "valid_until_ts_us": [2**63 - 1],
+            "is_current": [True],
+            "tick_size": [100],
+            "lot_size": [1_000],
+            "contract_size": [None],
+            "updated_at_ts_us": [0],
+        },
+        schema=DIM_SYMBOL.to_polars(),
+    )
+    DeltaDimensionStore(silver_root=silver_root).save_dim_symbol(dim)
+
+
+def _append_trades(silver_root: Path, *, day: int, ts_event_us: list[int], file_id: int) -> None:
+    n = len(ts_event_us)
+    trades = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * n,
+            "trading_date": [date.fromordinal(date(1970, 1, 1).toordinal() + day)] * n,
+            "symbol": ["BTCUSDT"] * n,
+            "symbol_id": [2001] * n,
+            "ts_event_us": ts_event_us,
+            "ts_local_us": ts_event_us,
+            "file_id": [file_id] * n,
+            "file_seq": list(range(1, n + 1)),
+            "trade_id": [None] * n,
+            "side": ["buy"] * n,
+            "is_buyer_maker": [False] * n,
+            "price": [100_000_000_000] * n,
+            "qty": [1_000_000_000] * n,
+        },
+        schema=TRADES.to_polars(),
+    )
+    path = table_path(silver_root=silver_root, table_name="trades")
+    write_deltalake(
+        str(path),
+        trades.to_arrow(),
+        mode="append" if path.exists() else "overwrite",
+        partition_by=["exchange", "trading_date"],
+    )
+
+
+def _kwargs(silver_root: Path) -> dict[str, object]:
+    return {
+        "silver_root": silver_root,
+        "table": "trades",
+        "exchange": "binance-futures",
+        "symbol": "BTCUSDT",
+        "start": 0,
+        "end": _DAY_US,
+    }
+
+
+def test_load_events_cache_hits_and_invalidates_on_touched_partition(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _append_trades(silver_root, day=0, ts_event_us=[10, 20], file_id=1)
+    cache = QueryCache(tmp_path / "cache")
+
+    first = load_events(**_kwargs(silver_root), cache=cache)
+    second = load_events(**_kwargs(silver_root), cache=cache)
+    assert second.equals(first)
+    assert (cache.stats().hits, cache.stats().misses, cache.stats().entries) == (1, 1, 1)
+
+    # Another trading date is outside the window: cached entry stays valid.
+    _append_trades(silver_root, day=1, ts_event_us=[_DAY_US + 5], file_id=2)
+    assert load_events(**_kwargs(silver_root), cache=cache).equals(first)
+    assert cache.stats().hits == 2
+
+    _append_trades(silver_root, day=0, ts_event_us=[30], file_id=3)
+    refreshed = load_events(**_kwargs(silver_root), cache=cache)
+    assert refreshed["ts_event_us"].to_list() == [10, 20, 30]
+    assert cache.stats().misses == 2
+
+
+def test_iter_events_caches_each_chunk(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _append_trades(silver_root, day=0, ts_event_us=[10], file_id=1)
+    _append_trades(silver_root, day=1, ts_event_us=[_DAY_US + 10], file_id=2)
+    cache = QueryCache(tmp_path / "cache")
+    kwargs = {**_kwargs(silver_root), "end": 2 * _DAY_US}
+
+    uncached = list(iter_events(**kwargs))
+    assert [frame.height for frame in iter_events(**kwargs, cache=cache)] == [1, 1]
+    cached = list(iter_events(**kwargs, cache=cache, prefetch=True))
+    assert all(a.equals(b) for a, b in zip(cached, uncached, strict=True))
+    assert (cache.stats().hits, cache.stats().misses) == (2, 2)
+
+
+def test_query_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    frame = pl.DataFrame({"x": list(range(1_000))})
+    probe = QueryCache(tmp_path / "probe")
+    probe.put({"k": 0}, frame)
+    entry_bytes = probe.stats().size_bytes
+
+    cache = QueryCache(tmp_path / "cache", max_bytes=2 * entry_bytes)
+    cache.put({"k": 1}, frame)
+    cache.put({"k": 2}, frame)
+    assert cache.get({"k": 1}) is not None
+    cache.put({"k": 3}, frame)
+
+    assert cache.get({"k": 2}) is None
+    assert cache.get({"k": 1}) is not None
+    assert cache.get({"k": 3}) is not None
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (2, 1)
+    assert stats.size_bytes <= cache.max_bytes
+
+    cache.clear()
+    assert cache.stats().entries == 0
+
+
+def test_build_spine_cache_tracks_trades_and_dim_symbol(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_dim(silver_root)
+    _append_trades(silver_root, day=0, ts_event_us=[10, 20], file_id=1)
+    cache = QueryCache(tmp_path / "cache")
+    kwargs = {
+        "silver_root": silver_root,
+        "exchange": "binance-futures",
+        "symbol": "BTCUSDT",
+        "start": 0,
+        "end": _DAY_US,
+        "builder": "trades",
+        "config": TradesSpineConfig(),
+    }
+
+    first = build_spine(**kwargs, cache=cache)
+    assert build_spine(**kwargs, cache=cache).equals(first)
+    assert cache.stats().hits == 1
+
+    _append_trades(silver_root, day=0, ts_event_us=[30], file_id=2)
+    assert build_spine(**kwargs, cache=cache)["ts_spine_us"].to_list() == [10, 20, 30]
+    assert cache.stats().misses == 2
+
+
+def test_load_events_as_of_version_and_time_read_past_state(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _append_trades(silver_root, day=0, ts_event_us=[10, 20], file_id=1)
+    time.sleep(0.05)
+    between_commits_us = time.time_ns() // 1_000
+    time.sleep(0.05)
+    _append_trades(silver_root, day=0, ts_event_us=[30], file_id=2)
+    cache = QueryCache(tmp_path / "cache")
+
+    latest = load_events(**_kwargs(silver_root))
+    assert latest["ts_event_us"].to_list() == [10, 20, 30]
+
+    for pinned in ({"as_of_version": 0}, {"as_of_time": between_commits_us}):
+        past = load_events(**_kwargs(silver_root), **pinned, cache=cache)
+        assert past["ts_event_us"].to_list() == [10, 20]
+    # Both pins resolve to the same files, so the second read is a cache hit.
+    assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    with pytest.raises(ValueError, match="at most one"):
+        load_events(**_kwargs(silver_root), as_of_version=0, as_of_time=between_commits_us)
+
+
+def test_load_symbol_meta_and_build_spine_as_of_version(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_dim(silver_root)
+    store = DeltaDimensionStore(silver_root=silver_root)
+    store.save_dim_symbol(
+        store.load_dim_symbol().with_columns(pl.lit(200, dtype=pl.Int64).alias("tick_size"))
+    )
+    _append_trades(silver_root, day=0, ts_event_us=[10, 20], file_id=1)
+    _append_trades(silver_root, day=0, ts_event_us=[30], file_id=2)
+
+    meta_kwargs = {"silver_root": silver_root, "exchange": "binance-futures"}
+    assert load_symbol_meta(**meta_kwargs)["tick_size"].to_list() == [200]
+    assert load_symbol_meta(**meta_kwargs, as_of_version=0)["tick_size"].to_list() == [100]
+
+    spine_kwargs = {
+        "silver_root": silver_root,
+        "exchange": "binance-futures",
+        "symbol": "BTCUSDT",
+        "start": 0,
+        "end": _DAY_US,
+        "builder": "trades",
+        "config": TradesSpineConfig(),
+    }
+    pinned = build_spine(**spine_kwargs, as_of_version={"trades": 0})
+    assert pinned["ts_spine_us"].to_list() == [10, 20]
+    assert build_spine(**spine_kwargs)["ts_spine_us"].to_list() == [10, 20, 30]
+
+    with pytest.raises(ValueError, match="as_of_version keys"):
+        build_spine(**spine_kwargs, as_of_version={"quotes": 0})
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import polars as pl
+import pytest
 
-from pointline.research.spine import align_to_spine
+from pointline.research.spine import aggregate_to_spine, align_to_spine
+from pointline.schemas.types import QTY_SCALE
 
 
 def test_align_to_spine_boundary_semantics() -> None:
@@ -48,3 +50,121 @@ def test_align_to_spine_keeps_input_order() -> None:
     out = align_to_spine(events=events, spine=spine)
     assert out["value"].to_list() == [8, 2]
     assert out["ts_spine_us"].to_list() == [90, 30]
+
+
+def test_align_to_spine_sorted_fast_path_and_grouped_order() -> None:
+    events = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 4,
+            "symbol": ["ETHUSDT", "BTCUSDT", "ETHUSDT", "BTCUSDT"],
+            "ts_event_us": [40, 80, 20, 20],
+            "value": [1, 2, 3, 4],
+        }
+    )
+    spine = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 3,
+            "symbol": ["ETHUSDT", "BTCUSDT", "BTCUSDT"],
+            "symbol_id": [20, 10, 10],
+            "ts_spine_us": [50, 90, 30],
+        }
+    )
+
+    in_input_order = align_to_spine(events=events, spine=spine)
+    assert in_input_order["ts_spine_us"].to_list() == [50, 90, 50, 30]
+
+    grouped = align_to_spine(events=events, spine=spine, preserve_order=False)
+    assert grouped["value"].to_list() == [4, 2, 3, 1]
+    assert grouped["ts_spine_us"].to_list() == [30, 90, 50, 50]
+
+    # Already (exchange, symbol, ts)-ordered input is joined as-is.
+    presorted = events.sort("exchange", "symbol", "ts_event_us")
+    assert align_to_spine(events=presorted, spine=spine).equals(grouped)
+
+
+def _bar_trades() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 6,
+            "symbol": ["BTCUSDT", "ETHUSDT", "BTCUSDT", "BTCUSDT", "BTCUSDT", "ETHUSDT"],
+            "ts_event_us": [10, 15, 30, 60, 70, 200],
+            "price": [100, 7, 103, 99, 101, 8],
+            "qty": [2 * QTY_SCALE, QTY_SCALE, QTY_SCALE, 3 * QTY_SCALE, QTY_SCALE, QTY_SCALE],
+            "side": ["buy", "sell", "sell", "buy", "unknown", "buy"],
+        }
+    )
+
+
+def _bar_spine() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 5,
+            "symbol": ["BTCUSDT", "BTCUSDT", "BTCUSDT", "ETHUSDT", "ETHUSDT"],
+            "symbol_id": [10, 10, 10, 20, 20],
+            "ts_spine_us": [60, 90, 120, 60, 120],
+        }
+    )
+
+
+def test_aggregate_to_spine_builds_bars_with_boundary_semantics() -> None:
+    # Shuffled input: the engine sorts when events are not in (exchange, symbol, ts) order.
+    out = aggregate_to_spine(events=_bar_trades().reverse(), spine=_bar_spine())
+
+    assert out.columns == [
+        *_bar_spine().columns,
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "vwap",
+        "trade_count",
+        "signed_volume",
+    ]
+    assert out.select(pl.exclude("exchange", "symbol_id")).rows() == [
+        ("BTCUSDT", 60, 100, 103, 100, 103, 3 * QTY_SCALE, 101, 2, QTY_SCALE),
+        # ts=60 sits on a boundary and belongs to the next bar.
+        ("BTCUSDT", 90, 99, 101, 99, 101, 4 * QTY_SCALE, 99, 2, 3 * QTY_SCALE),
+        ("BTCUSDT", 120, None, None, None, None, 0, None, 0, 0),
+        ("ETHUSDT", 60, 7, 7, 7, 7, QTY_SCALE, 7, 1, -QTY_SCALE),
+        # The ts=200 trade is past the last bar end and is dropped.
+        ("ETHUSDT", 120, None, None, None, None, 0, None, 0, 0),
+    ]
+
+
+def test_aggregate_to_spine_matches_align_then_group_by() -> None:
+    events = _bar_trades()
+    spine = _bar_spine()
+    aggs = ["ohlc", "notional", pl.col("qty").max().alias("max_qty")]
+
+    lazy = aggregate_to_spine(events=events.lazy(), spine=spine, aggs=aggs)
+    assert isinstance(lazy, pl.LazyFrame)
+
+    expected = spine.join(
+        align_to_spine(events=events, spine=spine)
+        .filter(pl.col("ts_spine_us").is_not_null())
+        .group_by("exchange", "symbol", "ts_spine_us")
+        .agg(
+            pl.col("price").first().alias("open"),
+            pl.col("price").max().alias("high"),
+            pl.col("price").min().alias("low"),
+            pl.col("price").last().alias("close"),
+            (pl.col("price") * pl.col("qty") // QTY_SCALE).sum().alias("notional"),
+            pl.col("qty").max().alias("max_qty"),
+        ),
+        on=["exchange", "symbol", "ts_spine_us"],
+        how="left",
+        maintain_order="left",
+    ).with_columns(pl.col("notional").fill_null(0))
+    assert lazy.collect().equals(expected)
+
+
+def test_aggregate_to_spine_validates_aggs() -> None:
+    with pytest.raises(ValueError, match="Unknown bar aggregate"):
+        aggregate_to_spine(events=_bar_trades(), spine=_bar_spine(), aggs=["twap"])
+    with pytest.raises(ValueError, match="required by aggs"):
+        aggregate_to_spine(events=_bar_trades().drop("side"), spine=_bar_spine())
+    with pytest.raises(ValueError, match="clash"):
+        aggregate_to_spine(
+            events=_bar_trades(), spine=_bar_spine(), aggs=[pl.col("qty").sum().alias("symbol_id")]
+        )
@@ -5,10 +5,12 @@ from pathlib import Path
 
 import polars as pl
 import pytest
+from deltalake import write_deltalake
 
 from pointline.research.spine import ClockSpineConfig, build_spine
 from pointline.schemas.dimensions import DIM_SYMBOL
 from pointline.storage.delta.dimension_store import DeltaDimensionStore
+from pointline.storage.delta.layout import table_path
 
 
 def _seed_dim_for_clock(silver_root: Path) -> None:
@@ -84,3 +86,133 @@ def test_build_spine_rejects_unknown_builder(tmp_path: Path) -> None:
             builder="unknown",
             config=ClockSpineConfig(step_us=1_000_000),
         )
+
+
+def test_build_spine_clock_overlapping_windows_keep_earliest_symbol_id(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_dim_for_clock(silver_root)
+    # The dimension store rejects overlaps, so write the bad history directly.
+    dim = DeltaDimensionStore(silver_root=silver_root).load_dim_symbol()
+    write_deltalake(
+        str(table_path(silver_root=silver_root, table_name="dim_symbol")),
+        dim.with_columns(
+            pl.when(pl.col("symbol_id") == 1002)
+            .then(pl.lit(60, dtype=pl.Int64))
+            .otherwise(pl.col("valid_from_ts_us"))
+            .alias("valid_from_ts_us")
+        ).to_arrow(),
+        mode="overwrite",
+    )
+
+    out = build_spine(
+        silver_root=silver_root,
+        exchange="binance-futures",
+        symbol="BTCUSDT",
+        start=0,
+        end=200,
+        builder="clock",
+        config=ClockSpineConfig(step_us=50),
+    )
+
+    assert out["ts_spine_us"].to_list() == [50, 100, 150, 200]
+    assert out["symbol_id"].to_list() == [1001, 1001, 1002, 1002]
+
+
+def test_build_spine_clock_materialized_days_follow_dim_changes(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed_dim_for_clock(silver_root)
+    day_us = 86_400_000_000
+    kwargs = {
+        "silver_root": silver_root,
+        "exchange": "binance-futures",
+        "symbol": "BTCUSDT",
+        "start": 0,
+        "end": 2 * day_us,
+        "builder": "clock",
+        "config": ClockSpineConfig(step_us=3_600_000_000),
+    }
+
+    first = build_spine(**kwargs, materialize=True)
+    assert first.equals(build_spine(**kwargs))
+    assert first.height == 48
+    # max_rows is not part of the stored config: a different limit reuses the days.
+    assert build_spine(
+        **{**kwargs, "config": ClockSpineConfig(step_us=3_600_000_000, max_rows=48)},
+        materialize=True,
+    ).equals(first)
+
+    # Move the second listing into day 2: both affected days are rebuilt from the new windows.
+    dim = DeltaDimensionStore(silver_root=silver_root).load_dim_symbol()
+    relisted = dim.with_columns(
+        pl.when(pl.col("symbol_id") == 1002)
+        .then(pl.lit(day_us + 7_200_000_000))
+        .otherwise(pl.col("valid_from_ts_us"))
+        .alias("valid_from_ts_us")
+    )
+    write_deltalake(
+        str(table_path(silver_root=silver_root, table_name="dim_symbol")),
+        relisted.to_arrow(),
+        mode="overwrite",
+    )
+    rebuilt = build_spine(**kwargs, materialize=True)
+    assert rebuilt.equals(build_spine(**kwargs))
+    assert rebuilt["ts_spine_us"].min() == day_us + 3_600_000_000 * 3
+
+
+def test_build_spine_union_clock_shares_one_timeline(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    max_until = 2**63 - 1
+    dim = pl.DataFrame(
+        {
+            "symbol_id": [1001, 2001],
+            "exchange": ["binance-futures", "okx"],
+            "exchange_symbol": ["BTCUSDT", "BTC-USDT-SWAP"],
+            "canonical_symbol": ["BTCUSDT", "BTCUSDT"],
+            "market_type": ["perpetual", "perpetual"],
+            "base_asset": ["BTC", "BTC"],
+            "quote_asset": ["USDT", "USDT"],
+            "valid_from_ts_us": [0, 100],
+            "valid_until_ts_us": [max_until, max_until],
+            "is_current": [True, True],
+            "tick_size": [100, 100],
+            "lot_size": [1_000, 1_000],
+            "contract_size": [None, None],
+            "updated_at_ts_us": [0, 0],
+        },
+        schema=DIM_SYMBOL.to_polars(),
+    )
+    DeltaDimensionStore(silver_root=silver_root).save_dim_symbol(dim)
+    kwargs = {
+        "silver_root": silver_root,
+        "exchange": ["okx", "binance-futures"],
+        "symbol": [("binance-futures", "BTCUSDT"), ("okx", "BTC-USDT-SWAP")],
+        "start": 0,
+        "end": 200,
+        "builder": "clock",
+        "config": ClockSpineConfig(step_us=50),
+    }
+
+    per_instrument = build_spine(**kwargs)
+    assert per_instrument.select("exchange", "ts_spine_us").rows() == [
+        ("binance-futures", 50),
+        ("binance-futures", 100),
+        ("binance-futures", 150),
+        ("binance-futures", 200),
+        ("okx", 150),
+        ("okx", 200),
+    ]
+
+    union = build_spine(**kwargs, union=True)
+    assert union.columns == ["exchange", "symbol", "symbol_id", "ts_spine_us"]
+    assert union.filter(pl.col("exchange") == "okx").select("symbol_id", "ts_spine_us").rows() == [
+        (None, 50),
+        (None, 100),
+        (2001, 150),
+        (2001, 200),
+    ]
+    assert union.filter(pl.col("exchange") == "binance-futures").equals(
+        per_instrument.filter(pl.col("exchange") == "binance-futures")
+    )
+
+    with pytest.raises(ValueError, match="union=True requires the clock builder"):
+        build_spine(**{**kwargs, "builder": "trades"}, union=True)
@@ -12,13 +12,16 @@ from pointline.storage.contracts import (
     ManifestStore,
     QuarantineStore,
 )
-from pointline.storage.models import ManifestIdentity
+from pointline.storage.models import ManifestIdentity, ManifestStatusUpdate
 
 
 class _ManifestImpl:
     def resolve_file_id(self, meta: BronzeFileMetadata) -> int:
         return 1
 
+    def resolve_file_ids(self, metas: list[BronzeFileMetadata]) -> list[int]:
+        return [1 for _ in metas]
+
     def filter_pending(self, candidates: list[BronzeFileMetadata]) -> list[BronzeFileMetadata]:
         return candidates
 
@@ -31,6 +34,9 @@ class _ManifestImpl:
     ) -> None:
         return None
 
+    def update_statuses(self, updates: list[ManifestStatusUpdate]) -> None:
+        return None
+
 
 class _EventImpl:
     def append(self, table_name: str, df: pl.DataFrame) -> None:
@@ -51,3 +51,16 @@ def test_event_store_rejects_wrong_schema(tmp_path: Path) -> None:
         assert "missing columns" in str(exc)
     else:
         raise AssertionError("Expected schema validation failure")
+
+
+def test_event_store_writes_rows_in_tie_break_order(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    store = DeltaEventStore(silver_root=silver_root)
+
+    store.append(
+        "trades",
+        pl.concat([_trades_row(file_seq=3), _trades_row(file_seq=1), _trades_row(file_seq=2)]),
+    )
+
+    df = pl.read_delta(str(silver_root / "trades"))
+    assert df["file_seq"].to_list() == [1, 2, 3]
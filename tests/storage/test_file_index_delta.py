@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import polars as pl
+import pytest
+from deltalake import DeltaTable
+
+from pointline.research import query as query_module
+from pointline.research.query import load_events
+from pointline.schemas.events import TRADES
+from pointline.storage.delta.event_store import DeltaEventStore
+from pointline.storage.delta.file_index import DeltaFileIndex, latest_delta_version
+
+_BOUNDS = {"sse": (date(2024, 1, 2), date(2024, 1, 2))}
+# 2024-01-02 10:00 Asia/Shanghai; test timestamps are offsets from here.
+_BASE_US = int(datetime(2024, 1, 2, 2, 0, tzinfo=timezone.utc).timestamp()) * 1_000_000
+
+
+def _trades(symbol: str, *, symbol_id: int, ts_event_us: list[int], file_id: int) -> pl.DataFrame:
+    n = len(ts_event_us)
+    ts_event_us = [_BASE_US + ts for ts in ts_event_us]
+    return pl.DataFrame(
+        {
+            "exchange": ["sse"] * n,
+            "trading_date": [date(2024, 1, 2)] * n,
+            "symbol": [symbol] * n,
+            "symbol_id": [symbol_id] * n,
+            "ts_event_us": ts_event_us,
+            "ts_local_us": ts_event_us,
+            "file_id": [file_id] * n,
+            "file_seq": list(range(1, n + 1)),
+            "trade_id": [None] * n,
+            "side": ["buy"] * n,
+            "is_buyer_maker": [False] * n,
+            "price": [10_000_000_000] * n,
+            "qty": [100_000_000_000] * n,
+        },
+        schema=TRADES.to_polars(),
+    )
+
+
+def _seed(silver_root: Path) -> None:
+    store = DeltaEventStore(silver_root=silver_root)
+    store.append("trades", _trades("600000", symbol_id=1, ts_event_us=[100, 200], file_id=1))
+    store.append("trades", _trades("600001", symbol_id=2, ts_event_us=[150], file_id=2))
+    store.append("trades", _trades("600002", symbol_id=3, ts_event_us=[900], file_id=3))
+
+
+def test_file_index_records_per_file_stats_and_refreshes(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed(silver_root)
+    index_store = DeltaFileIndex(silver_root=silver_root)
+
+    index = index_store.load("trades")
+    assert index is not None
+    assert (silver_root / "_indexes" / "trades" / "file_index.parquet").exists()
+    assert index["table_version"].unique().to_list() == [
+        latest_delta_version(silver_root / "trades")
+    ]
+    assert index.sort("symbol_min").select(
+        "symbol_min",
+        "symbol_max",
+        "symbol_id_min",
+        pl.col("ts_min_us") - _BASE_US,
+        pl.col("ts_max_us") - _BASE_US,
+    ).rows() == [
+        ("600000", "600000", 1, 100, 200),
+        ("600001", "600001", 2, 150, 150),
+        ("600002", "600002", 3, 900, 900),
+    ]
+
+    DeltaEventStore(silver_root=silver_root).append(
+        "trades", _trades("600000", symbol_id=1, ts_event_us=[300], file_id=4)
+    )
+    refreshed = index_store.load("trades")
+    assert refreshed is not None
+    assert refreshed.height == 4
+
+    assert index_store.load("quotes") is None
+    with pytest.raises(ValueError, match="event tables"):
+        index_store.refresh("dim_symbol")
+
+
+def test_file_index_keeps_version_of_empty_table_and_tolerates_read_only_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    silver_root = tmp_path / "silver"
+    _seed(silver_root)
+    DeltaTable(str(silver_root / "trades")).delete()
+    index_store = DeltaFileIndex(silver_root=silver_root)
+
+    index = index_store.load("trades")
+    assert index is not None
+    assert index.is_empty()
+
+    # An empty index at the latest version is reused rather than rebuilt on every read.
+    def _no_refresh(table_name: str) -> None:
+        raise AssertionError(f"unexpected refresh of {table_name}")
+
+    monkeypatch.setattr(index_store, "refresh", _no_refresh)
+    reused = index_store.load("trades")
+    assert reused is not None
+    assert reused.is_empty()
+
+    # An index root that cannot be written falls back to an in-memory index.
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    _seed(tmp_path / "other")
+    read_only = DeltaFileIndex(silver_root=tmp_path / "other", index_root=blocker / "_indexes")
+    in_memory = read_only.load("trades")
+    assert in_memory is not None
+    assert in_memory.height == 3
+    assert not (blocker / "_indexes").exists()
+
+
+def test_candidate_files_prunes_by_symbol_and_time(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed(silver_root)
+    index_store = DeltaFileIndex(silver_root=silver_root)
+
+    def symbols_for(symbols: list[str], start: int, end: int) -> list[str]:
+        files = index_store.candidate_files(
+            "trades",
+            date_bounds=_BOUNDS,
+            symbols=symbols,
+            start_ts_us=_BASE_US + start,
+            end_ts_us=_BASE_US + end,
+        )
+        assert files is not None
+        return sorted(files["symbol_min"].to_list())
+
+    assert symbols_for(["600001"], 0, 1_000) == ["600001"]
+    assert symbols_for(["600000", "600002"], 0, 1_000) == ["600000", "600002"]
+    assert symbols_for(["600000", "600002"], 0, 500) == ["600000"]
+    assert symbols_for(["600003"], 0, 1_000) == []
+
+    other_date = index_store.candidate_files(
+        "trades",
+        date_bounds={"sse": (date(2024, 1, 3), date(2024, 1, 3))},
+        symbols=["600000"],
+        start_ts_us=_BASE_US,
+        end_ts_us=_BASE_US + 1_000,
+    )
+    assert other_date is not None
+    assert other_date.is_empty()
+
+
+def test_load_events_opens_only_candidate_files(tmp_path: Path) -> None:
+    silver_root = tmp_path / "silver"
+    _seed(silver_root)
+    index = DeltaFileIndex(silver_root=silver_root).load("trades")
+    assert index is not None
+
+    # Remove the other symbols' data files: a reader that opened them would fail.
+    for path in index.filter(pl.col("symbol_min") != "600000")["path"].to_list():
+        (silver_root / "trades" / path).unlink()
+
+    out = load_events(
+        silver_root=silver_root,
+        table="trades",
+        exchange="sse",
+        symbol="600000",
+        start=_BASE_US,
+        end=_BASE_US + 1_000,
+    )
+    assert (out["ts_event_us"] - _BASE_US).to_list() == [100, 200]
+
+
+def test_load_events_skips_sort_for_pre_ordered_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    silver_root = tmp_path / "silver"
+    _seed(silver_root)
+    checks: list[bool] = []
+    is_sorted_by = query_module._is_sorted_by
+
+    def recording_is_sorted_by(df: pl.DataFrame, columns: list[str]) -> bool:
+        checks.append(is_sorted_by(df, columns))
+        return checks[-1]
+
+    monkeypatch.setattr(query_module, "_is_sorted_by", recording_is_sorted_by)
+
+    out = load_events(
+        silver_root=silver_root,
+        table="trades",
+        exchange="sse",
+        symbol=["600002", "600001", "600000"],
+        start=_BASE_US,
+        end=_BASE_US + 1_000,
+        include_lineage=True,
+    )
+
+    assert checks == [True]
+    assert out.equals(out.sort(list(TRADES.tie_break_keys)))
+    assert out["symbol_id"].to_list() == [1, 1, 2, 3]
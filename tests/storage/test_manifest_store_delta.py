@@ -4,17 +4,25 @@ from datetime import date
 from pathlib import Path
 
 import polars as pl
+import pytest
+from deltalake import DeltaTable, write_deltalake
 
 from pointline.ingestion.models import IngestionResult
 from pointline.protocols import BronzeFileMetadata
+from pointline.schemas.control import INGEST_MANIFEST
 from pointline.storage.delta.manifest_store import DeltaManifestStore
+from pointline.storage.models import ManifestStatusUpdate
 
 
-def _meta(*, sha256: str = "a" * 64) -> BronzeFileMetadata:
+def _meta(
+    *,
+    sha256: str = "a" * 64,
+    bronze_file_path: str = "exchange=binance-futures/type=trades/date=2024-01-01/file.csv.gz",
+) -> BronzeFileMetadata:
     return BronzeFileMetadata(
         vendor="tardis",
         data_type="trades",
-        bronze_file_path="exchange=binance-futures/type=trades/date=2024-01-01/file.csv.gz",
+        bronze_file_path=bronze_file_path,
         file_size_bytes=100,
         last_modified_ts=1000,
         sha256=sha256,
@@ -85,3 +93,109 @@ def test_manifest_store_only_success_is_skippable(tmp_path: Path) -> None:
     assert df.height == 1
     assert df.item(0, "status") == "failed"
     assert df.item(0, "status_reason") == "parser_error"
+
+
+def test_manifest_store_resolve_file_ids_allocates_contiguous_block(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "silver" / "ingest_manifest"
+    store = DeltaManifestStore(manifest_path)
+    first = _meta(bronze_file_path="a.csv.gz")
+    second = _meta(bronze_file_path="b.csv.gz")
+    third = _meta(bronze_file_path="c.csv.gz")
+
+    assert store.resolve_file_id(first) == 1
+    versions_before = len(list((manifest_path / "_delta_log").glob("*.json")))
+
+    file_ids = store.resolve_file_ids([second, first, third, second])
+    assert file_ids == [2, 1, 3, 2]
+    versions_after = len(list((manifest_path / "_delta_log").glob("*.json")))
+    assert versions_after == versions_before + 1
+
+    assert store.resolve_file_ids([third, first]) == [3, 1]
+    assert store.resolve_file_ids([]) == []
+
+    df = _load(manifest_path).sort("file_id")
+    assert df["file_id"].to_list() == [1, 2, 3]
+    assert df["status"].to_list() == ["pending", "pending", "pending"]
+    assert df["bronze_path"].to_list() == ["a.csv.gz", "b.csv.gz", "c.csv.gz"]
+
+
+def test_manifest_store_update_statuses_matches_sequential_updates(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "silver" / "ingest_manifest"
+    store = DeltaManifestStore(manifest_path)
+    ok_meta = _meta(bronze_file_path="ok.csv.gz")
+    bad_meta = _meta(bronze_file_path="bad.csv.gz")
+    ok_id, bad_id = store.resolve_file_ids([ok_meta, bad_meta])
+
+    ok_result = IngestionResult(
+        status="success",
+        row_count=5,
+        rows_written=5,
+        rows_quarantined=0,
+        file_id=ok_id,
+        trading_date_min=date(2024, 1, 1),
+        trading_date_max=date(2024, 1, 1),
+    )
+    store.update_statuses(
+        [
+            ManifestStatusUpdate(ok_id, "failed", ok_meta),
+            ManifestStatusUpdate(ok_id, "success", ok_meta, ok_result),
+            ManifestStatusUpdate(bad_id, "failed", bad_meta),
+        ]
+    )
+
+    assert store.filter_pending([ok_meta, bad_meta]) == [bad_meta]
+
+    df = _load(manifest_path).sort("file_id")
+    assert df.height == 2
+    assert df["status"].to_list() == ["success", "failed"]
+    assert df["rows_written"].to_list() == [5, None]
+    assert df["status_reason"].to_list() == [None, "unknown_error"]
+    assert df["created_at_ts_us"].null_count() == 0
+
+
+def test_manifest_store_update_statuses_rejects_unknown_status(tmp_path: Path) -> None:
+    store = DeltaManifestStore(tmp_path / "silver" / "ingest_manifest")
+    meta = _meta()
+    file_id = store.resolve_file_id(meta)
+
+    with pytest.raises(ValueError, match="Unsupported ingest status"):
+        store.update_statuses([ManifestStatusUpdate(file_id, "done", meta)])
+
+
+def test_manifest_store_partitions_by_vendor_and_data_type(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "silver" / "ingest_manifest"
+    store = DeltaManifestStore(manifest_path)
+    meta = _meta()
+
+    file_id = store.resolve_file_id(meta)
+    created_at = _load(manifest_path).item(0, "created_at_ts_us")
+    store.update_status(file_id, "failed", meta)
+    store.update_status(file_id, "success", meta)
+
+    assert DeltaTable(str(manifest_path)).metadata().partition_columns == ["vendor", "data_type"]
+    assert (manifest_path / "vendor=tardis" / "data_type=trades").is_dir()
+
+    df = _load(manifest_path)
+    assert df.height == 1
+    assert df.item(0, "status") == "success"
+    assert df.item(0, "created_at_ts_us") == created_at
+    assert store.filter_pending([meta]) == []
+
+
+def test_manifest_store_keeps_legacy_unpartitioned_layout(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "silver" / "ingest_manifest"
+    write_deltalake(
+        str(manifest_path),
+        pl.DataFrame(schema=INGEST_MANIFEST.to_polars()).to_arrow(),
+        mode="overwrite",
+    )
+    store = DeltaManifestStore(manifest_path)
+    first = _meta(bronze_file_path="a.csv.gz")
+    second = _meta(bronze_file_path="b.csv.gz")
+
+    first_id, second_id = store.resolve_file_ids([first, second])
+    store.update_status(first_id, "success", first)
+
+    assert DeltaTable(str(manifest_path)).metadata().partition_columns == []
+    assert store.filter_pending([first, second]) == [second]
+    assert store.resolve_file_id(second) == second_id
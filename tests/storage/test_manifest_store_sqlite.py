@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from pointline.ingestion.models import IngestionResult
+from pointline.protocols import BronzeFileMetadata
+from pointline.storage.contracts import ManifestStore
+from pointline.storage.delta.manifest_store import DeltaManifestStore
+from pointline.storage.models import ManifestStatusUpdate
+from pointline.storage.sqlite import SqliteManifestStore
+
+
+def _meta(
+    *,
+    sha256: str = "a" * 64,
+    bronze_file_path: str = "exchange=binance-futures/type=trades/date=2024-01-01/file.csv.gz",
+) -> BronzeFileMetadata:
+    return BronzeFileMetadata(
+        vendor="tardis",
+        data_type="trades",
+        bronze_file_path=bronze_file_path,
+        file_size_bytes=100,
+        last_modified_ts=1000,
+        sha256=sha256,
+        date=date(2024, 1, 1),
+    )
+
+
+def _success(file_id: int) -> IngestionResult:
+    return IngestionResult(
+        status="success",
+        row_count=10,
+        rows_written=8,
+        rows_quarantined=2,
+        file_id=file_id,
+        trading_date_min=date(2024, 1, 1),
+        trading_date_max=date(2024, 1, 2),
+    )
+
+
+def test_sqlite_manifest_store_satisfies_contract(tmp_path: Path) -> None:
+    assert isinstance(SqliteManifestStore(tmp_path / "manifest.sqlite"), ManifestStore)
+
+
+def test_sqlite_manifest_store_uses_wal_and_identity_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "manifest.sqlite"
+    SqliteManifestStore(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        index_columns = [
+            row[2] for row in conn.execute("PRAGMA index_info(ingest_manifest_identity)")
+        ]
+    finally:
+        conn.close()
+    assert index_columns == ["vendor", "data_type", "bronze_path", "file_hash"]
+
+
+def test_sqlite_manifest_store_resolve_and_skip_semantics(tmp_path: Path) -> None:
+    store = SqliteManifestStore(tmp_path / "manifest.sqlite")
+    meta = _meta()
+    failed_meta = _meta(sha256="b" * 64)
+
+    assert store.filter_pending([meta, failed_meta]) == [meta, failed_meta]
+    assert store.resolve_file_ids([meta, failed_meta, meta]) == [1, 2, 1]
+    assert store.resolve_file_id(meta) == 1
+
+    store.update_status(1, "success", meta, _success(1))
+    store.update_status(2, "failed", failed_meta)
+
+    assert store.filter_pending([meta, failed_meta]) == [failed_meta]
+
+    df = store.read()
+    assert df["file_id"].to_list() == [1, 2]
+    assert df["status"].to_list() == ["success", "failed"]
+    assert df["status_reason"].to_list() == [None, "unknown_error"]
+    assert df.item(0, "trading_date_max") == date(2024, 1, 2)
+    assert df["created_at_ts_us"].null_count() == 0
+
+
+def test_sqlite_manifest_store_update_statuses_preserves_created_at(tmp_path: Path) -> None:
+    store = SqliteManifestStore(tmp_path / "manifest.sqlite")
+    meta = _meta()
+    file_id = store.resolve_file_id(meta)
+    created_at = store.read().item(0, "created_at_ts_us")
+
+    store.update_statuses(
+        [
+            ManifestStatusUpdate(file_id, "failed", meta),
+            ManifestStatusUpdate(file_id, "success", meta, _success(file_id)),
+        ]
+    )
+
+    df = store.read()
+    assert df.height == 1
+    assert df.item(0, "status") == "success"
+    assert df.item(0, "created_at_ts_us") == created_at
+
+    with pytest.raises(ValueError, match="Unsupported ingest status"):
+        store.update_statuses([ManifestStatusUpdate(file_id, "done", meta)])
+
+
+def test_sqlite_manifest_store_migrates_from_and_exports_to_delta(tmp_path: Path) -> None:
+    delta_path = tmp_path / "silver" / "ingest_manifest"
+    delta_store = DeltaManifestStore(delta_path)
+    first = _meta(bronze_file_path="a.csv.gz")
+    second = _meta(bronze_file_path="b.csv.gz")
+    first_id, second_id = delta_store.resolve_file_ids([first, second])
+    delta_store.update_status(first_id, "success", first, _success(first_id))
+
+    store = SqliteManifestStore(tmp_path / "manifest.sqlite")
+    assert store.import_from_delta(delta_path) == 2
+    assert store.filter_pending([first, second]) == [second]
+    assert store.resolve_file_id(second) == second_id
+    assert store.resolve_file_id(_meta(bronze_file_path="c.csv.gz")) == 3
+
+    store.update_status(second_id, "success", second, _success(second_id))
+    assert store.export_to_delta(delta_path) == 3
+
+    exported = pl.read_delta(str(delta_path)).sort("file_id")
+    assert exported["file_id"].to_list() == [1, 2, 3]
+    assert exported["status"].to_list() == ["success", "success", "pending"]
+    assert delta_store.filter_pending([first, second]) == []
@@ -510,6 +510,37 @@ class TestManifestDiff:
         assert "No files found" in capsys.readouterr().out
 
 
+class TestManifestSqlite:
+    def test_migrate_and_sync_round_trip(self, tmp_path, capsys):
+        from datetime import date
+
+        from pointline.protocols import BronzeFileMetadata
+        from pointline.storage.delta import DeltaManifestStore
+
+        meta = BronzeFileMetadata(
+            vendor="tardis",
+            data_type="trades",
+            bronze_file_path="a.csv.gz",
+            file_size_bytes=1,
+            last_modified_ts=1,
+            sha256="a" * 64,
+            date=date(2024, 1, 1),
+        )
+        DeltaManifestStore(tmp_path / "ingest_manifest").resolve_file_id(meta)
+
+        assert main(["manifest", "migrate-sqlite", "--silver-root", str(tmp_path)]) == 0
+        assert "Migrated 1 manifest rows" in capsys.readouterr().out
+        assert (tmp_path / "ingest_manifest.sqlite").exists()
+
+        assert main(["manifest", "sync-delta", "--silver-root", str(tmp_path)]) == 0
+        assert "Exported 1 manifest rows" in capsys.readouterr().out
+
+    def test_sync_missing_sqlite(self, tmp_path, capsys):
+        result = main(["manifest", "sync-delta", "--silver-root", str(tmp_path)])
+        assert result == 1
+        assert "does not exist" in capsys.readouterr().out
+
+
 # ---------------------------------------------------------------------------
 # discover (error paths)
 # ---------------------------------------------------------------------------
@@ -8,6 +8,7 @@ from zoneinfo import ZoneInfo
 import polars as pl
 
 from pointline.ingestion.pipeline import ingest_file
+from pointline.ingestion.pit import PitIndex
 from pointline.protocols import BronzeFileMetadata
 
 
@@ -124,6 +125,55 @@ def test_ingest_file_success_derives_partition_assigns_lineage_and_writes() -> N
     assert written["symbol_id"][0] == 42
 
 
+def test_ingest_file_accepts_compiled_pit_index() -> None:
+    manifest = FakeManifestRepo()
+    writer = CapturingWriter()
+    event_ts = _ts_us(datetime(2024, 9, 30, 2, 0, tzinfo=ZoneInfo("UTC")))
+
+    def parser(_meta: BronzeFileMetadata) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "exchange": ["szse", "szse"],
+                "symbol": ["000001.SZ", "000002.SZ"],
+                "ts_event_us": [event_ts, event_ts],
+                "ts_local_us": [event_ts, event_ts],
+                "side": ["buy", "sell"],
+                "is_buyer_maker": [False, True],
+                "price": [123_450_000, 123_450_000],
+                "qty": [100_000_000, 100_000_000],
+            }
+        )
+
+    dim_symbol = pl.DataFrame(
+        {
+            "exchange": ["szse", "sse"],
+            "exchange_symbol": ["000001.SZ", "600000.SH"],
+            "symbol_id": [42, 43],
+            "valid_from_ts_us": [event_ts - 1, event_ts - 1],
+            "valid_until_ts_us": [event_ts + 1, event_ts + 1],
+        }
+    )
+    pit_index = PitIndex.for_trading_dates(
+        dim_symbol,
+        exchanges=["szse"],
+        start_date=date(2024, 9, 30),
+        end_date=date(2024, 9, 30),
+    )
+
+    result = ingest_file(
+        _meta(),
+        parser=parser,
+        manifest_repo=manifest,
+        writer=writer,
+        dim_symbol_df=pit_index,
+    )
+
+    assert result.status == "success"
+    assert result.rows_written == 1
+    assert result.rows_quarantined == 1
+    assert writer.calls[0][1]["symbol_id"].to_list() == [42]
+
+
 def test_ingest_file_quarantines_when_pit_coverage_missing() -> None:
     manifest = FakeManifestRepo()
     writer = CapturingWriter()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+from pointline.ingestion.pit import PitIndex, check_pit_coverage
+
+_DAY_US = 86_400_000_000
+_2024_01_01_US = 1_704_067_200_000_000
+
+
+def _dim_symbol() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "exchange": ["binance-futures", "binance-futures", "binance-futures", "okx"],
+            "exchange_symbol": ["BTCUSDT", "BTCUSDT", "ETHUSDT", "BTC-USDT"],
+            "symbol_id": [1, 2, 3, 4],
+            "valid_from_ts_us": [0, 200, 0, 0],
+            "valid_until_ts_us": [200, 10**18, 10**18, 10**18],
+        }
+    )
+
+
+def _events() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 5 + ["okx"],
+            "symbol": ["BTCUSDT", "ETHUSDT", "BTCUSDT", "XRPUSDT", "BTCUSDT", "BTC-USDT"],
+            "ts_event_us": [250, 10, 100, 50, 199, 300],
+            "file_seq": [1, 2, 3, 4, 5, 6],
+        }
+    )
+
+
+def test_pit_index_matches_raw_dim_symbol_resolution() -> None:
+    events = _events()
+    dim = _dim_symbol()
+
+    expected_valid, expected_quarantined, expected_reason = check_pit_coverage(events, dim)
+    valid, quarantined, reason = check_pit_coverage(events, PitIndex.build(dim))
+
+    assert reason == expected_reason == "missing_pit_symbol_coverage"
+    assert valid.to_dicts() == expected_valid.to_dicts()
+    assert quarantined.to_dicts() == expected_quarantined.to_dicts()
+    assert valid["symbol_id"].to_list() == [2, 3, 1, 1, 4]
+    assert quarantined["symbol"].to_list() == ["XRPUSDT"]
+
+
+def test_pit_index_build_filters_exchanges_and_time_range() -> None:
+    index = PitIndex.build(
+        _dim_symbol(),
+        exchanges=["binance-futures"],
+        start_ts_us=200,
+        end_ts_us=300,
+    )
+
+    assert sorted(index.windows["symbol_id"].to_list()) == [2, 3]
+    assert index.keys.height == 2
+    assert index.keys.schema["_pit_key"] == pl.UInt32
+
+
+def test_pit_index_for_trading_dates_keeps_windows_touching_the_batch() -> None:
+    dim = pl.DataFrame(
+        {
+            "exchange": ["szse", "szse", "szse"],
+            "exchange_symbol": ["000001", "000001", "000001"],
+            "symbol_id": [1, 2, 3],
+            "valid_from_ts_us": [0, _2024_01_01_US, _2024_01_01_US + 30 * _DAY_US],
+            "valid_until_ts_us": [
+                _2024_01_01_US,
+                _2024_01_01_US + 30 * _DAY_US,
+                10**18,
+            ],
+        }
+    )
+
+    index = PitIndex.for_trading_dates(
+        dim,
+        exchanges=["szse"],
+        start_date=date(2024, 1, 10),
+        end_date=date(2024, 1, 12),
+    )
+
+    assert index.windows["symbol_id"].to_list() == [2]
+
+
+def test_pit_index_empty_quarantines_everything() -> None:
+    events = _events()
+    index = PitIndex.build(_dim_symbol(), exchanges=["deribit"])
+
+    valid, quarantined, reason = check_pit_coverage(events, index)
+
+    assert index.is_empty
+    assert valid.is_empty()
+    assert "symbol_id" in valid.columns
+    assert quarantined.height == events.height
+    assert reason == "missing_pit_symbol_coverage"
+
+
+def test_pit_index_rejects_overlapping_windows() -> None:
+    dim = _dim_symbol().with_columns(
+        pl.when(pl.col("symbol_id") == 1)
+        .then(pl.lit(250))
+        .otherwise(pl.col("valid_until_ts_us"))
+        .alias("valid_until_ts_us")
+    )
+
+    with pytest.raises(ValueError, match="overlapping validity windows"):
+        PitIndex.build(dim)
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_single_symbol_file_inside_one_window_gets_literal_symbol_id(use_index: bool) -> None:
+    events = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 3,
+            "symbol": ["BTCUSDT"] * 3,
+            "ts_event_us": [220, 210, 400],
+            "file_seq": [1, 2, 3],
+        }
+    )
+    dim = _dim_symbol()
+
+    valid, quarantined, reason = check_pit_coverage(
+        events, PitIndex.build(dim) if use_index else dim
+    )
+
+    assert reason is None
+    assert quarantined.is_empty()
+    assert valid.columns == [*events.columns, "symbol_id"]
+    assert valid.schema["symbol_id"] == pl.Int64
+    assert valid["file_seq"].to_list() == [1, 2, 3]
+    assert valid["symbol_id"].to_list() == [2, 2, 2]
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_single_symbol_file_straddling_windows_falls_back_to_row_join(use_index: bool) -> None:
+    events = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 4,
+            "symbol": ["BTCUSDT"] * 4,
+            "ts_event_us": [150, 199, 200, None],
+            "file_seq": [1, 2, 3, 4],
+        }
+    )
+    dim = _dim_symbol()
+
+    valid, quarantined, reason = check_pit_coverage(
+        events, PitIndex.build(dim) if use_index else dim
+    )
+
+    assert reason == "missing_pit_symbol_coverage"
+    assert valid["symbol_id"].to_list() == [1, 1, 2]
+    assert quarantined["file_seq"].to_list() == [4]
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_windows_without_symbol_id_quarantine_rows(use_index: bool) -> None:
+    events = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"] * 2,
+            "symbol": ["BTCUSDT"] * 2,
+            "ts_event_us": [10, 20],
+            "file_seq": [1, 2],
+        }
+    )
+    dim = pl.DataFrame(
+        {
+            "exchange": ["binance-futures"],
+            "exchange_symbol": ["BTCUSDT"],
+            "symbol_id": [None],
+            "valid_from_ts_us": [0],
+            "valid_until_ts_us": [10**18],
+        },
+        schema_overrides={"symbol_id": pl.Int64},
+    )
+
+    valid, quarantined, reason = check_pit_coverage(
+        events, PitIndex.build(dim) if use_index else dim
+    )
+
+    assert reason == "missing_pit_symbol_coverage"
+    assert valid.is_empty()
+    assert quarantined["file_seq"].to_list() == [1, 2]